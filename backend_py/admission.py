@@ -0,0 +1,258 @@
+"""Admission control: per-endpoint and per-budget concurrency limits with bounded wait queues."""
+
+import asyncio
+import logging
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Dict, List, Optional, Tuple
+
+from fastapi.responses import JSONResponse
+
+from .config import (
+    ADMISSION_BUDGETS,
+    ADMISSION_ENDPOINTS,
+    ADMISSION_EXEMPT_PATHS,
+    ADMISSION_QUEUE_TIMEOUT,
+    ADMISSION_RETRY_AFTER
+)
+from .metrics import get_metrics
+from .utils import create_error_response
+
+logger = logging.getLogger(__name__)
+
+
+class Overloaded(Exception):
+    """Raised when a limiter's wait queue is full or the wait timed out."""
+
+    def __init__(self, limiter: str, reason: str):
+        super().__init__(f"{limiter}: {reason}")
+        self.limiter = limiter
+        self.reason = reason
+
+
+class ConcurrencyLimiter:
+    """
+    At most `limit` holders at a time; up to `max_queue` more wait in FIFO order.
+
+    Waiters are plain futures created on the caller's running loop, so one
+    limiter works across event loops (e.g. several test clients).
+    """
+
+    def __init__(self, name: str, limit: int, max_queue: int):
+        """
+        Args:
+            name: Name used in errors and metrics
+            limit: Maximum concurrent holders
+            max_queue: Maximum number of waiting callers
+        """
+        self.name = name
+        self.limit = limit
+        self.max_queue = max_queue
+        self.active = 0
+        self._waiters: deque = deque()
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(self, timeout: Optional[float]) -> None:
+        """
+        Take a slot, waiting up to `timeout` seconds behind earlier callers.
+
+        Raises:
+            Overloaded: If the queue is full or no slot freed up in time
+        """
+        if self.active < self.limit and not self._waiters:
+            self.active += 1
+            return
+        if len(self._waiters) >= self.max_queue:
+            raise Overloaded(self.name, "queue full")
+
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        try:
+            await asyncio.wait_for(future, timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as e:
+            if future.done() and not future.cancelled():
+                # The slot was handed over just as the wait ended; pass it on
+                self.release()
+            else:
+                self._remove(future)
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            raise Overloaded(self.name, "queue timeout")
+
+    def release(self) -> None:
+        """Give the slot to the next waiter, or free it."""
+        while self._waiters:
+            future = self._waiters.popleft()
+            if not future.done():
+                future.set_result(None)  # The slot moves to the waiter; active is unchanged
+                return
+        self.active -= 1
+
+    def _remove(self, future: asyncio.Future) -> None:
+        try:
+            self._waiters.remove(future)
+        except ValueError:
+            pass
+
+
+class AdmissionController:
+    """Maps request paths to the limiters they must pass: their endpoint's, then their budget's."""
+
+    def __init__(
+        self,
+        budgets: Dict[str, Dict[str, int]] = ADMISSION_BUDGETS,
+        endpoints: Dict[str, Tuple[str, Optional[int]]] = ADMISSION_ENDPOINTS,
+        exempt_paths=ADMISSION_EXEMPT_PATHS
+    ):
+        """
+        Args:
+            budgets: Budget name -> {'concurrency', 'queue'}; the "default" budget covers
+                every other /api/ path
+            endpoints: Path (or prefix ending in "/") -> (budget name, per-endpoint
+                concurrency or None)
+            exempt_paths: Paths never limited (health checks, metrics)
+        """
+        self.budgets = {
+            name: ConcurrencyLimiter(f"budget:{name}", settings['concurrency'], settings['queue'])
+            for name, settings in budgets.items()
+        }
+        self.exempt_paths = set(exempt_paths)
+        self.endpoints: Dict[str, Tuple[str, Optional[ConcurrencyLimiter]]] = {}
+        for path, (budget, concurrency) in endpoints.items():
+            # An endpoint may queue as many requests as its budget
+            limiter = None if concurrency is None else ConcurrencyLimiter(
+                f"endpoint:{path}", concurrency, budgets[budget]['queue']
+            )
+            self.endpoints[path] = (budget, limiter)
+
+    def limiters_for(self, path: str) -> List[ConcurrencyLimiter]:
+        """Limiters a request to `path` must acquire, in order (empty when unlimited)."""
+        if path in self.exempt_paths or not path.startswith('/api/'):
+            return []
+        entry = self.endpoints.get(path)
+        if entry is None:
+            entry = next(
+                (value for prefix, value in self.endpoints.items() if prefix.endswith('/') and path.startswith(prefix)),
+                ('default', None)
+            )
+        budget, endpoint_limiter = entry
+        limiters = [] if endpoint_limiter is None else [endpoint_limiter]
+        if budget in self.budgets:
+            limiters.append(self.budgets[budget])
+        return limiters
+
+    async def admit(self, limiters: List[ConcurrencyLimiter], timeout: Optional[float]) -> None:
+        """
+        Acquire every limiter in order within one overall timeout.
+
+        Raises:
+            Overloaded: If any limiter rejects the request (nothing is left held)
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        acquired = []
+        try:
+            for limiter in limiters:
+                remaining = None if deadline is None else max(deadline - loop.time(), 0)
+                await limiter.acquire(remaining)
+                acquired.append(limiter)
+        except BaseException:
+            self.release(acquired)
+            raise
+
+    @staticmethod
+    def release(limiters: List[ConcurrencyLimiter]) -> None:
+        """Release limiters in reverse acquisition order."""
+        for limiter in reversed(limiters):
+            limiter.release()
+
+    @asynccontextmanager
+    async def budget_slot(self, budget: str):
+        """
+        Hold a slot of `budget` for the duration of the block.
+
+        For handlers that only need the budget for part of their work, such
+        as the one request of a coalesced group that runs the computation.
+
+        Raises:
+            Overloaded: If the budget rejects the caller
+        """
+        limiters = [self.budgets[budget]]
+        await self.admit(limiters, ADMISSION_QUEUE_TIMEOUT)
+        try:
+            yield
+        finally:
+            self.release(limiters)
+
+
+def overloaded_response(error: Overloaded, method: Optional[str], path: str) -> JSONResponse:
+    """
+    Log and count a rejected request and build its 429 response.
+
+    Args:
+        error: The limiter's rejection
+        method: HTTP method of the request
+        path: Request path
+
+    Returns:
+        429 JSONResponse with Retry-After
+    """
+    logger.warning("Rejected %s %s (%s)", method, path, error)
+    get_metrics().increment("admission_rejections_total", limiter=error.limiter, reason=error.reason)
+    return JSONResponse(
+        create_error_response(
+            error_code="OVERLOADED",
+            error_message="The server is busy; retry later"
+        ),
+        status_code=429,
+        headers={'Retry-After': str(ADMISSION_RETRY_AFTER)}
+    )
+
+
+class AdmissionMiddleware:
+    """
+    ASGI middleware that queues requests over their concurrency budget.
+
+    CPU-heavy NLP endpoints and light CRUD endpoints draw on separate
+    budgets (see ADMISSION_* in config), so a burst of screening requests
+    cannot starve the rest of the API. When a queue is full, or a request
+    waited ADMISSION_QUEUE_TIMEOUT seconds, it gets a 429 with Retry-After.
+    """
+
+    def __init__(self, app, controller: Optional[AdmissionController] = None):
+        self.app = app
+        self.controller = controller or get_admission_controller()
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            return await self.app(scope, receive, send)
+
+        limiters = self.controller.limiters_for(scope['path'])
+        if not limiters:
+            return await self.app(scope, receive, send)
+
+        try:
+            await self.controller.admit(limiters, ADMISSION_QUEUE_TIMEOUT)
+        except Overloaded as e:
+            response = overloaded_response(e, scope.get('method'), scope['path'])
+            return await response(scope, receive, send)
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.controller.release(limiters)
+
+
+# Global instance
+_admission_controller: AdmissionController = None
+
+
+def get_admission_controller() -> AdmissionController:
+    """Get or initialize global admission controller."""
+    global _admission_controller
+    if _admission_controller is None:
+        _admission_controller = AdmissionController()
+    return _admission_controller
@@ -1,21 +1,76 @@
 """FastAPI backend for Resume Screening System."""
 
-from fastapi import FastAPI, File, UploadFile, Form, HTTPException
+from fastapi import FastAPI, File, UploadFile, Form, HTTPException, Header, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
-from typing import List, Optional
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import StreamingResponse, FileResponse, PlainTextResponse
+from starlette.background import BackgroundTask
+from typing import List, Optional, Tuple
 from pydantic import BaseModel
 import logging
-from pymongo import MongoClient
-import numpy as np
+from pymongo import MongoClient, ReturnDocument
 from datetime import datetime
-import pandas as pd
-import io
+import os
+import json
+import tempfile
+import threading
+import time
 
-from .config import ALLOWED_EXTENSIONS
-from .resume_parser import extract_text_from_resume, clean_resume_text
+from .config import (
+    ALLOWED_EXTENSIONS,
+    PROFILE_TOKEN,
+    MONGODB_URI,
+    MONGODB_DB,
+    EXPORT_CHUNK_ROWS,
+    EXPLORE_PAGE_SIZE,
+    EXPLORE_MAX_PAGE_SIZE,
+    ENSURE_INDEXES_ON_STARTUP,
+    MATCH_RETRIEVAL_DEPTH,
+    INDEX_REFRESH_CHECK_SECONDS,
+    EMBEDDING_PRUNE_INTERVAL_SECONDS,
+    ARCHIVE_MAX_FILE_SIZE,
+    BATCH_SIZE,
+    EXTRACT_SKILLS_MAX_AGE,
+    EXTRACT_SKILLS_CACHE_SIZE,
+    GZIP_MINIMUM_SIZE,
+    GZIP_COMPRESS_LEVEL
+)
 from .nlp_processor import get_nlp_processor
 from .skill_matcher import CandidateScorer, SkillMatcher
+from .scoring_engine import ScoringEngine, SkillOverlap, select_page
+from .bm25_index import get_candidate_search_index
+from .index_refresh import IndexRefresher
+from .skill_index import get_skill_index
+from .skill_normalizer import canonicalize_skills, get_skill_normalizer
+from .embedding_index import get_embedding_index
+from .ingestion import ArchiveLimitError, ArchiveReader, FileTooLargeError, ingest_upload, is_archive
+from .dedup import (
+    NearDuplicateIndex,
+    content_hash,
+    get_candidate_index,
+    get_minhasher,
+    group_duplicates
+)
+from .metrics import get_metrics
+from .http_cache import LRUCache, compute_etag, not_modified
+from .responses import FastJSONResponse
+from .coalescing import SingleFlight
+from .admission import AdmissionMiddleware, Overloaded, get_admission_controller, overloaded_response
+from .executors import get_executors, run_blocking
+from .skills_database import SKILLS_LOWERCASE
+from .profiling import ProfilingMiddleware, get_profile_store, is_authorized
+from .logging_config import configure_logging, start_request_sampling, should_log_item
+from .jobs_catalog import get_jobs_catalog
+from .db_indexes import ensure_indexes
+from .db_writes import application_duplicate_key, upsert_application, retry_on_duplicate_key
+from .exporters import (
+    EXPORT_FORMATS,
+    format_export_row,
+    safe_export_filename,
+    write_xlsx,
+    write_parquet,
+    iter_csv
+)
 from .utils import (
     format_score_report,
     generate_summary_report,
@@ -26,7 +81,7 @@ from .utils import (
 )
 
 # Configure logging
-logging.basicConfig(level=logging.INFO)
+configure_logging()
 logger = logging.getLogger(__name__)
 
 # Initialize FastAPI app
@@ -64,6 +119,9 @@ class ApplyJobRequest(BaseModel):
     resumeText: str
     candidateSkills: Optional[List[str]] = None
 
+# Limit concurrent heavy requests; added first so CORS headers reach 429 responses too
+app.add_middleware(AdmissionMiddleware)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -73,38 +131,310 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large responses (ranked results, job lists) for clients that accept gzip
+app.add_middleware(GZipMiddleware, minimum_size=GZIP_MINIMUM_SIZE, compresslevel=GZIP_COMPRESS_LEVEL)
+
+# Opt-in request profiling; not installed at all unless a token is configured
+if PROFILE_TOKEN:
+    app.add_middleware(ProfilingMiddleware)
+
 
 @app.on_event("startup")
 async def startup_event():
     """Initialize NLP processor on startup."""
     logger.info("Initializing NLP processor...")
     get_nlp_processor()
+    get_skill_normalizer()
     logger.info("NLP processor initialized successfully")
+    
+    # Build the skill index and prune the embedding index off the request path
+    global _index_maintenance_thread
+    if _index_maintenance_thread is None or not _index_maintenance_thread.is_alive():
+        _index_maintenance_stop.clear()
+        _index_maintenance_thread = threading.Thread(target=_maintain_indexes, name='index-maintenance', daemon=True)
+        _index_maintenance_thread.start()
+    
+    if ENSURE_INDEXES_ON_STARTUP:
+        client = get_mongodb_client()
+        if client:
+            try:
+                ensure_indexes(client[MONGODB_DB])
+            except Exception as e:
+                logger.warning("Could not ensure MongoDB indexes: %s", e)
+            finally:
+                client.close()
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop the index maintenance thread and the blocking-work executors."""
+    _index_maintenance_stop.set()
+    get_executors().shutdown()
 
 
 def get_mongodb_client():
     """Get MongoDB client connection."""
     try:
-        client = MongoClient('mongodb://localhost:27017/', serverSelectionTimeoutMS=3000)
+        client = MongoClient(MONGODB_URI, serverSelectionTimeoutMS=3000)
         # Try to connect
         client.admin.command('ping')
         return client
     except Exception as e:
-        logger.error(f"MongoDB connection error: {str(e)}")
+        logger.error("MongoDB connection error: %s", e)
         return None
 
 
-@app.post("/api/match-candidates")
-async def match_candidates(request: MatchCandidatesRequest):
+# Candidate fields read by matching and by the BM25 index loader
+CANDIDATE_MATCH_PROJECTION = {
+    'name': 1,
+    'email': 1,
+    'skills': 1,
+    'experienceYears': 1,
+    'resumeText': 1,
+    'resume_text': 1
+}
+
+
+def _candidate_match_text(candidate: dict) -> str:
+    """Text a stored candidate is matched on: resume text, else their skill list."""
+    # Profiles saved by update-candidate store the text as resume_text
+    resume_text = candidate.get('resumeText') or candidate.get('resume_text', '')
+    if not resume_text and candidate.get('skills'):
+        resume_text = f"Skills: {', '.join(candidate.get('skills', []))}"
+    return resume_text
+
+
+def _job_match_text(job: dict) -> str:
+    """Text a job is matched on: its description, else its title and required skills."""
+    return job.get('description', '') or f"{job.get('title', '')} {' '.join(job.get('requiredSkills', []))}"
+
+
+def _candidate_skill_set(nlp, text: str, explicit_skills: Optional[List[str]] = None) -> set:
+    """Canonical skills extracted from text plus canonicalized explicitly listed skills."""
+    extracted = nlp.extract_skills(text).get('found_skills', []) if text else []
+    return {s.lower() for s in extracted} | set(canonicalize_skills(explicit_skills or []))
+
+
+_candidate_search_refresher = IndexRefresher("candidate BM25")
+
+
+def _candidate_search_index(candidates_collection):
+    """
+    The candidate BM25 index, loaded from the candidates collection on first use.
+    
+    It is rebuilt when candidates were written by other workers or the Node backend.
+    """
+    search_index = get_candidate_search_index()
+    _candidate_search_refresher.ensure_fresh(
+        candidates_collection,
+        search_index,
+        lambda: search_index.reload(
+            (candidate['email'], _candidate_match_text(candidate) or candidate.get('name', ''))
+            for candidate in candidates_collection.find({'email': {'$exists': True}}, CANDIDATE_MATCH_PROJECTION)
+        )
+    )
+    return search_index
+
+
+def _index_candidate(candidate: dict) -> None:
+    """
+    Refresh one candidate in the BM25 index (a no-op until the index is first loaded).
+    
+    Recently cached match results no longer reflect the pool, so they are dropped too.
+    """
+    _match_candidates_flight.clear()
+    search_index = get_candidate_search_index()
+    if search_index.loaded:
+        search_index.add(candidate['email'], _candidate_match_text(candidate) or candidate.get('name', ''))
+
+
+_skill_search_refresher = IndexRefresher("candidate skill")
+_index_maintenance_stop = threading.Event()
+_index_maintenance_thread: Optional[threading.Thread] = None
+
+
+def _refresh_skill_index(candidates_collection) -> None:
+    """Build the candidate skill index, or rebuild it if the candidates collection changed (blocking)."""
+    skill_index = get_skill_index()
+    
+    def rebuild():
+        nlp = get_nlp_processor()
+        # Profiles saved since the index existed carry canonicalSkills; older ones are extracted here
+        skill_index.reload(
+            (
+                candidate['email'],
+                candidate.get('canonicalSkills')
+                or _candidate_skill_set(nlp, _candidate_match_text(candidate), candidate.get('skills'))
+            )
+            for candidate in candidates_collection.find(
+                {'email': {'$exists': True}},
+                {**CANDIDATE_MATCH_PROJECTION, 'canonicalSkills': 1}
+            )
+        )
+    
+    _skill_search_refresher.ensure_fresh(candidates_collection, skill_index, rebuild)
+
+
+def _skill_search_index(candidates_collection):
+    """
+    The candidate skill index.
+    
+    It is built and kept fresh by a background thread (see _maintain_indexes).
+    A search that arrives before the first build finishes waits for that build.
+    """
+    skill_index = get_skill_index()
+    if not skill_index.loaded:
+        _refresh_skill_index(candidates_collection)
+    return skill_index
+
+
+def _prune_embedding_index(candidates_collection) -> None:
+    """
+    Drop stored embeddings that no current candidate or job text maps to (blocking).
+    
+    Skipped while the jobs API is unavailable, since the live job texts are unknown then.
+    """
+    snapshot = get_jobs_catalog().get_snapshot()
+    if snapshot['source'] != 'backend':
+        return
+    live_keys = {
+        content_hash(_candidate_match_text(candidate) or candidate.get('name', ''))
+        for candidate in candidates_collection.find({'email': {'$exists': True}}, CANDIDATE_MATCH_PROJECTION)
+    }
+    live_keys.update(content_hash(_job_match_text(job)) for job in snapshot['jobs'])
+    dropped = get_embedding_index().retain(live_keys)
+    if dropped:
+        logger.info("Dropped %d superseded embeddings from the embedding index", dropped)
+
+
+def _maintain_indexes() -> None:
+    """
+    Background thread: keep the skill index fresh and the embedding index pruned.
+    
+    The skill index is built first, then rebuilt whenever the candidates change.
+    Embeddings of edited or deleted resumes and jobs are dropped every
+    EMBEDDING_PRUNE_INTERVAL_SECONDS.
+    """
+    pruned_at = time.monotonic()
+    while True:
+        client = get_mongodb_client()
+        if client:
+            candidates_collection = client[MONGODB_DB]['candidates']
+            try:
+                _refresh_skill_index(candidates_collection)
+            except Exception as e:
+                logger.warning("Could not refresh the skill index: %s", e)
+            if time.monotonic() - pruned_at >= EMBEDDING_PRUNE_INTERVAL_SECONDS:
+                pruned_at = time.monotonic()
+                try:
+                    _prune_embedding_index(candidates_collection)
+                except Exception as e:
+                    logger.warning("Could not prune the embedding index: %s", e)
+            client.close()
+        if _index_maintenance_stop.wait(INDEX_REFRESH_CHECK_SECONDS):
+            return
+
+
+async def _ingest_single_upload(upload: UploadFile):
+    """Ingest an endpoint's only upload, turning an oversize file into a 413."""
+    try:
+        return await ingest_upload(upload)
+    except FileTooLargeError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+
+
+def _job_skill_list(nlp, job: dict) -> List[str]:
+    """Canonical required skills of a job: listed skills plus skills extracted from them (or the description)."""
+    job_skills = job.get('requiredSkills') or []
+    extracted = nlp.extract_skills(' '.join(job_skills) if job_skills else job.get('description', ''))
+    return list(set(canonicalize_skills(job_skills)) | {s.lower() for s in extracted.get('found_skills', [])})
+
+
+def _page_info(offset: int, top_k: Optional[int], min_score: Optional[float], total: int) -> dict:
+    """Paging fields added to ranked responses when top_k, offset or min_score is given."""
+    if top_k is None and not offset and min_score is None:
+        return {}
+    return {'offset': max(offset, 0), 'topK': top_k, 'minScore': min_score, 'totalResults': total}
+
+
+# Candidates whose match rounds to 0.0% are never listed
+_LISTED_MIN_SCORE = 0.0005
+
+_match_candidates_flight = SingleFlight("match_candidates")
+
+
+def _match_request_key(
+    request: MatchCandidatesRequest,
+    top_k: Optional[int],
+    offset: int,
+    min_score: Optional[float]
+) -> str:
+    """Coalescing key: requests differing only in surrounding whitespace or a missing/empty skill list score identically."""
+    return content_hash(json.dumps([
+        request.jobDescription.strip(),
+        [skill.strip() for skill in request.requiredSkills or []],
+        request.jobTitle,
+        request.company,
+        top_k,
+        offset,
+        min_score
+    ]))
+
+
+@app.post("/api/match-candidates", response_class=FastJSONResponse)
+async def match_candidates(
+    request: MatchCandidatesRequest,
+    top_k: Optional[int] = None,
+    offset: int = 0,
+    min_score: Optional[float] = None
+):
     """
     Match candidates from database against a job description.
     
+    Only the requested page is ordered and formatted, so the work after
+    scoring follows the page size rather than the candidate pool. Identical
+    concurrent requests share one computation, and successful results are
+    reused for COALESCE_CACHE_TTL seconds (see coalescing.SingleFlight).
+    Only the request that runs the computation takes a slot of the "nlp"
+    admission budget; its duplicates wait for the result without one.
+    
     Args:
         request: MatchCandidatesRequest containing job description and optional skills
+        top_k: Maximum number of candidates returned (all when omitted)
+        offset: Number of ranked candidates to skip
+        min_score: Only return candidates whose final score (0-1) is at least this
         
     Returns:
         List of matched candidates with match percentages and scores
     """
+    async def compute():
+        async with get_admission_controller().budget_slot('nlp'):
+            return await run_blocking(_match_candidates, request, top_k, offset, min_score)
+    
+    try:
+        response = await _match_candidates_flight.run(
+            _match_request_key(request, top_k, offset, min_score),
+            compute,
+            # Error envelopes are shared with concurrent duplicates but not kept
+            should_cache=lambda response: isinstance(response, FastJSONResponse)
+        )
+    except Overloaded as e:
+        # Duplicates waiting on a rejected computation are rejected with it
+        return overloaded_response(e, 'POST', '/api/match-candidates')
+    if isinstance(response, Response):
+        # Each caller sends its own copy of the rendered body: middleware such as
+        # GZip rewrites the headers of the response object it sends
+        return Response(response.body, status_code=response.status_code, media_type=response.media_type)
+    return response
+
+
+def _match_candidates(
+    request: MatchCandidatesRequest,
+    top_k: Optional[int],
+    offset: int,
+    min_score: Optional[float]
+):
+    """Score the candidate pool for one match-candidates request (blocking; see match_candidates)."""
     try:
         if not request.jobDescription or not request.jobDescription.strip():
             raise HTTPException(
@@ -113,6 +443,7 @@ async def match_candidates(request: MatchCandidatesRequest):
             )
         
         logger.info("Matching candidates against job description...")
+        start_request_sampling()
         
         # Get job skills from request or extract from job description using NLP
         job_skills = request.requiredSkills if request.requiredSkills else []
@@ -120,31 +451,34 @@ async def match_candidates(request: MatchCandidatesRequest):
         # If no explicit skills provided, extract them from job description using NLP
         if not job_skills:
             try:
-                job_skills_data = nlp.extract_skills(request.jobDescription)
+                job_skills_data = get_nlp_processor().extract_skills(request.jobDescription)
                 job_skills = job_skills_data.get('found_skills', [])
-                logger.info(f"Extracted job skills from description: {job_skills}")
+                logger.info("Extracted %d job skills from description", len(job_skills))
             except Exception as e:
-                logger.warning(f"Could not extract skills from job description: {str(e)}")
+                logger.warning("Could not extract skills from job description: %s", e)
                 job_skills = []
         else:
-            logger.info(f"Using provided job required skills: {job_skills}")
+            logger.info("Using %d provided job required skills", len(job_skills))
         
         # Fetch candidates from MongoDB
         candidates_data = []
         try:
             client = get_mongodb_client()
             if client:
-                db = client['resume-shortlister']
+                db = client[MONGODB_DB]
                 candidates_collection = db['candidates']
                 
-                # Fetch all candidates
-                db_candidates = list(candidates_collection.find({}, {
-                    'name': 1,
-                    'email': 1,
-                    'skills': 1,
-                    'experienceYears': 1,
-                    'resumeText': 1
-                }).limit(100))
+                # Large pools are narrowed to the best lexical matches (BM25) before
+                # the embedding rerank; smaller pools are scored in full
+                search_index = _candidate_search_index(candidates_collection)
+                if len(search_index) > MATCH_RETRIEVAL_DEPTH:
+                    query = ' '.join([request.jobDescription] + list(job_skills))
+                    emails = [email for email, _ in search_index.search(query, MATCH_RETRIEVAL_DEPTH)]
+                    candidate_filter = {'email': {'$in': emails}}
+                    logger.info("BM25 prefilter kept %d of %d candidates", len(emails), len(search_index))
+                else:
+                    candidate_filter = {}
+                db_candidates = list(candidates_collection.find(candidate_filter, CANDIDATE_MATCH_PROJECTION))
                 
                 for candidate in db_candidates:
                     candidates_data.append({
@@ -153,13 +487,13 @@ async def match_candidates(request: MatchCandidatesRequest):
                         'phone': candidate.get('phone', 'N/A'),
                         'experience': f"{candidate.get('experienceYears', 0)} years",
                         'skills': candidate.get('skills', []),
-                        'resumeText': candidate.get('resumeText', '')
+                        'resumeText': candidate.get('resumeText') or candidate.get('resume_text', '')
                     })
                 
                 client.close()
-                logger.info(f"Fetched {len(candidates_data)} candidates from MongoDB")
+                logger.info("Fetched %d candidates from MongoDB", len(candidates_data))
         except Exception as e:
-            logger.warning(f"Could not fetch from MongoDB: {str(e)}. Using sample data.")
+            logger.warning("Could not fetch from MongoDB: %s. Using sample data.", e)
             # Fallback to sample data if MongoDB is not available
             candidates_data = [
                 {
@@ -189,125 +523,87 @@ async def match_candidates(request: MatchCandidatesRequest):
             ]
         
         if not candidates_data:
-            return create_success_response(
+            return FastJSONResponse(create_success_response(
                 data={'matches': []},
                 message="No candidates found in database"
-            )
+            ))
         
         # Use NLP and transformers for intelligent matching
         try:
             nlp = get_nlp_processor()
             
-            # Get job description embedding for semantic similarity
-            job_embedding = nlp.get_embeddings([request.jobDescription])[0]
-            
-            # Score each candidate using NLP and transformers
-            matched_candidates = []
+            # Canonicalize every listed skill in one batch so the per-candidate lookups below hit the memo
+            canonicalize_skills({skill for candidate in candidates_data for skill in candidate.get('skills') or []})
             
+            # Build each candidate's text and skill set; embeddings are computed in one batch below
+            resume_texts = []
+            candidate_skill_sets = []
             for candidate in candidates_data:
-                # Extract candidate resume text or create from skills
-                resume_text = candidate.get('resumeText', '')
-                if not resume_text and candidate.get('skills'):
-                    resume_text = f"Skills: {', '.join(candidate.get('skills', []))}"
-                
-                if not resume_text:
-                    resume_text = candidate['name']
-                
-                # Get candidate embedding
-                candidate_embedding = nlp.get_embeddings([resume_text])[0]
-                
-                # Calculate semantic similarity using transformer embeddings
-                semantic_score = float(np.dot(job_embedding, candidate_embedding) / (
-                    np.linalg.norm(job_embedding) * np.linalg.norm(candidate_embedding) + 1e-10
-                ))
-                semantic_score = max(0.0, min(1.0, semantic_score))  # Clamp between 0 and 1
-                
-                # Calculate skill match score using NLP skill extraction
-                # Extract skills from candidate's resume/skills using NLP
-                candidate_skills_data = nlp.extract_skills(resume_text)
-                candidate_skills_extracted = candidate_skills_data.get('found_skills', [])
-                
-                # Get explicitly listed skills from database (candidate.skills)
-                explicit_candidate_skills = candidate.get('skills', [])
-                
-                # Normalize all candidate skills to lowercase for comparison
-                candidate_skills_extracted_lower = [s.lower() for s in candidate_skills_extracted]
-                explicit_candidate_skills_lower = [s.lower() for s in explicit_candidate_skills]
-                
-                # Combine all candidate skills
-                all_candidate_skills = set(candidate_skills_extracted_lower + explicit_candidate_skills_lower)
-                
-                logger.info(f"\n{'='*80}")
-                logger.info(f"Candidate: {candidate['name']}")
-                logger.info(f"  Explicit DB Skills (candidate.skills): {explicit_candidate_skills}")
-                logger.info(f"  Extracted Resume Skills: {candidate_skills_extracted}")
-                logger.info(f"  Combined All Skills: {sorted(all_candidate_skills)}")
-                logger.info(f"Job Required Skills: {job_skills}")
-                logger.info(f"{'='*80}\n")
-                
-                # Find matched skills by comparing with job requirements
-                matched_skills = []
-                missing_skills = []
-                
-                if job_skills:
-                    for job_skill in job_skills:
-                        job_skill_lower = job_skill.lower()
-                        # Check if job skill is in candidate's skills (using skills database normalization)
-                        if job_skill_lower in all_candidate_skills:
-                            matched_skills.append(job_skill)
-                        else:
-                            missing_skills.append(job_skill)
-                    
-                    skill_score = len(matched_skills) / len(job_skills) if job_skills else 0.0
-                    logger.info(f"  ✓ Matched Skills: {matched_skills}")
-                    logger.info(f"  ✗ Missing Skills: {missing_skills}")
-                    logger.info(f"  Skill Score: {skill_score*100:.1f}%")
-                    logger.info(f"  Semantic Score: {semantic_score*100:.1f}%")
-                    logger.info(f"  Final Match: {round(final_score * 100, 1)}%\n")
-                else:
-                    skill_score = 0.5  # Default if no skills specified
+                resume_text = _candidate_match_text(candidate) or candidate['name']
+                resume_texts.append(resume_text)
+                candidate_skill_sets.append(_candidate_skill_set(nlp, resume_text, candidate.get('skills')))
+            
+            results = ScoringEngine(nlp, get_embedding_index()).match(
+                request.jobDescription,
+                resume_texts,
+                [job_skills],
+                candidate_skill_sets,
+                top_k=top_k,
+                required_keys=[canonicalize_skills(job_skills)],
+                offset=offset,
+                min_score=max(min_score or 0, _LISTED_MIN_SCORE)
+            )
+            
+            matched_candidates = []
+            for result in results:
+                candidate = candidates_data[result['index']]
+                match_percentage = round(result['final_score'] * 100, 1)
                 
-                # Combine scores using the formula: 0.7 * semantic + 0.3 * skill
-                final_score = (0.7 * semantic_score) + (0.3 * skill_score)
-                match_percentage = round(final_score * 100, 1)
+                if should_log_item(logger):
+                    logger.debug("Candidate scored", extra={'fields': {
+                        'candidate': candidate['name'],
+                        'skills': len(candidate_skill_sets[result['index']]),
+                        'matched_skills': result['matched_skills'],
+                        'missing_skills': len(result['missing_skills']),
+                        'skill_score': round(result['skill_score'], 3),
+                        'semantic_score': round(result['semantic_score'], 3),
+                        'final_score': round(result['final_score'], 3)
+                    }})
                 
-                # Only include candidates with at least some relevancy
-                if match_percentage > 0:
-                    matched_candidates.append({
-                        "name": candidate['name'],
-                        "email": candidate['email'],
-                        "phone": candidate['phone'],
-                        "experience": candidate['experience'],
-                        "skills": candidate.get('skills', []),
-                        "matchPercentage": match_percentage,
-                        "matchedSkills": matched_skills,
-                        "missingSkills": missing_skills,
-                        "semanticScore": round(semantic_score, 3),
-                        "skillScore": round(skill_score, 3),
-                        "finalScore": round(final_score, 3)
-                    })
-            
-            # Sort by match percentage (descending)
-            matched_candidates.sort(key=lambda x: x['matchPercentage'], reverse=True)
+                # Candidates without any relevancy were left out by the ranking
+                matched_candidates.append({
+                    "name": candidate['name'],
+                    "email": candidate['email'],
+                    "phone": candidate['phone'],
+                    "experience": candidate['experience'],
+                    "skills": candidate.get('skills', []),
+                    "matchPercentage": match_percentage,
+                    "matchedSkills": result['matched_skills'],
+                    "missingSkills": result['missing_skills'],
+                    "semanticScore": round(result['semantic_score'], 3),
+                    "skillScore": round(result['skill_score'], 3),
+                    "finalScore": round(result['final_score'], 3)
+                })
             
             response_data = {
                 'matches': matched_candidates,
                 'requiredSkills': job_skills,
-                'totalMatches': len(matched_candidates),
+                'totalMatches': results.total,
                 'totalCandidates': len(candidates_data),
                 'jobTitle': request.jobTitle or 'N/A',
                 'company': request.company or 'N/A',
-                'matchingMethod': 'NLP + Transformer Embeddings (0.7 semantic + 0.3 skill match)'
+                'matchingMethod': 'NLP + Transformer Embeddings (0.7 semantic + 0.3 skill match)',
+                **_page_info(offset, top_k, min_score, results.total)
             }
             
-            logger.info(f"NLP Matching completed: {len(matched_candidates)} candidates matched using transformer embeddings")
-            return create_success_response(
+            logger.info("NLP Matching completed: %d candidates matched using transformer embeddings", len(matched_candidates))
+            return FastJSONResponse(create_success_response(
                 data=response_data,
                 message="Candidate matching completed successfully using NLP algorithms"
-            )
+            ))
             
         except Exception as e:
-            logger.error(f"Error during NLP matching: {str(e)}")
+            logger.error("Error during NLP matching: %s", e)
             # Fallback to skill matching with NLP extraction
             logger.info("Falling back to NLP-based skill extraction matching...")
             
@@ -321,70 +617,60 @@ async def match_candidates(request: MatchCandidatesRequest):
             all_job_skills = set(job_skills_lower + job_skills_extracted_lower)
             
             # Fallback to NLP-based skill matching if transformers fail
+            all_job_skills = list(all_job_skills)
+            overlap = SkillOverlap(
+                [all_job_skills],
+                [_candidate_skill_set(nlp, _candidate_match_text(c), c.get('skills')) for c in candidates_data],
+                required_keys=[canonicalize_skills(all_job_skills)]
+            )
+            
+            # Candidates with no matched skill are left out
+            page, total = select_page(overlap.scores, offset, top_k, max(min_score or 0, _LISTED_MIN_SCORE))
             matched_candidates = []
-            for candidate in candidates_data:
-                resume_text = candidate.get('resumeText', '')
-                if not resume_text and candidate.get('skills'):
-                    resume_text = f"Skills: {', '.join(candidate.get('skills', []))}"
-                
-                # Extract skills using NLP
-                candidate_skills_data = nlp.extract_skills(resume_text)
-                candidate_skills_extracted = candidate_skills_data.get('found_skills', [])
-                candidate_skills_explicit = [s.lower() for s in (candidate.get('skills') or [])]
-                all_candidate_skills = set([s.lower() for s in candidate_skills_extracted] + candidate_skills_explicit)
+            for index in page.tolist():
+                candidate = candidates_data[index]
+                match_percentage = min(100, max(0, overlap.scores[index] * 100))
+                matched_skills, missing_skills = overlap.matched_and_missing(index)
                 
-                # Find matched and missing skills
-                matched_skills = [s for s in all_job_skills if s in all_candidate_skills]
-                missing_skills = [s for s in all_job_skills if s not in all_candidate_skills]
-                
-                if all_job_skills:
-                    match_percentage = (len(matched_skills) / len(all_job_skills)) * 100
-                else:
-                    match_percentage = 50
-                
-                match_percentage = min(100, max(0, match_percentage))
-                
-                if match_percentage > 0:
-                    matched_candidates.append({
-                        "name": candidate['name'],
-                        "email": candidate['email'],
-                        "phone": candidate['phone'],
-                        "experience": candidate['experience'],
-                        "skills": candidate.get('skills', []),
-                        "matchPercentage": round(match_percentage, 1),
-                        "matchedSkills": list(matched_skills),
-                        "missingSkills": list(missing_skills),
-                        "semanticScore": round(match_percentage / 100, 3),
-                        "skillScore": round(match_percentage / 100, 3),
-                        "finalScore": round(match_percentage / 100, 3)
-                    })
-            
-            matched_candidates.sort(key=lambda x: x['matchPercentage'], reverse=True)
+                matched_candidates.append({
+                    "name": candidate['name'],
+                    "email": candidate['email'],
+                    "phone": candidate['phone'],
+                    "experience": candidate['experience'],
+                    "skills": candidate.get('skills', []),
+                    "matchPercentage": round(match_percentage, 1),
+                    "matchedSkills": matched_skills,
+                    "missingSkills": missing_skills,
+                    "semanticScore": round(match_percentage / 100, 3),
+                    "skillScore": round(match_percentage / 100, 3),
+                    "finalScore": round(match_percentage / 100, 3)
+                })
             
             response_data = {
                 'matches': matched_candidates,
                 'requiredSkills': list(all_job_skills),
-                'totalMatches': len(matched_candidates),
+                'totalMatches': total,
                 'totalCandidates': len(candidates_data),
                 'jobTitle': request.jobTitle or 'N/A',
                 'company': request.company or 'N/A',
-                'matchingMethod': 'Simple Skill Matching (Fallback)'
+                'matchingMethod': 'Simple Skill Matching (Fallback)',
+                **_page_info(offset, top_k, min_score, total)
             }
             
-            logger.info(f"Fallback matching completed: {len(matched_candidates)} candidates matched")
-            return create_success_response(
+            logger.info("Fallback matching completed: %d candidates matched", len(matched_candidates))
+            return FastJSONResponse(create_success_response(
                 data=response_data,
                 message="Candidate matching completed using fallback method"
-            )
+            ))
         
     except HTTPException as e:
-        logger.error(f"HTTP Error: {e.detail}")
+        logger.error("HTTP Error: %s", e.detail)
         return create_error_response(
             error_code="HTTP_ERROR",
             error_message=e.detail
         )
     except Exception as e:
-        logger.error(f"Error matching candidates: {str(e)}")
+        logger.error("Error matching candidates: %s", e)
         return create_error_response(
             error_code="MATCHING_ERROR",
             error_message="Error while matching candidates",
@@ -401,23 +687,112 @@ async def health_check():
     )
 
 
+@app.get("/api/metrics")
+async def get_metrics_report(format: str = "json"):
+    """
+    Counters for this worker process (documents parsed, rejected, ...).
+    
+    Args:
+        format: "json" for the usual response envelope, "prometheus" for the text exposition format
+    """
+    metrics = get_metrics()
+    if format == "prometheus":
+        return PlainTextResponse(metrics.render_prometheus(), media_type="text/plain; version=0.0.4")
+    return create_success_response(
+        data={'counters': metrics.snapshot()},
+        message="Metrics retrieved successfully"
+    )
+
+
+@app.get("/api/debug/profiles")
+async def list_profiles(x_profile_token: Optional[str] = Header(None)):
+    """List captured request profiles (requires the profiling token)."""
+    if not is_authorized(x_profile_token):
+        raise HTTPException(status_code=403, detail="Profiling access denied")
+
+    return create_success_response(
+        data={'profiles': get_profile_store().list_profiles()},
+        message="Profiles retrieved successfully"
+    )
+
+
+@app.get("/api/debug/profiles/{profile_id}")
+async def get_profile(
+    profile_id: str,
+    format: str = "pstats",
+    x_profile_token: Optional[str] = Header(None)
+):
+    """
+    Download a captured request profile.
+
+    Args:
+        profile_id: Identifier from the X-Profile-Id response header
+        format: "pstats" for the raw stats file, "text" for a rendered report
+        x_profile_token: Profiling token
+
+    Returns:
+        The pstats file or a plain-text report
+    """
+    if not is_authorized(x_profile_token):
+        raise HTTPException(status_code=403, detail="Profiling access denied")
+
+    store = get_profile_store()
+    if format == "text":
+        report = store.render_text(profile_id)
+        if report is None:
+            raise HTTPException(status_code=404, detail="Profile not found")
+        return PlainTextResponse(report)
+
+    path = store.get_stats_path(profile_id)
+    if not path:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return FileResponse(
+        path,
+        media_type='application/octet-stream',
+        filename=f"{profile_id}.prof"
+    )
+
+
 class MatchJobsRequest(BaseModel):
     """Request model for job matching."""
     candidateSkills: List[str]
     resume: Optional[str] = None
 
 
-@app.post("/api/match-jobs")
-async def match_jobs(request: MatchJobsRequest):
+def _count_strong_matches(final_scores) -> int:
+    """Number of targets whose match percentage is at least 40%."""
+    return sum(1 for score in final_scores.tolist() if round(min(100, max(0, score * 100)), 1) >= 40)
+
+
+@app.post("/api/match-jobs", response_class=FastJSONResponse)
+async def match_jobs(
+    request: MatchJobsRequest,
+    top_k: Optional[int] = None,
+    offset: int = 0,
+    min_score: Optional[float] = None
+):
     """
     Match jobs from database against candidate's skills.
     
     Args:
         request: MatchJobsRequest containing candidate skills and resume text
+        top_k: Maximum number of jobs returned (all when omitted)
+        offset: Number of ranked jobs to skip
+        min_score: Only return jobs whose final score (0-1) is at least this
         
     Returns:
         List of matched jobs with match percentages and scores
     """
+    return await run_blocking(_match_jobs, request, top_k, offset, min_score)
+
+
+def _match_jobs(
+    request: MatchJobsRequest,
+    top_k: Optional[int],
+    offset: int,
+    min_score: Optional[float]
+):
+    """Fetch and score the jobs for one match-jobs request (blocking; see match_jobs)."""
     try:
         if not request.candidateSkills or len(request.candidateSkills) == 0:
             raise HTTPException(
@@ -426,59 +801,16 @@ async def match_jobs(request: MatchJobsRequest):
             )
         
         logger.info("Matching jobs against candidate skills...")
+        start_request_sampling()
         
-        # Get jobs from MongoDB or Node.js backend
-        jobs_data = []
-        try:
-            # Try to fetch from Node.js backend API
-            import requests
-            response = requests.get('http://localhost:5000/api/jobs', timeout=5)
-            if response.status_code == 200:
-                jobs_data = response.json()
-                logger.info(f"Fetched {len(jobs_data)} jobs from Node.js backend")
-        except Exception as e:
-            logger.warning(f"Could not fetch jobs from Node.js backend: {str(e)}")
-            # Fallback to sample jobs
-            jobs_data = [
-                {
-                    "id": 1,
-                    "title": "Python Full Stack Developer",
-                    "company": "Tech Startup Inc.",
-                    "description": "We are looking for a Python full stack developer with experience in Django, Flask, React and PostgreSQL. Must have 3+ years of experience.",
-                    "requiredSkills": ["Python", "Django", "React", "PostgreSQL", "JavaScript"],
-                    "salary": "$80,000 - $120,000"
-                },
-                {
-                    "id": 2,
-                    "title": "Frontend React Developer",
-                    "company": "Creative Digital Solutions",
-                    "description": "Seeking experienced React developer with strong CSS and JavaScript skills. Experience with TypeScript, Redux and testing frameworks required.",
-                    "requiredSkills": ["React", "JavaScript", "CSS", "TypeScript", "Testing"],
-                    "salary": "$70,000 - $110,000"
-                },
-                {
-                    "id": 3,
-                    "title": "Node.js Backend Engineer",
-                    "company": "Cloud Systems Ltd",
-                    "description": "Looking for Node.js backend engineer with experience in Express, MongoDB, AWS. Must have 4+ years of experience with microservices.",
-                    "requiredSkills": ["Node.js", "Express", "MongoDB", "AWS", "Microservices"],
-                    "salary": "$85,000 - $130,000"
-                },
-                {
-                    "id": 4,
-                    "title": "Data Science Engineer",
-                    "company": "AI Analytics Corp",
-                    "description": "Seeking data scientist with expertise in Python, Machine Learning, TensorFlow and Big Data technologies. PhD or Masters preferred.",
-                    "requiredSkills": ["Python", "Machine Learning", "TensorFlow", "SQL", "Statistics"],
-                    "salary": "$90,000 - $140,000"
-                }
-            ]
+        # Same cached catalog as explore-jobs, with the same fallback when the jobs API is down
+        jobs_data = get_jobs_catalog().get_snapshot()['jobs']
         
         if not jobs_data:
-            return create_success_response(
+            return FastJSONResponse(create_success_response(
                 data={'matches': []},
                 message="No jobs found in database"
-            )
+            ))
         
         # Use NLP and transformers for intelligent matching
         try:
@@ -488,103 +820,85 @@ async def match_jobs(request: MatchJobsRequest):
             candidate_skills_data = nlp.extract_skills(' '.join(request.candidateSkills))
             candidate_skills_extracted = candidate_skills_data.get('found_skills', [])
             
-            # Also add the input skills directly
-            candidate_skills_lower = [s.lower() for s in request.candidateSkills]
+            # Also add the input skills directly, mapped to canonical skills
+            candidate_skills_lower = canonicalize_skills(request.candidateSkills)
             candidate_skills_extracted_lower = [s.lower() for s in candidate_skills_extracted]
             
             # Combine both sources
             all_candidate_skills = set(candidate_skills_lower + candidate_skills_extracted_lower)
             
-            logger.info(f"Candidate skills (extracted + input): {list(all_candidate_skills)}")
+            logger.info("Candidate skills (extracted + input): %d", len(all_candidate_skills))
             
             # Get candidate embedding from skills
             candidate_text = ' '.join(request.candidateSkills)
             if request.resume:
                 candidate_text += ' ' + request.resume
             
-            candidate_embedding = nlp.get_embeddings([candidate_text])[0]
+            # Collect every job's text and required skills, then score all jobs in one batch
+            canonicalize_skills({skill for job in jobs_data for skill in job.get('requiredSkills') or []})
+            job_texts = []
+            job_skill_lists = []
+            for job in jobs_data:
+                job_texts.append(_job_match_text(job))
+                job_skill_lists.append(_job_skill_list(nlp, job))
             
-            # Score each job using NLP and transformers
-            matched_jobs = []
+            results = ScoringEngine(nlp, get_embedding_index()).match(
+                candidate_text,
+                job_texts,
+                job_skill_lists,
+                [all_candidate_skills],
+                top_k=top_k,
+                offset=offset,
+                min_score=min_score
+            )
             
-            for job in jobs_data:
-                # Get job description embedding
-                job_desc = job.get('description', '')
-                if not job_desc:
-                    job_desc = f"{job.get('title', '')} {' '.join(job.get('requiredSkills', []))}"
-                
-                job_embedding = nlp.get_embeddings([job_desc])[0]
-                
-                # Calculate semantic similarity using transformer embeddings
-                semantic_score = float(np.dot(candidate_embedding, job_embedding) / (
-                    np.linalg.norm(candidate_embedding) * np.linalg.norm(job_embedding) + 1e-10
-                ))
-                semantic_score = max(0.0, min(1.0, semantic_score))  # Clamp between 0 and 1
-                
-                # Calculate skill match score using NLP skill extraction
-                job_skills = job.get('requiredSkills', [])
-                job_skills_data = nlp.extract_skills(' '.join(job_skills) if job_skills else job_desc)
-                job_skills_extracted = job_skills_data.get('found_skills', [])
-                
-                # Combine explicit and extracted job skills
-                job_skills_lower = [s.lower() for s in (job_skills or [])]
-                job_skills_extracted_lower = [s.lower() for s in job_skills_extracted]
-                all_job_skills = set(job_skills_lower + job_skills_extracted_lower)
-                
-                # Find matched and missing skills
-                matched_skills = []
-                missing_skills = []
-                
-                if all_job_skills:
-                    for job_skill in all_job_skills:
-                        # Check if job skill matches any candidate skill
-                        if job_skill in all_candidate_skills:
-                            matched_skills.append(job_skill)
-                        else:
-                            missing_skills.append(job_skill)
-                    
-                    skill_score = len(matched_skills) / len(all_job_skills) if all_job_skills else 0.0
-                else:
-                    skill_score = 0.5  # Default if no skills specified
+            # Results arrive best first, one page of them
+            matched_jobs = []
+            for result in results:
+                job = jobs_data[result['index']]
+                match_percentage = round(result['final_score'] * 100, 1)
                 
-                # Combine scores using the formula: 0.7 * semantic + 0.3 * skill
-                final_score = (0.7 * semantic_score) + (0.3 * skill_score)
-                match_percentage = round(final_score * 100, 1)
+                if should_log_item(logger):
+                    logger.debug("Job scored", extra={'fields': {
+                        'job_id': job.get('id', ''),
+                        'matched_skills': result['matched_skills'],
+                        'missing_skills': len(result['missing_skills']),
+                        'skill_score': round(result['skill_score'], 3),
+                        'semantic_score': round(result['semantic_score'], 3),
+                        'final_score': round(result['final_score'], 3)
+                    }})
                 
-                # Include all jobs (they will be sorted by match)
                 matched_jobs.append({
                     "id": job.get('id', ''),
                     "title": job.get('title', 'N/A'),
                     "company": job.get('company', 'N/A'),
                     "description": job.get('description', ''),
-                    "requiredSkills": job_skills,
+                    "requiredSkills": job.get('requiredSkills', []),
                     "matchPercentage": match_percentage,
-                    "matchedSkills": matched_skills,
-                    "missingSkills": missing_skills,
-                    "semanticScore": round(semantic_score, 3),
-                    "skillScore": round(skill_score, 3),
+                    "matchedSkills": result['matched_skills'],
+                    "missingSkills": result['missing_skills'],
+                    "semanticScore": round(result['semantic_score'], 3),
+                    "skillScore": round(result['skill_score'], 3),
                     "salary": job.get('salary', 'N/A')
                 })
             
-            # Sort by match percentage (descending)
-            matched_jobs.sort(key=lambda x: x['matchPercentage'], reverse=True)
-            
             response_data = {
                 'matches': matched_jobs,
                 'jobSkills': request.candidateSkills,
-                'totalMatches': len([j for j in matched_jobs if j['matchPercentage'] >= 40]),
+                'totalMatches': _count_strong_matches(results.final_scores),
                 'totalJobs': len(jobs_data),
-                'matchingMethod': 'NLP + Transformer Embeddings (0.7 semantic + 0.3 skill match)'
+                'matchingMethod': 'NLP + Transformer Embeddings (0.7 semantic + 0.3 skill match)',
+                **_page_info(offset, top_k, min_score, results.total)
             }
             
-            logger.info(f"Job matching completed: {len(matched_jobs)} jobs analyzed using transformer embeddings")
-            return create_success_response(
+            logger.info("Job matching completed: %d jobs analyzed using transformer embeddings", len(matched_jobs))
+            return FastJSONResponse(create_success_response(
                 data=response_data,
                 message="Job matching completed successfully using NLP algorithms"
-            )
+            ))
             
         except Exception as e:
-            logger.error(f"Error during NLP job matching: {str(e)}")
+            logger.error("Error during NLP job matching: %s", e)
             # Fallback to NLP-based skill matching
             logger.info("Falling back to NLP-based skill matching for jobs...")
             
@@ -593,70 +907,57 @@ async def match_jobs(request: MatchJobsRequest):
             # Extract candidate skills using NLP
             candidate_skills_data = nlp.extract_skills(' '.join(request.candidateSkills))
             candidate_skills_extracted = candidate_skills_data.get('found_skills', [])
-            candidate_skills_input_lower = [s.lower() for s in request.candidateSkills]
+            candidate_skills_input_lower = canonicalize_skills(request.candidateSkills)
             all_candidate_skills = set(candidate_skills_input_lower + [s.lower() for s in candidate_skills_extracted])
             
+            canonicalize_skills({skill for job in jobs_data for skill in job.get('requiredSkills') or []})
+            job_skill_lists = [_job_skill_list(nlp, job) for job in jobs_data]
+            overlap = SkillOverlap(job_skill_lists, [all_candidate_skills])
+            
+            page, total = select_page(overlap.scores, offset, top_k, min_score)
             matched_jobs = []
-            for job in jobs_data:
-                # Extract job skills using NLP
-                job_skills = job.get('requiredSkills', [])
-                job_desc = job.get('description', '')
-                job_skills_data = nlp.extract_skills(' '.join(job_skills) if job_skills else job_desc)
-                job_skills_extracted = job_skills_data.get('found_skills', [])
-                
-                job_skills_lower = [s.lower() for s in (job_skills or [])]
-                job_skills_extracted_lower = [s.lower() for s in job_skills_extracted]
-                all_job_skills = set(job_skills_lower + job_skills_extracted_lower)
-                
-                # Find matched and missing skills
-                matched_skills = [s for s in all_job_skills if s in all_candidate_skills]
-                missing_skills = [s for s in all_job_skills if s not in all_candidate_skills]
-                
-                if all_job_skills:
-                    match_percentage = (len(matched_skills) / len(all_job_skills)) * 100
-                else:
-                    match_percentage = 50
-                
-                match_percentage = min(100, max(0, match_percentage))
+            for index in page.tolist():
+                job = jobs_data[index]
+                match_percentage = min(100, max(0, overlap.scores[index] * 100))
+                matched_skills, missing_skills = overlap.matched_and_missing(index)
                 
                 matched_jobs.append({
                     "id": job.get('id', ''),
                     "title": job.get('title', 'N/A'),
                     "company": job.get('company', 'N/A'),
                     "description": job.get('description', ''),
-                    "requiredSkills": list(all_job_skills),
+                    "requiredSkills": job_skill_lists[index],
                     "matchPercentage": round(match_percentage, 1),
-                    "matchedSkills": list(matched_skills),
-                    "missingSkills": list(missing_skills),
+                    "matchedSkills": matched_skills,
+                    "missingSkills": missing_skills,
                     "semanticScore": round(match_percentage / 100, 3),
                     "skillScore": round(match_percentage / 100, 3),
                     "salary": job.get('salary', 'N/A')
                 })
             
-            matched_jobs.sort(key=lambda x: x['matchPercentage'], reverse=True)
-            
             response_data = {
                 'matches': matched_jobs,
                 'jobSkills': list(all_candidate_skills),
-                'totalMatches': len([j for j in matched_jobs if j['matchPercentage'] >= 40]),
+                'totalMatches': _count_strong_matches(overlap.scores),
                 'totalJobs': len(jobs_data),
-                'matchingMethod': 'NLP-Based Skill Extraction (Fallback)'
+                'matchingMethod': 'NLP-Based Skill Extraction (Fallback)',
+                **_page_info(offset, top_k, min_score, total)
             }
             
-            logger.info(f"Fallback job matching completed: {len(matched_jobs)} jobs analyzed")
-            return create_success_response(
+            logger.info("Fallback job matching completed: %d jobs analyzed", len(matched_jobs))
+            return FastJSONResponse(create_success_response(
                 data=response_data,
                 message="Job matching completed using fallback method"
-            )
+            ))
         
     except HTTPException as e:
-        logger.error(f"HTTP Error: {e.detail}")
+        logger.error("HTTP Error: %s", e.detail)
         return create_error_response(
             error_code="HTTP_ERROR",
             error_message=e.detail
         )
     except Exception as e:
-        logger.error(f"Error matching jobs: {str(e)}")
+        logger.error("Error matching jobs: %s", e)
         return create_error_response(
             error_code="JOB_MATCHING_ERROR",
             error_message="Error while matching jobs",
@@ -664,10 +965,184 @@ async def match_jobs(request: MatchJobsRequest):
         )
 
 
-@app.post("/api/screen-resumes")
+class _ScreeningBatch:
+    """
+    Resumes of one screening request, added one file at a time.
+    
+    Each file is parsed and its skills extracted as it arrives, in the
+    blocking executors (see add_file); byte-identical files skip parsing and
+    reuse the earlier resume's data. Near-duplicates (by MinHash signature)
+    get their own skills but reuse the earlier resume's embedding, so
+    template-based resumes with different skill sections still score apart.
+    Embeddings for all other resumes are computed in one batch when the
+    results are built.
+    """
+    
+    def __init__(self, nlp):
+        self.nlp = nlp
+        self.resumes_data = []
+        self.candidate_names = []
+        self.minhasher = get_minhasher()
+        self.batch_index = NearDuplicateIndex()
+        self.processed_by_hash = {}
+        self.duplicate_of = {}
+        self.embedding_of = {}
+    
+    def __len__(self) -> int:
+        return len(self.resumes_data)
+    
+    async def add_file(self, filename: str, file, file_hash: str) -> None:
+        """
+        Parse and add one resume file, off the event loop.
+        
+        Args:
+            filename: File name (the candidate name is derived from it)
+            file: Binary file handle of the content
+            file_hash: SHA-1 of the content
+            
+        Raises:
+            ValueError: If the file cannot be parsed
+        """
+        executors = get_executors()
+        parsed = None
+        if file_hash not in self.processed_by_hash:
+            parsed = await executors.parse_resume(file, filename)
+        await executors.run(self.add, filename, file_hash, parsed)
+    
+    def add(self, filename: str, file_hash: str, parsed: Optional[Tuple[str, str]]) -> None:
+        """
+        Add one parsed resume.
+        
+        Args:
+            filename: File name (the candidate name is derived from it)
+            file_hash: SHA-1 of the content
+            parsed: (cleaned_text, file_format), or None for a file byte-identical
+                to one already added
+        """
+        position = str(len(self.resumes_data))
+        
+        if file_hash in self.processed_by_hash:
+            original = self.processed_by_hash[file_hash]
+            self.duplicate_of[position] = (original, 1.0)
+            resume_data = self.resumes_data[int(original)]
+            file_type = 'duplicate'
+        else:
+            resume_text, file_type = parsed
+            
+            # Same shape as NLPProcessor.process_resume; the embedding is filled in by build_results
+            resume_data = {
+                'embedding': None,
+                'skills': self.nlp.extract_skills(resume_text),
+                'key_entities': self.nlp.extract_key_phrases(resume_text),
+                'text': resume_text
+            }
+            
+            signature = self.minhasher.signature(resume_text)
+            match = self.batch_index.query(signature)
+            if match:
+                self.duplicate_of[position] = match
+                self.embedding_of[position] = match[0]
+            else:
+                self.batch_index.add(position, signature)
+            self.processed_by_hash[file_hash] = position
+        
+        self.resumes_data.append(resume_data)
+        self.candidate_names.append(sanitize_filename(filename))
+        
+        if should_log_item(logger):
+            logger.debug("Resume processed", extra={'fields': {
+                'file': filename,
+                'format': file_type,
+                'skills': resume_data['skills']['skill_count'],
+                'duplicate_of': self.duplicate_of.get(position, (None,))[0]
+            }})
+    
+    def build_results(
+        self,
+        job_data: dict,
+        top_k: Optional[int] = None,
+        offset: int = 0,
+        min_score: Optional[float] = None
+    ) -> dict:
+        """
+        Embed the resumes in one batch, score them and build the response data.
+        
+        Only the requested page of ranked candidates is formatted and listed;
+        the summary totals still cover every resume.
+        
+        Args:
+            job_data: Processed job description
+            top_k: Maximum number of candidates listed (all when omitted)
+            offset: Number of ranked candidates to skip
+            min_score: Only list candidates whose final score (0-1) is at least this
+        """
+        pending = [
+            data for position, data in enumerate(self.resumes_data)
+            if data['embedding'] is None and str(position) not in self.embedding_of
+        ]
+        pending = list({id(data): data for data in pending}.values())
+        if pending:
+            embeddings = self.nlp.get_embeddings([data['text'] for data in pending], batch_size=BATCH_SIZE)
+            for data, embedding in zip(pending, embeddings):
+                data['embedding'] = embedding
+        for position, original in self.embedding_of.items():
+            self.resumes_data[int(position)]['embedding'] = self.resumes_data[int(original)]['embedding']
+        
+        # Score candidates
+        logger.info("Scoring %d candidates...", len(self.resumes_data))
+        ranked_candidates = CandidateScorer.score_batch(
+            self.resumes_data,
+            job_data,
+            self.candidate_names
+        )
+        
+        # Format only the candidates on the requested page
+        page, total = select_page(
+            [candidate['final_score'] for candidate in ranked_candidates], offset, top_k, min_score
+        )
+        listed = [ranked_candidates[index] for index in page.tolist()]
+        formatted_results = [
+            format_score_report(candidate)
+            for candidate in listed
+        ]
+        
+        # Generate summary, naming each duplicate cluster by candidate
+        duplicate_clusters = [
+            {
+                'original': self.candidate_names[int(cluster['original'])],
+                'duplicates': [self.candidate_names[int(position)] for position in cluster['duplicates']],
+                'min_similarity': cluster['min_similarity']
+            }
+            for cluster in group_duplicates(self.duplicate_of)
+        ]
+        summary = generate_summary_report(ranked_candidates, duplicate_clusters, listed)
+        
+        response_data = {
+            'job_description_summary': {
+                'required_skills': job_data['skills']['found_skills'],
+                'skill_count': job_data['skills']['skill_count'],
+            },
+            'summary': summary,
+            'ranked_candidates': formatted_results,
+            'screening_complete': True
+        }
+        if top_k is not None or offset or min_score is not None:
+            response_data.update({
+                'offset': max(offset, 0),
+                'top_k': top_k,
+                'min_score': min_score,
+                'total_results': total
+            })
+        return response_data
+
+
+@app.post("/api/screen-resumes", response_class=FastJSONResponse)
 async def screen_resumes(
     resumes: List[UploadFile] = File(..., description="Resume files (PDF or DOCX)"),
-    job_description: str = Form(..., description="Job description text")
+    job_description: str = Form(..., description="Job description text"),
+    top_k: Optional[int] = None,
+    offset: int = 0,
+    min_score: Optional[float] = None
 ):
     """
     Screen multiple resumes against a job description.
@@ -675,6 +1150,9 @@ async def screen_resumes(
     Args:
         resumes: List of uploaded resume files
         job_description: Job description text
+        top_k: Maximum number of ranked candidates returned (all when omitted)
+        offset: Number of ranked candidates to skip
+        min_score: Only return candidates whose final score (0-1) is at least this
         
     Returns:
         Ranked list of candidates with scores and explanations
@@ -698,96 +1176,163 @@ async def screen_resumes(
                 detail="Maximum 50 resumes can be processed at once"
             )
         
-        logger.info(f"Processing {len(resumes)} resumes...")
+        logger.info("Processing %d resumes...", len(resumes))
+        start_request_sampling()
         
         # Initialize NLP processor
         nlp = get_nlp_processor()
         
         # Process job description
         logger.info("Processing job description...")
-        job_data = nlp.process_job_description(job_description)
-        
-        # Process resumes
-        resumes_data = []
-        candidate_names = []
+        job_data = await run_blocking(nlp.process_job_description, job_description)
         
+        batch = _ScreeningBatch(nlp)
         for resume_file in resumes:
             try:
                 # Validate file
                 if not validate_file_extension(resume_file.filename, ALLOWED_EXTENSIONS):
-                    logger.warning(f"Skipping {resume_file.filename}: unsupported format")
+                    logger.warning("Skipping %s: unsupported format", resume_file.filename)
                     continue
                 
-                # Read file content
-                file_content = await resume_file.read()
-                
-                # Extract text
-                resume_text, file_type = extract_text_from_resume(
-                    file_content,
-                    resume_file.filename
-                )
-                
-                # Clean text
-                resume_text = clean_resume_text(resume_text)
-                
-                # Process resume
-                resume_data = nlp.process_resume(resume_text)
-                resumes_data.append(resume_data)
-                candidate_names.append(sanitize_filename(resume_file.filename))
-                
-                logger.info(f"Successfully processed: {resume_file.filename}")
+                # Check the size and hash the content without loading the file into memory
+                ingested = await ingest_upload(resume_file)
+                await batch.add_file(resume_file.filename, ingested.file, ingested.sha1)
                 
             except Exception as e:
-                logger.error(f"Error processing {resume_file.filename}: {str(e)}")
+                logger.error("Error processing %s: %s", resume_file.filename, e)
                 continue
+            finally:
+                # Release the spooled upload now rather than when the whole batch finishes
+                await resume_file.close()
         
-        if not resumes_data:
+        if not len(batch):
             raise HTTPException(
                 status_code=400,
                 detail="Could not process any resume files successfully"
             )
         
-        # Score candidates
-        logger.info(f"Scoring {len(resumes_data)} candidates...")
-        ranked_candidates = CandidateScorer.score_batch(
-            resumes_data,
-            job_data,
-            candidate_names
+        response_data = await run_blocking(batch.build_results, job_data, top_k, offset, min_score)
+        
+        logger.info("Screening completed successfully")
+        return FastJSONResponse(create_success_response(
+            data=response_data,
+            message="Resume screening completed successfully"
+        ))
+        
+    except HTTPException as e:
+        logger.error("HTTP Error: %s", e.detail)
+        return create_error_response(
+            error_code="HTTP_ERROR",
+            error_message=e.detail
+        )
+    except Exception as e:
+        logger.error("Unexpected error: %s", e)
+        return create_error_response(
+            error_code="INTERNAL_ERROR",
+            error_message="An unexpected error occurred during screening",
+            details=str(e)
         )
+
+
+@app.post("/api/screen-resumes-archive", response_class=FastJSONResponse)
+async def screen_resumes_archive(
+    archive: UploadFile = File(..., description="Zip or tar archive of resume files (PDF or DOCX)"),
+    job_description: str = Form(..., description="Job description text"),
+    top_k: Optional[int] = None,
+    offset: int = 0,
+    min_score: Optional[float] = None
+):
+    """
+    Screen every resume in a zip or tar archive against a job description.
+    
+    Entries are decompressed one at a time, in memory, and fed straight into
+    screening; nothing is extracted to disk. Entry count, total uncompressed
+    size and compression ratio are limited (see ARCHIVE_* in config).
+    
+    Args:
+        archive: Uploaded .zip, .tar, .tar.gz, .tgz, .tar.bz2 or .tar.xz file
+        job_description: Job description text
+        top_k: Maximum number of ranked candidates returned (all when omitted)
+        offset: Number of ranked candidates to skip
+        min_score: Only return candidates whose final score (0-1) is at least this
         
-        # Format results
-        formatted_results = [
-            format_score_report(candidate)
-            for candidate in ranked_candidates
-        ]
+    Returns:
+        Ranked list of candidates with scores and explanations, plus the
+        archive entries that were skipped
+    """
+    try:
+        if not job_description or not job_description.strip():
+            raise HTTPException(
+                status_code=400,
+                detail="Job description cannot be empty"
+            )
         
-        # Generate summary
-        summary = generate_summary_report(ranked_candidates)
+        if not is_archive(archive.filename):
+            raise HTTPException(
+                status_code=400,
+                detail="Unsupported archive format. Allowed: .zip, .tar, .tar.gz, .tgz, .tar.bz2, .tar.xz"
+            )
         
-        response_data = {
-            'job_description_summary': {
-                'required_skills': job_data['skills']['found_skills'],
-                'skill_count': job_data['skills']['skill_count'],
-            },
-            'summary': summary,
-            'ranked_candidates': formatted_results,
-            'screening_complete': True
+        try:
+            ingested_archive = await ingest_upload(archive, max_size=ARCHIVE_MAX_FILE_SIZE)
+        except FileTooLargeError as e:
+            raise HTTPException(status_code=413, detail=str(e))
+        
+        logger.info("Processing resume archive %s...", archive.filename)
+        start_request_sampling()
+        
+        nlp = get_nlp_processor()
+        job_data = await run_blocking(nlp.process_job_description, job_description)
+        
+        batch = _ScreeningBatch(nlp)
+        reader = ArchiveReader(ingested_archive.file, archive.filename)
+        try:
+            # Entries are decompressed in the executors too
+            entries = iter(reader)
+            while True:
+                entry = await run_blocking(next, entries, None)
+                if entry is None:
+                    break
+                try:
+                    await batch.add_file(entry.filename, entry.file, entry.sha1)
+                except Exception as e:
+                    logger.error("Error processing %s: %s", entry.filename, e)
+                    reader.skipped.append((entry.filename, str(e)))
+                finally:
+                    entry.file.close()
+        except ArchiveLimitError as e:
+            raise HTTPException(status_code=413, detail=str(e))
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        
+        if not len(batch):
+            raise HTTPException(
+                status_code=400,
+                detail="Could not process any resume files in the archive"
+            )
+        
+        response_data = await run_blocking(batch.build_results, job_data, top_k, offset, min_score)
+        response_data['archive'] = {
+            'filename': archive.filename,
+            'entries': reader.entries,
+            'processed': len(batch),
+            'skipped': [{'name': name, 'reason': reason} for name, reason in reader.skipped]
         }
         
-        logger.info("Screening completed successfully")
-        return create_success_response(
+        logger.info("Archive screening completed: %d resumes", len(batch))
+        return FastJSONResponse(create_success_response(
             data=response_data,
             message="Resume screening completed successfully"
-        )
+        ))
         
     except HTTPException as e:
-        logger.error(f"HTTP Error: {e.detail}")
+        logger.error("HTTP Error: %s", e.detail)
         return create_error_response(
             error_code="HTTP_ERROR",
             error_message=e.detail
         )
     except Exception as e:
-        logger.error(f"Unexpected error: {str(e)}")
+        logger.error("Unexpected error: %s", e)
         return create_error_response(
             error_code="INTERNAL_ERROR",
             error_message="An unexpected error occurred during screening",
@@ -795,7 +1340,7 @@ async def screen_resumes(
         )
 
 
-@app.post("/api/score-single")
+@app.post("/api/score-single", response_class=FastJSONResponse)
 async def score_single_resume(
     resume: UploadFile = File(...),
     job_description: str = Form(...)
@@ -824,23 +1369,23 @@ async def score_single_resume(
                 detail=f"Unsupported file format. Allowed: {', '.join(ALLOWED_EXTENSIONS)}"
             )
         
-        logger.info(f"Scoring single resume: {resume.filename}")
+        logger.info("Scoring single resume: %s", resume.filename)
         
         # Initialize NLP processor
         nlp = get_nlp_processor()
         
         # Process job description
-        job_data = nlp.process_job_description(job_description)
+        job_data = await run_blocking(nlp.process_job_description, job_description)
         
         # Read and process resume
-        file_content = await resume.read()
-        resume_text, _ = extract_text_from_resume(file_content, resume.filename)
-        resume_text = clean_resume_text(resume_text)
-        resume_data = nlp.process_resume(resume_text)
+        ingested = await _ingest_single_upload(resume)
+        resume_text, _ = await get_executors().parse_resume(ingested.file, resume.filename)
+        resume_data = await run_blocking(nlp.process_resume, resume_text)
         
         # Score
         candidate_name = sanitize_filename(resume.filename)
-        score_result = CandidateScorer.score_candidate(
+        score_result = await run_blocking(
+            CandidateScorer.score_candidate,
             resume_data,
             job_data,
             candidate_name
@@ -850,10 +1395,10 @@ async def score_single_resume(
         # Format result
         formatted_result = format_score_report(score_result)
         
-        return create_success_response(
+        return FastJSONResponse(create_success_response(
             data=formatted_result,
             message="Resume scored successfully"
-        )
+        ))
         
     except HTTPException as e:
         return create_error_response(
@@ -861,7 +1406,7 @@ async def score_single_resume(
             error_message=e.detail
         )
     except Exception as e:
-        logger.error(f"Error scoring resume: {str(e)}")
+        logger.error("Error scoring resume: %s", e)
         return create_error_response(
             error_code="SCORING_ERROR",
             error_message="Error while scoring resume",
@@ -869,13 +1414,28 @@ async def score_single_resume(
         )
 
 
+# Extracted skills depend only on the job description and the skills database
+_SKILLS_DB_VERSION = compute_etag(SKILLS_LOWERCASE).strip('"')
+_extracted_skills_cache = LRUCache(EXTRACT_SKILLS_CACHE_SIZE)
+
+
 @app.get("/api/extract-skills")
-async def extract_skills(job_description: str):
+async def extract_skills(
+    job_description: str,
+    response: Response,
+    if_none_match: Optional[str] = Header(None)
+):
     """
     Extract skills from a job description.
     
+    The result is a pure function of the input, so the ETag is derived from
+    the job description and the skills database version: a matching
+    If-None-Match gets a 304 without extracting anything, and results are
+    publicly cacheable for EXTRACT_SKILLS_MAX_AGE seconds.
+    
     Args:
         job_description: Job description text
+        if_none_match: ETag from a previous response
         
     Returns:
         List of extracted skills
@@ -887,15 +1447,26 @@ async def extract_skills(job_description: str):
                 detail="Job description cannot be empty"
             )
         
-        nlp = get_nlp_processor()
-        skills_result = nlp.extract_skills(job_description)
+        etag = compute_etag([_SKILLS_DB_VERSION, job_description])
+        cached = not_modified(
+            response, etag, if_none_match,
+            cache_control=f"public, max-age={EXTRACT_SKILLS_MAX_AGE}"
+        )
+        if cached is not None:
+            return cached
         
-        return create_success_response(
-            data={
+        data = _extracted_skills_cache.get(etag)
+        if data is None:
+            skills_result = await run_blocking(lambda: get_nlp_processor().extract_skills(job_description))
+            data = {
                 'skills': skills_result['found_skills'],
                 'skill_count': skills_result['skill_count'],
                 'details': skills_result['skills_detail']
-            },
+            }
+            _extracted_skills_cache.put(etag, data)
+        
+        return create_success_response(
+            data=data,
             message="Skills extracted successfully"
         )
         
@@ -905,7 +1476,7 @@ async def extract_skills(job_description: str):
             error_message=e.detail
         )
     except Exception as e:
-        logger.error(f"Error extracting skills: {str(e)}")
+        logger.error("Error extracting skills: %s", e)
         return create_error_response(
             error_code="EXTRACTION_ERROR",
             error_message="Error extracting skills",
@@ -913,13 +1484,83 @@ async def extract_skills(job_description: str):
         )
 
 
+@app.get("/api/skill-search")
+async def skill_search(q: str, limit: int = 100):
+    """
+    Find candidates with a boolean skill query, answered from the skill index.
+    
+    Args:
+        q: Query such as "python AND (django OR flask) AND NOT php"
+        limit: Maximum number of candidates returned
+        
+    Returns:
+        Total number of matching candidates and the first `limit` of them
+    """
+    return await run_blocking(_skill_search, q, limit)
+
+
+def _skill_search(q: str, limit: int):
+    """Answer one skill query, loading the skill index on first use (blocking; see skill_search)."""
+    try:
+        client = get_mongodb_client()
+        if not client:
+            raise HTTPException(status_code=500, detail="Database connection failed")
+        
+        try:
+            candidates_collection = client[MONGODB_DB]['candidates']
+            skill_index = _skill_search_index(candidates_collection)
+            try:
+                emails = skill_index.search(q)
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=f"Invalid skill query: {e}")
+            
+            page = emails[:max(limit, 0)]
+            found = {
+                candidate['email']: candidate
+                for candidate in candidates_collection.find(
+                    {'email': {'$in': page}},
+                    {'_id': 0, 'name': 1, 'email': 1, 'phone': 1, 'experience': 1, 'skills': 1}
+                )
+            }
+        finally:
+            client.close()
+        
+        candidates = [
+            {**found[email], 'indexedSkills': skill_index.skills_of(email)}
+            for email in page if email in found
+        ]
+        return create_success_response(
+            data={'query': q, 'total': len(emails), 'candidates': candidates},
+            message=f"Found {len(emails)} matching candidates"
+        )
+        
+    except HTTPException as e:
+        logger.error("HTTP Error in skill search: %s", e.detail)
+        return create_error_response(error_code="HTTP_ERROR", error_message=str(e.detail))
+    except Exception as e:
+        logger.error("Error searching skills: %s", e)
+        return create_error_response(
+            error_code="SKILL_SEARCH_ERROR",
+            error_message="Error searching candidates by skill",
+            details=str(e)
+        )
+
+
 @app.get("/api/latest-candidate")
-async def get_latest_candidate(email: Optional[str] = None):
-    """Get the candidate data for the email if provided, otherwise latest uploaded."""
+async def get_latest_candidate(
+    response: Response,
+    email: Optional[str] = None,
+    if_none_match: Optional[str] = Header(None)
+):
+    """
+    Get the candidate data for the email if provided, otherwise latest uploaded.
+    
+    Responses carry a content ETag; a matching If-None-Match gets a 304.
+    """
     try:
         client = get_mongodb_client()
         if client:
-            db = client['resume-shortlister']
+            db = client[MONGODB_DB]
             candidates_collection = db['candidates']
             if email:
                 latest = candidates_collection.find_one({"email": email})
@@ -928,23 +1569,25 @@ async def get_latest_candidate(email: Optional[str] = None):
             client.close()
             
             if latest:
-                return create_success_response(
-                    data={
-                        'id': str(latest.get('_id', '')),
-                        'name': latest.get('name', 'Unknown'),
-                        'email': latest.get('email', ''),
-                        'resumeText': latest.get('resumeText', '') or latest.get('resume_text', ''),
-                        'skills': latest.get('skills', []),
-                        'phone': latest.get('phone', ''),
-                        'experience': latest.get('experience', ''),
-                        'company': latest.get('company', ''),
-                        'uploadedAt': str(latest.get('uploadedAt', ''))
-                    }
-                )
+                data = {
+                    'id': str(latest.get('_id', '')),
+                    'name': latest.get('name', 'Unknown'),
+                    'email': latest.get('email', ''),
+                    'resumeText': latest.get('resumeText', '') or latest.get('resume_text', ''),
+                    'skills': latest.get('skills', []),
+                    'phone': latest.get('phone', ''),
+                    'experience': latest.get('experience', ''),
+                    'company': latest.get('company', ''),
+                    'uploadedAt': str(latest.get('uploadedAt', ''))
+                }
+                cached = not_modified(response, compute_etag(data), if_none_match, cache_control='private, no-cache')
+                if cached is not None:
+                    return cached
+                return create_success_response(data=data)
         
         return create_success_response(data={'name': 'Candidate', 'email': '', 'resumeText': '', 'skills': [], 'phone': '', 'experience': '', 'company': ''})
     except Exception as e:
-        logger.error(f"Error fetching latest candidate: {str(e)}")
+        logger.error("Error fetching latest candidate: %s", e)
         return create_success_response(data={'name': 'Candidate', 'email': '', 'resumeText': '', 'skills': [], 'phone': '', 'experience': '', 'company': ''})
 
 
@@ -955,16 +1598,21 @@ async def apply_job(request: ApplyJobRequest):
     Returns match percentage, matched skills, missing skills, and improvement suggestions.
     Also stores the application for the recruiter to see.
     """
+    return await run_blocking(_apply_job, request)
+
+
+def _apply_job(request: ApplyJobRequest):
+    """Score and store one job application (blocking; see apply_job)."""
     try:
         if not request.jobDescription or not request.jobDescription.strip():
             raise HTTPException(status_code=400, detail="Job description cannot be empty")
         
-        logger.info(f"Processing job application for {request.candidateName} - Job: {request.jobTitle}")
+        logger.info("Processing job application for %s - Job: %s", request.candidateName, request.jobTitle)
         
         try:
             nlp = get_nlp_processor()
         except Exception as e:
-            logger.error(f"NLP processor error: {str(e)}")
+            logger.error("NLP processor error: %s", e)
             raise HTTPException(status_code=500, detail=f"NLP initialization failed: {str(e)}")
         
         # Get job skills
@@ -974,7 +1622,7 @@ async def apply_job(request: ApplyJobRequest):
                 job_skills_data = nlp.extract_skills(request.jobDescription)
                 job_skills = job_skills_data.get('found_skills', [])
             except Exception as e:
-                logger.warning(f"Skill extraction failed: {str(e)}")
+                logger.warning("Skill extraction failed: %s", e)
                 job_skills = []
         
         # Get candidate resume and skills
@@ -984,50 +1632,35 @@ async def apply_job(request: ApplyJobRequest):
         if not resume_text or resume_text.strip() == "":
             resume_text = f"Candidate {request.candidateName}"
         
+        engine = ScoringEngine(nlp)
         try:
-            # Generate embeddings
-            job_embedding = nlp.get_embeddings([request.jobDescription])[0]
-            candidate_embedding = nlp.get_embeddings([resume_text])[0]
-            
-            # Calculate semantic similarity
-            semantic_score = float(np.dot(job_embedding, candidate_embedding) / (
-                np.linalg.norm(job_embedding) * np.linalg.norm(candidate_embedding) + 1e-10
-            ))
-            semantic_score = max(0.0, min(1.0, semantic_score))
+            semantic = engine.semantic_scores(request.jobDescription, [resume_text])
         except Exception as e:
-            logger.error(f"Embedding error: {str(e)}")
-            semantic_score = 0.5
+            logger.error("Embedding error: %s", e)
+            semantic = [0.5]
         
         try:
             # Extract skills using NLP
             candidate_skills_data = nlp.extract_skills(resume_text)
             candidate_skills_extracted = candidate_skills_data.get('found_skills', [])
         except Exception as e:
-            logger.warning(f"Candidate skill extraction failed: {str(e)}")
+            logger.warning("Candidate skill extraction failed: %s", e)
             candidate_skills_extracted = []
         
         # Combine all candidate skills
-        candidate_skills_lower = set([s.lower() for s in (candidate_skills or [])])
+        candidate_skills_lower = set(canonicalize_skills(candidate_skills or []))
         candidate_skills_extracted_lower = set([s.lower() for s in candidate_skills_extracted])
         all_candidate_skills = candidate_skills_lower.union(candidate_skills_extracted_lower)
         
-        # Find matched and missing skills
-        matched_skills = []
-        missing_skills = []
-        
-        if job_skills:
-            for job_skill in job_skills:
-                if job_skill.lower() in all_candidate_skills:
-                    matched_skills.append(job_skill)
-                else:
-                    missing_skills.append(job_skill)
-            skill_score = len(matched_skills) / len(job_skills) if job_skills else 0.0
-        else:
-            skill_score = 0.5
-        
         # Combine scores
-        final_score = (0.7 * semantic_score) + (0.3 * skill_score)
-        match_percentage = round(final_score * 100, 1)
+        score = engine.rank(
+            semantic, [job_skills], [all_candidate_skills], required_keys=[canonicalize_skills(job_skills)]
+        )[0]
+        matched_skills = score['matched_skills']
+        missing_skills = score['missing_skills']
+        semantic_score = score['semantic_score']
+        skill_score = score['skill_score']
+        match_percentage = round(score['final_score'] * 100, 1)
         
         # Generate improvement suggestions
         improvements = []
@@ -1043,60 +1676,38 @@ async def apply_job(request: ApplyJobRequest):
         try:
             client = get_mongodb_client()
             if client:
-                db = client['resume-shortlister']
+                db = client[MONGODB_DB]
                 applications_collection = db['applications']
                 
-                # Check for duplicate application (same candidate email + job ID)
-                import hashlib
-                duplicate_key = hashlib.md5(
-                    f"{request.candidateEmail.lower()}_{request.jobId}".encode()
-                ).hexdigest()
-                
-                existing_application = applications_collection.find_one({
-                    'duplicateKey': duplicate_key
-                })
+                # One application per candidate email + job ID
+                duplicate_key = application_duplicate_key(request.candidateEmail, request.jobId)
                 
-                if existing_application:
-                    # Update existing application instead of creating duplicate
-                    applications_collection.update_one(
-                        {'duplicateKey': duplicate_key},
-                        {
-                            '$set': {
-                                'matchPercentage': match_percentage,
-                                'matchedSkills': matched_skills,
-                                'missingSkills': missing_skills,
-                                'semanticScore': float(semantic_score),
-                                'skillScore': float(skill_score),
-                                'appliedAt': datetime.utcnow(),
-                                'updatedAt': datetime.utcnow()
-                            }
-                        }
-                    )
-                    logger.info(f"Updated existing application for {request.candidateEmail} - Job: {request.jobId}")
-                else:
-                    # Create new application
-                    application = {
+                result = upsert_application(
+                    applications_collection,
+                    duplicate_key,
+                    {
+                        'matchPercentage': match_percentage,
+                        'matchedSkills': matched_skills,
+                        'missingSkills': missing_skills,
+                        'semanticScore': float(semantic_score),
+                        'skillScore': float(skill_score)
+                    },
+                    {
                         'jobId': request.jobId,
                         'jobTitle': request.jobTitle,
                         'candidateId': request.candidateId,
                         'candidateName': request.candidateName,
                         'candidateEmail': request.candidateEmail,
-                        'matchPercentage': match_percentage,
-                        'matchedSkills': matched_skills,
-                        'missingSkills': missing_skills,
-                        'semanticScore': float(semantic_score),
-                        'skillScore': float(skill_score),
-                        'status': 'applied',
-                        'duplicateKey': duplicate_key,
-                        'appliedAt': datetime.utcnow(),
-                        'updatedAt': datetime.utcnow()
+                        'status': 'applied'
                     }
-                    
-                    result = applications_collection.insert_one(application)
-                    logger.info(f"Application stored with ID: {result.inserted_id}")
+                )
+                if result.upserted_id:
+                    logger.info("Application stored with ID: %s", result.upserted_id)
+                else:
+                    logger.info("Updated existing application for %s - Job: %s", request.candidateEmail, request.jobId)
                 client.close()
         except Exception as e:
-            logger.warning(f"Could not store application in database: {str(e)}")
+            logger.warning("Could not store application in database: %s", e)
         
         response_data = {
             'matchPercentage': match_percentage,
@@ -1110,14 +1721,14 @@ async def apply_job(request: ApplyJobRequest):
             'message': f"Your resume is {match_percentage}% matched to the {request.jobTitle} position."
         }
         
-        logger.info(f"Application processed - Match: {match_percentage}%")
+        logger.info("Application processed - Match: %s%%", match_percentage)
         return create_success_response(data=response_data)
         
     except HTTPException as e:
-        logger.error(f"HTTP Error in job application: {e.detail}")
+        logger.error("HTTP Error in job application: %s", e.detail)
         return create_error_response(error_code="HTTP_ERROR", error_message=str(e.detail))
     except Exception as e:
-        logger.error(f"Error applying for job: {str(e)}", exc_info=True)
+        logger.error("Error applying for job: %s", e, exc_info=True)
         return create_error_response(error_code="APPLICATION_ERROR", error_message="Error processing job application", details=str(e))
 
 
@@ -1148,13 +1759,13 @@ async def apply_job_with_resume(
         if not candidate_email or not candidate_email.strip():
             raise HTTPException(status_code=400, detail="Candidate email is required")
         
-        logger.info(f"Processing job application for {candidate_name} - Job: {job_title}")
+        logger.info("Processing job application for %s - Job: %s", candidate_name, job_title)
         
         # Initialize NLP processor
         try:
             nlp = get_nlp_processor()
         except Exception as e:
-            logger.error(f"NLP processor error: {str(e)}")
+            logger.error("NLP processor error: %s", e)
             raise HTTPException(status_code=500, detail=f"NLP initialization failed: {str(e)}")
         
         # Extract resume text from file if provided
@@ -1171,17 +1782,18 @@ async def apply_job_with_resume(
                     )
                 
                 # Read and extract text from resume file
-                file_content = await resume.read()
-                resume_text, file_type = extract_text_from_resume(file_content, resume.filename)
-                resume_text = clean_resume_text(resume_text)
+                ingested = await _ingest_single_upload(resume)
+                resume_text, file_type = await get_executors().parse_resume(ingested.file, resume.filename)
                 
                 # Extract skills from resume using NLP
-                candidate_skills_data = nlp.extract_skills(resume_text)
+                candidate_skills_data = await run_blocking(nlp.extract_skills, resume_text)
                 extracted_candidate_skills = candidate_skills_data.get('found_skills', [])
                 
-                logger.info(f"Extracted {len(extracted_candidate_skills)} skills from resume: {resume.filename}")
+                logger.info("Extracted %d skills from resume: %s", len(extracted_candidate_skills), resume.filename)
+            except HTTPException:
+                raise
             except Exception as e:
-                logger.error(f"Error processing resume file: {str(e)}")
+                logger.error("Error processing resume file: %s", e)
                 raise HTTPException(status_code=400, detail=f"Error processing resume: {str(e)}")
         else:
             # Use provided skills text if no file uploaded
@@ -1200,54 +1812,39 @@ async def apply_job_with_resume(
         # Extract job skills from description if not provided
         if not job_skills:
             try:
-                job_skills_data = nlp.extract_skills(job_description)
+                job_skills_data = await run_blocking(nlp.extract_skills, job_description)
                 job_skills = job_skills_data.get('found_skills', [])
             except Exception as e:
-                logger.warning(f"Skill extraction from job description failed: {str(e)}")
+                logger.warning("Skill extraction from job description failed: %s", e)
                 job_skills = []
         
         # Generate embeddings for semantic similarity
+        engine = ScoringEngine(nlp)
         try:
-            job_embedding = nlp.get_embeddings([job_description])[0]
-            candidate_embedding = nlp.get_embeddings([resume_text])[0]
-            
-            # Calculate semantic similarity
-            semantic_score = float(np.dot(job_embedding, candidate_embedding) / (
-                np.linalg.norm(job_embedding) * np.linalg.norm(candidate_embedding) + 1e-10
-            ))
-            semantic_score = max(0.0, min(1.0, semantic_score))
+            semantic = await run_blocking(engine.semantic_scores, job_description, [resume_text])
         except Exception as e:
-            logger.error(f"Embedding error: {str(e)}")
-            semantic_score = 0.5
+            logger.error("Embedding error: %s", e)
+            semantic = [0.5]
         
         # Extract additional skills from resume text using NLP
         if resume_text and not extracted_candidate_skills:
             try:
-                candidate_skills_data = nlp.extract_skills(resume_text)
+                candidate_skills_data = await run_blocking(nlp.extract_skills, resume_text)
                 extracted_candidate_skills = candidate_skills_data.get('found_skills', [])
             except Exception as e:
-                logger.warning(f"Candidate skill extraction failed: {str(e)}")
+                logger.warning("Candidate skill extraction failed: %s", e)
         
         # Combine all candidate skills (from file extraction + provided skills)
-        all_candidate_skills = set([s.lower() for s in extracted_candidate_skills])
-        
-        # Find matched and missing skills
-        matched_skills = []
-        missing_skills = []
+        all_candidate_skills = set(await run_blocking(canonicalize_skills, extracted_candidate_skills))
+        job_skill_keys = await run_blocking(canonicalize_skills, job_skills)
         
-        if job_skills:
-            for job_skill in job_skills:
-                if job_skill.lower() in all_candidate_skills:
-                    matched_skills.append(job_skill)
-                else:
-                    missing_skills.append(job_skill)
-            skill_score = len(matched_skills) / len(job_skills) if job_skills else 0.0
-        else:
-            skill_score = 0.5
-        
-        # Calculate final match percentage
-        final_score = (0.7 * semantic_score) + (0.3 * skill_score)
-        match_percentage = round(final_score * 100, 1)
+        # Combine scores
+        score = engine.rank(semantic, [job_skills], [all_candidate_skills], required_keys=[job_skill_keys])[0]
+        matched_skills = score['matched_skills']
+        missing_skills = score['missing_skills']
+        semantic_score = score['semantic_score']
+        skill_score = score['skill_score']
+        match_percentage = round(score['final_score'] * 100, 1)
         
         # Generate improvement suggestions
         improvements = []
@@ -1263,59 +1860,37 @@ async def apply_job_with_resume(
         try:
             client = get_mongodb_client()
             if client:
-                db = client['resume-shortlister']
+                db = client[MONGODB_DB]
                 applications_collection = db['applications']
                 
-                # Check for duplicate application (same candidate email + job ID)
-                import hashlib
-                duplicate_key = hashlib.md5(
-                    f"{candidate_email.lower()}_{job_id}".encode()
-                ).hexdigest()
+                # One application per candidate email + job ID
+                duplicate_key = application_duplicate_key(candidate_email, job_id)
                 
-                existing_application = applications_collection.find_one({
-                    'duplicateKey': duplicate_key
-                })
-                
-                if existing_application:
-                    # Update existing application instead of creating duplicate
-                    applications_collection.update_one(
-                        {'duplicateKey': duplicate_key},
-                        {
-                            '$set': {
-                                'matchPercentage': match_percentage,
-                                'matchedSkills': matched_skills,
-                                'missingSkills': missing_skills,
-                                'semanticScore': float(semantic_score),
-                                'skillScore': float(skill_score),
-                                'appliedAt': datetime.utcnow(),
-                                'updatedAt': datetime.utcnow()
-                            }
-                        }
-                    )
-                    logger.info(f"Updated existing application for {candidate_email} - Job: {job_id}")
-                else:
-                    # Create new application
-                    application = {
-                        'jobId': job_id,
-                        'jobTitle': job_title,
-                        'candidateId': f'candidate_{datetime.utcnow().timestamp()}',
-                        'candidateName': candidate_name,
-                        'candidateEmail': candidate_email,
+                result = upsert_application(
+                    applications_collection,
+                    duplicate_key,
+                    {
                         'matchPercentage': match_percentage,
                         'matchedSkills': matched_skills,
                         'missingSkills': missing_skills,
                         'semanticScore': float(semantic_score),
-                        'skillScore': float(skill_score),
-                        'duplicateKey': duplicate_key,  # For duplicate prevention
-                        'appliedAt': datetime.utcnow(),
-                        'updatedAt': datetime.utcnow()
+                        'skillScore': float(skill_score)
+                    },
+                    {
+                        'jobId': job_id,
+                        'jobTitle': job_title,
+                        'candidateId': f'candidate_{datetime.utcnow().timestamp()}',
+                        'candidateName': candidate_name,
+                        'candidateEmail': candidate_email
                     }
-                    
-                    result = applications_collection.insert_one(application)
-                    logger.info(f"Application stored with ID: {result.inserted_id}")
+                )
+                if result.upserted_id:
+                    logger.info("Application stored with ID: %s", result.upserted_id)
+                else:
+                    logger.info("Updated existing application for %s - Job: %s", candidate_email, job_id)
                 client.close()
         except Exception as e:
-            logger.warning(f"Could not store application in database: {str(e)}")
+            logger.warning("Could not store application in database: %s", e)
         
         response_data = {
             'matchPercentage': match_percentage,
@@ -1329,143 +1904,54 @@ async def apply_job_with_resume(
             'message': f"Your resume is {match_percentage}% matched to the {job_title} position."
         }
         
-        logger.info(f"Application processed - Match: {match_percentage}%")
+        logger.info("Application processed - Match: %s%%", match_percentage)
         return create_success_response(data=response_data)
         
     except HTTPException as e:
-        logger.error(f"HTTP Error in job application: {e.detail}")
+        logger.error("HTTP Error in job application: %s", e.detail)
         return create_error_response(error_code="HTTP_ERROR", error_message=str(e.detail))
     except Exception as e:
-        logger.error(f"Error applying for job: {str(e)}", exc_info=True)
+        logger.error("Error applying for job: %s", e, exc_info=True)
         return create_error_response(error_code="APPLICATION_ERROR", error_message="Error processing job application", details=str(e))
 
 
 @app.get("/api/explore-jobs")
-async def explore_jobs():
+async def explore_jobs(
+    response: Response,
+    page: Optional[int] = None,
+    page_size: Optional[int] = None,
+    if_none_match: Optional[str] = Header(None)
+):
     """
     Get all jobs for the Explore page with detailed information.
     Returns comprehensive job data including skills, requirements, and metadata.
+    
+    The job list and skills analysis are cached together for JOBS_CACHE_TTL
+    seconds. Responses carry an ETag; a matching If-None-Match gets a 304.
+    
+    Args:
+        page: 1-based page number (all jobs are returned when omitted)
+        page_size: Jobs per page (defaults to EXPLORE_PAGE_SIZE when paging)
+        if_none_match: ETag from a previous response
     """
     try:
-        # Try to fetch from Node.js backend first, then fallback to sample data
-        jobs_data = []
-        try:
-            import requests
-            response = requests.get('http://localhost:5000/api/jobs', timeout=5)
-            if response.status_code == 200:
-                jobs_data = response.json()
-                logger.info(f"Fetched {len(jobs_data)} jobs from Node.js backend")
-        except Exception as e:
-            logger.warning(f"Could not fetch jobs from Node.js backend: {str(e)}")
+        catalog = get_jobs_catalog()
+        snapshot = catalog.cached_snapshot()
+        if snapshot is None:
+            snapshot = await run_blocking(catalog.get_snapshot)
         
-        # Fallback to sample jobs if no backend available
-        if not jobs_data:
-            jobs_data = [
-                {
-                    "id": 1,
-                    "title": "Senior Python Developer",
-                    "company": "TechCorp Inc.",
-                    "location": "San Francisco, CA",
-                    "type": "Full-time",
-                    "experience": "Senior",
-                    "description": "We are looking for an experienced Python developer with expertise in Django, Flask, and cloud technologies. You will be working on scalable web applications and microservices architecture.",
-                    "requiredSkills": ["Python", "Django", "Flask", "PostgreSQL", "AWS", "Docker", "REST API"],
-                    "optionalSkills": ["React", "Redis", "Kubernetes", "GraphQL"],
-                    "salary": "$120,000 - $160,000",
-                    "posted": "2 days ago"
-                },
-                {
-                    "id": 2,
-                    "title": "Frontend React Developer",
-                    "company": "Digital Solutions Ltd",
-                    "location": "New York, NY",
-                    "type": "Full-time",
-                    "experience": "Mid-level",
-                    "description": "Join our frontend team to build amazing user interfaces using React, TypeScript, and modern CSS frameworks. Experience with state management and testing required.",
-                    "requiredSkills": ["React", "JavaScript", "TypeScript", "CSS", "HTML", "Redux"],
-                    "optionalSkills": ["Next.js", "Vue.js", "Angular", "Testing Libraries"],
-                    "salary": "$90,000 - $120,000",
-                    "posted": "1 week ago"
-                },
-                {
-                    "id": 3,
-                    "title": "Full Stack Node.js Engineer",
-                    "company": "StartupHub",
-                    "location": "Remote",
-                    "type": "Full-time",
-                    "experience": "Mid-level",
-                    "description": "Looking for a versatile Node.js developer who can handle both frontend and backend development. Experience with Express, MongoDB, and modern frontend frameworks required.",
-                    "requiredSkills": ["Node.js", "Express", "MongoDB", "JavaScript", "React", "REST API"],
-                    "optionalSkills": ["TypeScript", "PostgreSQL", "Docker", "AWS", "GraphQL"],
-                    "salary": "$100,000 - $140,000",
-                    "posted": "3 days ago"
-                },
-                {
-                    "id": 4,
-                    "title": "Data Science Engineer",
-                    "company": "AI Analytics Corp",
-                    "location": "Boston, MA",
-                    "type": "Full-time",
-                    "experience": "Senior",
-                    "description": "Seeking a data scientist with strong Python skills and experience in machine learning, deep learning, and big data technologies. PhD or Masters preferred.",
-                    "requiredSkills": ["Python", "Machine Learning", "TensorFlow", "SQL", "Statistics", "Data Analysis"],
-                    "optionalSkills": ["PyTorch", "Scikit-learn", "Big Data", "AWS", "Docker"],
-                    "salary": "$130,000 - $180,000",
-                    "posted": "1 day ago"
-                },
-                {
-                    "id": 5,
-                    "title": "DevOps Engineer",
-                    "company": "Cloud Systems Inc",
-                    "location": "Seattle, WA",
-                    "type": "Full-time",
-                    "experience": "Mid-level",
-                    "description": "We need a DevOps engineer to manage our cloud infrastructure, implement CI/CD pipelines, and ensure system reliability. Experience with AWS and containerization required.",
-                    "requiredSkills": ["AWS", "Docker", "Kubernetes", "CI/CD", "Linux", "Bash"],
-                    "optionalSkills": ["Terraform", "Ansible", "Monitoring Tools", "Networking"],
-                    "salary": "$110,000 - $150,000",
-                    "posted": "4 days ago"
-                },
-                {
-                    "id": 6,
-                    "title": "Mobile React Native Developer",
-                    "company": "AppWorks Studio",
-                    "location": "Austin, TX",
-                    "type": "Full-time",
-                    "experience": "Mid-level",
-                    "description": "Create amazing mobile experiences using React Native. You'll work on iOS and Android apps, collaborate with designers, and implement best practices for mobile development.",
-                    "requiredSkills": ["React Native", "JavaScript", "React", "Mobile Development", "iOS", "Android"],
-                    "optionalSkills": ["TypeScript", "Redux", "Native Modules", "Performance Optimization"],
-                    "salary": "$95,000 - $130,000",
-                    "posted": "5 days ago"
-                }
-            ]
+        jobs_data = snapshot['jobs']
+        skills_analysis = snapshot['skills']
         
-        # Extract all unique skills from jobs for skills analysis
-        all_skills = set()
-        for job in jobs_data:
-            if job.get('requiredSkills'):
-                all_skills.update(job['requiredSkills'])
-            if job.get('optionalSkills'):
-                all_skills.update(job['optionalSkills'])
-        
-        # Create skills analysis data
-        skills_analysis = []
-        for skill in all_skills:
-            required_count = sum(1 for job in jobs_data if job.get('requiredSkills') and skill in job['requiredSkills'])
-            optional_count = sum(1 for job in jobs_data if job.get('optionalSkills') and skill in job['optionalSkills'])
-            total_count = required_count + optional_count
-            
-            skills_analysis.append({
-                "name": skill,
-                "requiredIn": required_count,
-                "optionalIn": optional_count,
-                "totalJobs": total_count,
-                "importance": "core" if required_count > total_count * 0.5 else "optional"
-            })
+        etag = snapshot['etag']
+        if page is not None or page_size is not None:
+            page = max(page or 1, 1)
+            page_size = min(max(page_size or EXPLORE_PAGE_SIZE, 1), EXPLORE_MAX_PAGE_SIZE)
+            etag = f'{etag[:-1]}-{page}-{page_size}"'
         
-        # Sort skills by total jobs
-        skills_analysis.sort(key=lambda x: x['totalJobs'], reverse=True)
+        cached = not_modified(response, etag, if_none_match)
+        if cached is not None:
+            return cached
         
         response_data = {
             "jobs": jobs_data,
@@ -1473,6 +1959,14 @@ async def explore_jobs():
             "totalJobs": len(jobs_data),
             "totalSkills": len(skills_analysis)
         }
+        if page is not None:
+            start = (page - 1) * page_size
+            response_data.update({
+                "jobs": jobs_data[start:start + page_size],
+                "page": page,
+                "pageSize": page_size,
+                "totalPages": (len(jobs_data) + page_size - 1) // page_size
+            })
         
         return create_success_response(
             data=response_data,
@@ -1480,7 +1974,7 @@ async def explore_jobs():
         )
         
     except Exception as e:
-        logger.error(f"Error fetching explore jobs: {str(e)}")
+        logger.error("Error fetching explore jobs: %s", e)
         return create_error_response(
             error_code="EXPLORE_JOBS_ERROR",
             error_message="Error fetching jobs and skills data",
@@ -1510,34 +2004,16 @@ async def register_candidate(
         Success message and candidate data
     """
     try:
-        client = get_mongodb_client()
+        client = await run_blocking(get_mongodb_client)
         if not client:
             raise HTTPException(
                 status_code=500,
                 detail="Database connection failed"
             )
         
-        db = client['resume-shortlister']
+        db = client[MONGODB_DB]
         candidates_collection = db["candidates"]
         
-        # Check if candidate already exists
-        existing_candidate = candidates_collection.find_one({"email": email})
-        if existing_candidate:
-            return {
-                "status": "success",
-                "message": "Candidate already exists",
-                "data": {
-                    "name": existing_candidate.get("name", ""),
-                    "email": existing_candidate.get("email", ""),
-                    "phone": existing_candidate.get("phone", ""),
-                    "experience": existing_candidate.get("experience", ""),
-                    "company": existing_candidate.get("company", ""),
-                    "skills": existing_candidate.get("skills", []),
-                    "uploadedAt": existing_candidate.get("uploadedAt"),
-                    "updatedAt": existing_candidate.get("updatedAt")
-                }
-            }
-        
         # Create new candidate record
         candidate_data = {
             "name": name,
@@ -1551,34 +2027,54 @@ async def register_candidate(
             "updatedAt": datetime.utcnow()
         }
         
-        # Insert candidate into database
-        result = candidates_collection.insert_one(candidate_data)
-        
-        if result.inserted_id:
+        # Insert unless the email is already registered, in one atomic round trip.
+        # Returns the existing document, or None if this call inserted it.
+        existing_candidate = await run_blocking(
+            retry_on_duplicate_key,
+            lambda: candidates_collection.find_one_and_update(
+                {"email": email},
+                {"$setOnInsert": candidate_data},
+                upsert=True,
+                return_document=ReturnDocument.BEFORE
+            )
+        )
+        if existing_candidate:
             return {
                 "status": "success",
-                "message": "Candidate registered successfully",
+                "message": "Candidate already exists",
                 "data": {
-                    "name": name,
-                    "email": email,
-                    "phone": phone,
-                    "experience": experience,
-                    "company": company,
-                    "skills": [],
-                    "uploadedAt": candidate_data["uploadedAt"],
-                    "updatedAt": candidate_data["updatedAt"]
+                    "name": existing_candidate.get("name", ""),
+                    "email": existing_candidate.get("email", ""),
+                    "phone": existing_candidate.get("phone", ""),
+                    "experience": existing_candidate.get("experience", ""),
+                    "company": existing_candidate.get("company", ""),
+                    "skills": existing_candidate.get("skills", []),
+                    "uploadedAt": existing_candidate.get("uploadedAt"),
+                    "updatedAt": existing_candidate.get("updatedAt")
                 }
             }
-        else:
-            raise HTTPException(
-                status_code=500,
-                detail="Failed to register candidate"
-            )
+        
+        _index_candidate(candidate_data)
+        
+        return {
+            "status": "success",
+            "message": "Candidate registered successfully",
+            "data": {
+                "name": name,
+                "email": email,
+                "phone": phone,
+                "experience": experience,
+                "company": company,
+                "skills": [],
+                "uploadedAt": candidate_data["uploadedAt"],
+                "updatedAt": candidate_data["updatedAt"]
+            }
+        }
             
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error registering candidate: {str(e)}")
+        logger.error("Error registering candidate: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Registration failed: {str(e)}"
@@ -1614,14 +2110,14 @@ async def update_candidate(
         Updated candidate profile data
     """
     try:
-        client = get_mongodb_client()
+        client = await run_blocking(get_mongodb_client)
         if not client:
             raise HTTPException(
                 status_code=500,
                 detail="Database connection failed"
             )
         
-        db = client['resume-shortlister']
+        db = client[MONGODB_DB]
         candidates_collection = db['candidates']
         
         # Parse skills
@@ -1632,29 +2128,36 @@ async def update_candidate(
         # Process resume if uploaded
         resume_text = ""
         extracted_skills = []
+        resume_signature = None
         
         if resume:
+            # Oversize files are rejected rather than silently skipped like unparseable ones
+            ingested = await _ingest_single_upload(resume)
             try:
-                # Read and process resume file
-                resume_content = await resume.read()
-                
                 # Extract text from resume
-                resume_text = extract_text_from_resume(resume_content, resume.filename)
-                resume_text = clean_resume_text(resume_text)
+                resume_text, _ = await get_executors().parse_resume(ingested.file, resume.filename)
+                resume_signature = await run_blocking(get_minhasher().signature, resume_text)
                 
                 # Extract skills using NLP
                 nlp = get_nlp_processor()
-                skills_data = nlp.extract_skills(resume_text)
+                skills_data = await run_blocking(nlp.extract_skills, resume_text)
                 extracted_skills = skills_data.get('found_skills', [])
                 
+                # Share the resume embedding with matching in every worker
+                resume_embedding = (await run_blocking(nlp.get_embeddings, [resume_text]))[0]
+                try:
+                    await run_blocking(get_embedding_index().add, content_hash(resume_text), resume_embedding)
+                except (OSError, ValueError) as e:
+                    logger.warning("Could not update the embedding index: %s", e)
+                
                 # Combine manual skills and extracted skills
                 all_skills = list(set(skills_list + extracted_skills))
                 skills_list = all_skills
                 
-                logger.info(f"Processed resume for {name}: extracted {len(extracted_skills)} skills")
+                logger.info("Processed resume for %s: extracted %d skills", name, len(extracted_skills))
                 
             except Exception as e:
-                logger.error(f"Error processing resume: {str(e)}")
+                logger.error("Error processing resume: %s", e)
                 # Continue without resume processing
         
         # Update candidate in database
@@ -1670,31 +2173,43 @@ async def update_candidate(
             "updatedAt": datetime.utcnow()
         }
         
-        # Find and update existing candidate by email
-        existing_candidate = candidates_collection.find_one({"email": email})
+        update_data["canonicalSkills"] = sorted(set(await run_blocking(canonicalize_skills, skills_list)))
         
-        if existing_candidate:
-            # Update existing candidate
-            candidates_collection.update_one(
+        # Flag resumes that nearly match another candidate's (e.g. the same person re-registering)
+        duplicate = None
+        if resume_signature is not None:
+            # The first call loads every stored signature
+            duplicate_index = await run_blocking(get_candidate_index, candidates_collection)
+            duplicate = duplicate_index.query(resume_signature, exclude=email)
+            update_data["resumeSignature"] = resume_signature.tolist()
+        
+        # Update the candidate by email, creating it if not found
+        candidate = await run_blocking(
+            retry_on_duplicate_key,
+            lambda: candidates_collection.find_one_and_update(
                 {"email": email},
-                {"$set": update_data}
-            )
-            update_data["_id"] = str(existing_candidate["_id"])
-        else:
-            # Create new candidate if not found
-            result = candidates_collection.insert_one(update_data)
-            update_data["_id"] = str(result.inserted_id)
-        
-        # Calculate candidate score
-        if skills_list:
-            scorer = CandidateScorer()
-            score_data = scorer.calculate_candidate_score(
-                skills=skills_list,
-                resume_text=resume_text
+                {"$set": update_data},
+                projection={"_id": 1},
+                upsert=True,
+                return_document=ReturnDocument.AFTER
             )
-            update_data.update(score_data)
+        )
+        update_data["_id"] = str(candidate["_id"])
         
-        logger.info(f"Successfully updated candidate profile: {name} ({email})")
+        _index_candidate(update_data)
+        skill_index = get_skill_index()
+        if skill_index.loaded:
+            skill_index.add(email, update_data["canonicalSkills"])
+        
+        if resume_signature is not None:
+            duplicate_index.add(email, resume_signature)
+            del update_data["resumeSignature"]
+            update_data["possibleDuplicateOf"] = duplicate[0] if duplicate else None
+            update_data["duplicateSimilarity"] = round(duplicate[1], 4) if duplicate else None
+            if duplicate:
+                logger.info("Resume for %s nearly matches %s (%.2f)", email, duplicate[0], duplicate[1])
+        
+        logger.info("Successfully updated candidate profile: %s (%s)", name, email)
         
         return create_success_response(
             data=update_data,
@@ -1702,10 +2217,10 @@ async def update_candidate(
         )
         
     except HTTPException as e:
-        logger.error(f"HTTP Error in candidate update: {e.detail}")
+        logger.error("HTTP Error in candidate update: %s", e.detail)
         return create_error_response(error_code="HTTP_ERROR", error_message=str(e.detail))
     except Exception as e:
-        logger.error(f"Error updating candidate: {str(e)}", exc_info=True)
+        logger.error("Error updating candidate: %s", e, exc_info=True)
         return create_error_response(
             error_code="CANDIDATE_UPDATE_ERROR",
             error_message="Error updating candidate profile",
@@ -1714,52 +2229,22 @@ async def update_candidate(
 
 
 @app.get("/api/job-applications/{job_id}")
-async def get_job_applications(job_id: str):
+async def get_job_applications(
+    job_id: str,
+    response: Response,
+    if_none_match: Optional[str] = Header(None)
+):
     """
     Get all applications for a specific job (for recruiter dashboard).
+    
+    Responses carry a content ETag; a matching If-None-Match gets a 304.
     """
     try:
-        client = get_mongodb_client()
-        if client:
-            db = client['resume-shortlister']
-            applications_collection = db['applications']
-            
-            applications = list(applications_collection.find({'jobId': job_id}))
-            
-            # Enrich with candidate phone/experience from candidates collection
-            candidates_collection = db['candidates']
-            for app in applications:
-                candidate = candidates_collection.find_one({'email': app.get('candidateEmail', '')})
-                if candidate:
-                    app['phone'] = candidate.get('phone', '')
-                    app['experience'] = candidate.get('experience', '')
-                else:
-                    app['phone'] = ''
-                    app['experience'] = ''
-            
-            client.close()
-            
-            # Convert ObjectId to string for JSON serialization
-            applications = [
-                {
-                    'candidateName': app.get('candidateName', ''),
-                    'candidateEmail': app.get('candidateEmail', ''),
-                    'phone': app.get('phone', ''),
-                    'experience': app.get('experience', ''),
-                    'status': app.get('status', 'applied'),
-                    'matchPercentage': app.get('matchPercentage', 0),
-                    'matchedSkills': app.get('matchedSkills', []),
-                    'missingSkills': app.get('missingSkills', []),
-                    'semanticScore': app.get('semanticScore', 0),
-                    'skillScore': app.get('skillScore', 0),
-                    'appliedAt': str(app.get('appliedAt', '')),
-                    '_id': str(app.get('_id', ''))
-                } for app in applications
-            ]
-            
-            # Sort by match percentage (descending)
-            applications.sort(key=lambda x: x.get('matchPercentage', 0), reverse=True)
-            
+        applications = await run_blocking(_job_applications, job_id)
+        if applications is not None:
+            cached = not_modified(response, compute_etag(applications), if_none_match, cache_control='private, no-cache')
+            if cached is not None:
+                return cached
             return create_success_response(
                 data=applications,
                 message=f"Found {len(applications)} applications for job"
@@ -1767,89 +2252,161 @@ async def get_job_applications(job_id: str):
         
         return create_success_response(data=[])
     except Exception as e:
-        logger.error(f"Error fetching job applications: {str(e)}")
+        logger.error("Error fetching job applications: %s", e)
         return create_error_response(error_code="FETCH_ERROR", error_message="Error fetching applications", details=str(e))
 
 
+def _job_applications(job_id: str) -> Optional[List[dict]]:
+    """
+    A job's applications, best match first, with candidate phone/experience (blocking).
+    
+    Returns:
+        Formatted applications, or None if the database is unavailable
+    """
+    client = get_mongodb_client()
+    if not client:
+        return None
+    try:
+        db = client[MONGODB_DB]
+        
+        # Served by the {jobId, matchPercentage} index, already in display order
+        applications = list(db['applications'].find({'jobId': job_id}).sort('matchPercentage', -1))
+        
+        # Enrich with candidate phone/experience in one query for all applicants
+        emails = list({app.get('candidateEmail', '') for app in applications})
+        candidates = {
+            candidate.get('email'): candidate
+            for candidate in db['candidates'].find(
+                {'email': {'$in': emails}},
+                {'email': 1, 'phone': 1, 'experience': 1}
+            )
+        } if emails else {}
+    finally:
+        client.close()
+    
+    formatted = []
+    for app in applications:
+        candidate = candidates.get(app.get('candidateEmail', ''), {})
+        formatted.append({
+            'candidateName': app.get('candidateName', ''),
+            'candidateEmail': app.get('candidateEmail', ''),
+            'phone': candidate.get('phone', ''),
+            'experience': candidate.get('experience', ''),
+            'status': app.get('status', 'applied'),
+            'matchPercentage': app.get('matchPercentage', 0),
+            'matchedSkills': app.get('matchedSkills', []),
+            'missingSkills': app.get('missingSkills', []),
+            'semanticScore': app.get('semanticScore', 0),
+            'skillScore': app.get('skillScore', 0),
+            'appliedAt': str(app.get('appliedAt', '')),
+            '_id': str(app.get('_id', ''))
+        })
+    return formatted
+
+
 @app.get("/api/candidate-applications")
-async def get_candidate_applications(email: str = None):
+async def get_candidate_applications(
+    response: Response,
+    email: str = None,
+    if_none_match: Optional[str] = Header(None)
+):
     """
     Get all applications for a specific candidate by email.
+    
+    Responses carry a content ETag; a matching If-None-Match gets a 304.
     """
     try:
         if not email:
             return create_error_response(error_code="MISSING_EMAIL", error_message="Email parameter is required")
         
-        client = get_mongodb_client()
-        if client:
-            db = client['resume-shortlister']
-            applications_collection = db['applications']
-            jobs_collection = db['jobs']
-            
-            applications = list(applications_collection.find({'candidateEmail': email}))
-            
-            enriched_applications = []
-            for app in applications:
-                job = jobs_collection.find_one({'id': app.get('jobId', '')})
-                if job:
-                    enriched_app = {
-                        'jobTitle': job.get('title', 'N/A'),
-                        'company': job.get('company', 'N/A'),
-                        'location': job.get('location', 'N/A'),
-                        'jobDescription': job.get('description', ''),
-                        'requiredSkills': job.get('requiredSkills', []),
-                        'optionalSkills': job.get('optionalSkills', []),
-                        'type': job.get('type', 'N/A'),
-                        'experience': job.get('experience', 'N/A'),
-                        'salary': job.get('salary', 'N/A'),
-                        'posted': job.get('posted', 'N/A'),
-                        'jobId': app.get('jobId', ''),
-                        'appliedAt': app.get('appliedAt', ''),
-                        'status': app.get('status', 'applied'),
-                        'matchPercentage': app.get('matchPercentage', 0),
-                        'matchedSkills': app.get('matchedSkills', []),
-                        'missingSkills': app.get('missingSkills', []),
-                        'semanticScore': app.get('semanticScore', 0),
-                        'skillScore': app.get('skillScore', 0)
-                    }
-                else:
-                    enriched_app = {
-                        'jobTitle': app.get('jobTitle', 'N/A'),
-                        'company': 'N/A',
-                        'location': 'N/A',
-                        'jobDescription': '',
-                        'requiredSkills': [],
-                        'optionalSkills': [],
-                        'type': 'N/A',
-                        'experience': 'N/A',
-                        'salary': 'N/A',
-                        'posted': 'N/A',
-                        'jobId': app.get('jobId', ''),
-                        'appliedAt': app.get('appliedAt', ''),
-                        'status': app.get('status', 'applied'),
-                        'matchPercentage': app.get('matchPercentage', 0),
-                        'matchedSkills': app.get('matchedSkills', []),
-                        'missingSkills': app.get('missingSkills', []),
-                        'semanticScore': app.get('semanticScore', 0),
-                        'skillScore': app.get('skillScore', 0)
-                    }
-                enriched_applications.append(enriched_app)
-            
-            client.close()
-            
-            enriched_applications.sort(key=lambda x: x.get('appliedAt', ''), reverse=True)
-            
+        enriched_applications = await run_blocking(_candidate_applications, email)
+        if enriched_applications is not None:
+            data = {'applications': enriched_applications}
+            cached = not_modified(response, compute_etag(data), if_none_match, cache_control='private, no-cache')
+            if cached is not None:
+                return cached
             return create_success_response(
-                data={'applications': enriched_applications},
+                data=data,
                 message=f"Found {len(enriched_applications)} applications"
             )
         
         return create_success_response(data={'applications': []})
     except Exception as e:
-        logger.error(f"Error fetching candidate applications: {str(e)}")
+        logger.error("Error fetching candidate applications: %s", e)
         return create_error_response(error_code="FETCH_ERROR", error_message="Error fetching applications", details=str(e))
 
 
+def _candidate_applications(email: str) -> Optional[List[dict]]:
+    """
+    A candidate's applications, newest first, with their jobs' details (blocking).
+    
+    Returns:
+        Enriched applications, or None if the database is unavailable
+    """
+    client = get_mongodb_client()
+    if not client:
+        return None
+    try:
+        db = client[MONGODB_DB]
+        applications = list(db['applications'].find({'candidateEmail': email}))
+        
+        # Every applied-to job in one query
+        job_ids = list({app.get('jobId', '') for app in applications})
+        jobs = {job.get('id'): job for job in db['jobs'].find({'id': {'$in': job_ids}})} if job_ids else {}
+    finally:
+        client.close()
+    
+    enriched_applications = []
+    for app in applications:
+        job = jobs.get(app.get('jobId', ''))
+        if job:
+            enriched_app = {
+                'jobTitle': job.get('title', 'N/A'),
+                'company': job.get('company', 'N/A'),
+                'location': job.get('location', 'N/A'),
+                'jobDescription': job.get('description', ''),
+                'requiredSkills': job.get('requiredSkills', []),
+                'optionalSkills': job.get('optionalSkills', []),
+                'type': job.get('type', 'N/A'),
+                'experience': job.get('experience', 'N/A'),
+                'salary': job.get('salary', 'N/A'),
+                'posted': job.get('posted', 'N/A'),
+                'jobId': app.get('jobId', ''),
+                'appliedAt': app.get('appliedAt', ''),
+                'status': app.get('status', 'applied'),
+                'matchPercentage': app.get('matchPercentage', 0),
+                'matchedSkills': app.get('matchedSkills', []),
+                'missingSkills': app.get('missingSkills', []),
+                'semanticScore': app.get('semanticScore', 0),
+                'skillScore': app.get('skillScore', 0)
+            }
+        else:
+            enriched_app = {
+                'jobTitle': app.get('jobTitle', 'N/A'),
+                'company': 'N/A',
+                'location': 'N/A',
+                'jobDescription': '',
+                'requiredSkills': [],
+                'optionalSkills': [],
+                'type': 'N/A',
+                'experience': 'N/A',
+                'salary': 'N/A',
+                'posted': 'N/A',
+                'jobId': app.get('jobId', ''),
+                'appliedAt': app.get('appliedAt', ''),
+                'status': app.get('status', 'applied'),
+                'matchPercentage': app.get('matchPercentage', 0),
+                'matchedSkills': app.get('matchedSkills', []),
+                'missingSkills': app.get('missingSkills', []),
+                'semanticScore': app.get('semanticScore', 0),
+                'skillScore': app.get('skillScore', 0)
+            }
+        enriched_applications.append(enriched_app)
+    
+    enriched_applications.sort(key=lambda x: x.get('appliedAt', ''), reverse=True)
+    return enriched_applications
+
+
 @app.post("/api/withdraw-application")
 async def withdraw_application(request: dict):
     """
@@ -1864,7 +2421,7 @@ async def withdraw_application(request: dict):
         
         client = get_mongodb_client()
         if client:
-            db = client['resume-shortlister']
+            db = client[MONGODB_DB]
             applications_collection = db['applications']
             
             result = applications_collection.delete_one({
@@ -1881,7 +2438,7 @@ async def withdraw_application(request: dict):
         
         return create_error_response(error_code="DB_ERROR", error_message="Database connection failed")
     except Exception as e:
-        logger.error(f"Error withdrawing application: {str(e)}")
+        logger.error("Error withdrawing application: %s", e)
         return create_error_response(error_code="WITHDRAW_ERROR", error_message="Error withdrawing application", details=str(e))
 
 
@@ -1904,7 +2461,7 @@ async def update_application_status(request: dict):
         
         client = get_mongodb_client()
         if client:
-            db = client['resume-shortlister']
+            db = client[MONGODB_DB]
             applications_collection = db['applications']
             
             result = applications_collection.update_one(
@@ -1929,7 +2486,7 @@ async def update_application_status(request: dict):
         
         return create_error_response(error_code="DB_ERROR", error_message="Database connection failed")
     except Exception as e:
-        logger.error(f"Error updating application status: {str(e)}")
+        logger.error("Error updating application status: %s", e)
         return create_error_response(error_code="UPDATE_ERROR", error_message="Error updating application status", details=str(e))
 
 
@@ -1948,63 +2505,145 @@ async def export_candidates(request: ExportCandidatesRequest):
         if not request.candidates:
             raise HTTPException(status_code=400, detail="No candidates to export")
         
-        # Prepare data for Excel
-        rows = []
-        for c in request.candidates:
-            rows.append({
-                'Name': c.get('candidateName', ''),
-                'Email': c.get('candidateEmail', ''),
-                'Phone': c.get('phone', ''),
-                'Experience': c.get('experience', ''),
-                'Current Status': c.get('status', 'applied').replace('_', ' ').title() if c.get('status') else 'Applied',
-                'Match %': f"{c.get('matchPercentage', 0):.1f}%",
-                'Matched Skills': ', '.join(c.get('matchedSkills', [])),
-                'Missing Skills': ', '.join(c.get('missingSkills', [])),
-                'Semantic Score': f"{c.get('semanticScore', 0)*100:.1f}%" if c.get('semanticScore') else '',
-                'Skill Score': f"{c.get('skillScore', 0)*100:.1f}%" if c.get('skillScore') else '',
-                'Applied At': c.get('appliedAt', '')
-            })
-        
-        # Create DataFrame
-        df = pd.DataFrame(rows)
+        rows = [format_export_row(c) for c in request.candidates]
+        filename = safe_export_filename(request.jobTitle, 'xlsx')
         
-        # Write Excel to BytesIO
-        output = io.BytesIO()
         try:
-            with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
-                df.to_excel(writer, index=False, sheet_name='Candidates')
-                worksheet = writer.sheets['Candidates']
-                
-                # Auto-adjust column widths
-                for idx, col in enumerate(df.columns):
-                    series = df[col]
-                    max_len = max(
-                        series.astype(str).map(len).max(),
-                        len(str(col))
-                    ) + 2
-                    worksheet.set_column(idx, idx, max_len)
+            path = await run_blocking(_write_export_file, write_xlsx, rows, '.xlsx')
         except Exception as excel_err:
-            logger.error(f"Excel generation error: {excel_err}")
+            logger.error("Excel generation error: %s", excel_err)
             raise HTTPException(status_code=500, detail=f"Excel generation failed: {excel_err}")
         
-        output.seek(0)
+        return FileResponse(
+            path,
+            media_type=EXPORT_FORMATS['xlsx'],
+            filename=filename,
+            background=BackgroundTask(os.remove, path)
+        )
         
-        # Sanitize filename: replace non-ASCII with underscores and remove special chars
-        import re
-        safe_title = re.sub(r'[^\x00-\x7F]+', '_', request.jobTitle)
-        safe_title = re.sub(r'[\\/*?:"<>|]', '_', safe_title)
-        filename = f"{safe_title.strip('_')}_candidates.xlsx"
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error("Error exporting candidates: %s", e, exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Export failed: {str(e)}")
+
+
+def _write_export_file(writer, rows, suffix: str) -> str:
+    """Run an exporter into a new temporary file and return its path."""
+    fd, path = tempfile.mkstemp(suffix=suffix)
+    os.close(fd)
+    try:
+        writer(rows, path)
+    except Exception:
+        os.remove(path)
+        raise
+    return path
+
+
+def _iter_job_application_rows(client, job_id: str):
+    """
+    Yield export rows for a job's applications straight from a Mongo cursor.
+
+    Candidate phone/experience are looked up with one query per chunk of
+    applications, and the client is closed when iteration finishes.
+    """
+    try:
+        db = client[MONGODB_DB]
+        cursor = db['applications'].find(
+            {'jobId': job_id},
+            {
+                'candidateName': 1, 'candidateEmail': 1, 'status': 1,
+                'matchPercentage': 1, 'matchedSkills': 1, 'missingSkills': 1,
+                'semanticScore': 1, 'skillScore': 1, 'appliedAt': 1
+            }
+        ).sort('matchPercentage', -1).batch_size(EXPORT_CHUNK_ROWS)
+        
+        chunk = []
+        for application in cursor:
+            chunk.append(application)
+            if len(chunk) >= EXPORT_CHUNK_ROWS:
+                yield from _enriched_export_rows(db, chunk)
+                chunk = []
+        if chunk:
+            yield from _enriched_export_rows(db, chunk)
+    finally:
+        client.close()
+
+
+def _enriched_export_rows(db, applications: List[dict]):
+    """Add candidate phone/experience to a chunk of applications and format them."""
+    emails = list({a.get('candidateEmail', '') for a in applications})
+    candidates = {
+        c.get('email'): c
+        for c in db['candidates'].find(
+            {'email': {'$in': emails}},
+            {'email': 1, 'phone': 1, 'experience': 1}
+        )
+    }
+    for application in applications:
+        candidate = candidates.get(application.get('candidateEmail', ''), {})
+        application['phone'] = candidate.get('phone', '')
+        application['experience'] = candidate.get('experience', '')
+        yield format_export_row(application)
+
+
+@app.get("/api/export-applications/{job_id}")
+async def export_job_applications(job_id: str, format: str = "xlsx"):
+    """
+    Export all applications for a job without the client sending them back.
+    
+    Rows are streamed from the database cursor: CSV is sent chunk by chunk,
+    XLSX (constant_memory mode) and Parquet are written to a temporary file
+    and streamed from disk, so memory does not grow with the applicant count.
+    
+    Args:
+        job_id: Job identifier
+        format: One of "xlsx", "csv" or "parquet"
         
-        return StreamingResponse(
-            io.BytesIO(output.getvalue()),
-            media_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
-            headers={'Content-Disposition': f'attachment; filename={filename}'}
+    Returns:
+        File download as a streaming response
+    """
+    if format not in EXPORT_FORMATS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported export format. Allowed: {', '.join(EXPORT_FORMATS)}"
         )
+    
+    client = get_mongodb_client()
+    if not client:
+        raise HTTPException(status_code=500, detail="Database connection failed")
+    
+    try:
+        first = client[MONGODB_DB]['applications'].find_one({'jobId': job_id}, {'jobTitle': 1})
+        title = (first or {}).get('jobTitle') or f"job_{job_id}"
+        filename = safe_export_filename(title, format)
+        rows = _iter_job_application_rows(client, job_id)
+        
+        if format == 'csv':
+            return StreamingResponse(
+                iter_csv(rows),
+                media_type=EXPORT_FORMATS['csv'],
+                headers={'Content-Disposition': f'attachment; filename={filename}'}
+            )
         
+        writer = write_xlsx if format == 'xlsx' else write_parquet
+        try:
+            path = await run_blocking(_write_export_file, writer, rows, f'.{format}')
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        
+        return FileResponse(
+            path,
+            media_type=EXPORT_FORMATS[format],
+            filename=filename,
+            background=BackgroundTask(os.remove, path)
+        )
     except HTTPException:
+        client.close()
         raise
     except Exception as e:
-        logger.error(f"Error exporting candidates: {str(e)}", exc_info=True)
+        client.close()
+        logger.error("Error exporting applications for job %s: %s", job_id, e, exc_info=True)
         raise HTTPException(status_code=500, detail=f"Export failed: {str(e)}")
 
 
@@ -0,0 +1,204 @@
+"""In-process BM25 inverted index over candidate resume text."""
+
+import logging
+import math
+import re
+import threading
+from collections import Counter
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+from .config import BM25_K1, BM25_B
+
+logger = logging.getLogger(__name__)
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9]+)*")
+
+# Frequent English words that carry no signal for matching resumes to jobs
+STOPWORDS = frozenset("""
+a an and are as at be by for from has have in is it its of on or our that the their this to
+was we were will with you your who which experience years year working work
+""".split())
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercase search terms.
+
+    Keeps tokens such as "c++", "c#" and "node.js" intact and drops stopwords.
+
+    Args:
+        text: Resume or job description text
+
+    Returns:
+        List of terms in document order
+    """
+    return [token for token in _TOKEN_PATTERN.findall(text.lower()) if token not in STOPWORDS]
+
+
+class BM25Index:
+    """
+    Inverted index with Okapi BM25 scoring, updated one document at a time.
+
+    Documents are keyed by an external key (the candidate email). Each
+    process holds its own index. It is loaded from MongoDB on first use and
+    kept current by the endpoints that write candidate text. It is rebuilt
+    (see reload) when other processes change the collection.
+    """
+
+    def __init__(self, k1: float = BM25_K1, b: float = BM25_B):
+        """
+        Args:
+            k1: Term frequency saturation
+            b: Document length normalization
+        """
+        self.k1 = k1
+        self.b = b
+        self.loaded = False
+        self._lock = threading.RLock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._postings: Dict[str, Dict[int, int]] = {}
+        self._doc_terms: Dict[int, Counter] = {}
+        self._doc_keys: List[str] = []
+        self._doc_ids: Dict[str, int] = {}
+        self._doc_lengths: List[int] = []
+        self._free_ids: List[int] = []
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self._doc_ids)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._doc_ids
+
+    def reload(self, documents: Iterable[Tuple[str, str]]) -> None:
+        """
+        Rebuild the index from documents, swapping the new contents in when done.
+
+        Searches during the rebuild see the previous contents.
+
+        Args:
+            documents: Iterable of (key, text)
+        """
+        fresh = BM25Index(self.k1, self.b)
+        for key, text in documents:
+            fresh._add_locked(key, text)
+        with self._lock:
+            self._postings = fresh._postings
+            self._doc_terms = fresh._doc_terms
+            self._doc_keys = fresh._doc_keys
+            self._doc_ids = fresh._doc_ids
+            self._doc_lengths = fresh._doc_lengths
+            self._free_ids = fresh._free_ids
+            self._total_length = fresh._total_length
+            self.loaded = True
+        logger.info("Loaded %d documents into the BM25 index", len(fresh))
+
+    def invalidate(self) -> None:
+        """Drop all documents; the next search rebuilds the index from the collection."""
+        with self._lock:
+            self._reset()
+            self.loaded = False
+
+    def add(self, key: str, text: str) -> None:
+        """
+        Index a document, replacing any earlier version stored under the same key.
+
+        Args:
+            key: Document key
+            text: Document text
+        """
+        with self._lock:
+            self._add_locked(key, text)
+
+    def remove(self, key: str) -> None:
+        """Remove a document if it is indexed."""
+        with self._lock:
+            self._remove_locked(key)
+
+    def _add_locked(self, key: str, text: str) -> None:
+        self._remove_locked(key)
+        terms = Counter(tokenize(text or ''))
+        length = sum(terms.values())
+
+        if self._free_ids:
+            doc_id = self._free_ids.pop()
+            self._doc_keys[doc_id] = key
+            self._doc_lengths[doc_id] = length
+        else:
+            doc_id = len(self._doc_keys)
+            self._doc_keys.append(key)
+            self._doc_lengths.append(length)
+
+        self._doc_ids[key] = doc_id
+        self._doc_terms[doc_id] = terms
+        self._total_length += length
+        for term, frequency in terms.items():
+            self._postings.setdefault(term, {})[doc_id] = frequency
+
+    def _remove_locked(self, key: str) -> None:
+        doc_id = self._doc_ids.pop(key, None)
+        if doc_id is None:
+            return
+        for term in self._doc_terms.pop(doc_id):
+            postings = self._postings[term]
+            del postings[doc_id]
+            if not postings:
+                del self._postings[term]
+        self._total_length -= self._doc_lengths[doc_id]
+        self._doc_lengths[doc_id] = 0
+        self._free_ids.append(doc_id)
+
+    def search(self, query: str, top_n: int) -> List[Tuple[str, float]]:
+        """
+        Return the top_n documents by BM25 score for a query.
+
+        Only documents sharing at least one term with the query are returned.
+
+        Args:
+            query: Query text (job description and required skills)
+            top_n: Maximum number of results
+
+        Returns:
+            List of (key, score), best first
+        """
+        query_terms = set(tokenize(query))
+        with self._lock:
+            doc_count = len(self._doc_ids)
+            if not doc_count or not query_terms or top_n <= 0:
+                return []
+
+            lengths = np.asarray(self._doc_lengths, dtype=np.float64)
+            average_length = self._total_length / doc_count or 1.0
+            length_norm = self.k1 * (1 - self.b + self.b * lengths / average_length)
+
+            scores = np.zeros(len(self._doc_keys), dtype=np.float64)
+            for term in query_terms:
+                postings = self._postings.get(term)
+                if not postings:
+                    continue
+                doc_ids = np.fromiter(postings.keys(), dtype=np.int64, count=len(postings))
+                frequencies = np.fromiter(postings.values(), dtype=np.float64, count=len(postings))
+                idf = math.log(1 + (doc_count - len(postings) + 0.5) / (len(postings) + 0.5))
+                scores[doc_ids] += idf * frequencies * (self.k1 + 1) / (frequencies + length_norm[doc_ids])
+
+            matched = np.flatnonzero(scores > 0)
+            if len(matched) > top_n:
+                matched = matched[np.argpartition(-scores[matched], top_n - 1)[:top_n]]
+            matched = matched[np.argsort(-scores[matched], kind='stable')]
+            return [(self._doc_keys[doc_id], float(scores[doc_id])) for doc_id in matched]
+
+
+# Global instance
+_candidate_search_index: BM25Index = None
+
+
+def get_candidate_search_index() -> BM25Index:
+    """Get or initialize global candidate BM25 index instance."""
+    global _candidate_search_index
+    if _candidate_search_index is None:
+        _candidate_search_index = BM25Index()
+    return _candidate_search_index
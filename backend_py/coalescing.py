@@ -0,0 +1,108 @@
+"""Single-flight request coalescing with a short-lived result cache."""
+
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from .config import COALESCE_CACHE_TTL, COALESCE_CACHE_SIZE
+from .metrics import get_metrics
+
+
+class SingleFlight:
+    """
+    Runs at most one computation per key at a time (per worker process).
+
+    Callers arriving while a computation for their key is in flight await
+    that computation instead of starting their own, and its result is kept
+    for `ttl` seconds so requests arriving just after it finishes reuse it
+    too. Exceptions are shared with the waiting callers but never cached.
+    Coalesced callers are counted in coalesced_requests_total{endpoint,
+    source="inflight"|"cache"}, computations in coalesced_computations_total.
+    """
+
+    def __init__(self, name: str, ttl: float = COALESCE_CACHE_TTL, max_entries: int = COALESCE_CACHE_SIZE):
+        """
+        Args:
+            name: Endpoint name used as the metrics label
+            ttl: Seconds a finished result is reused (0 disables the cache)
+            max_entries: Maximum number of cached results
+        """
+        self.name = name
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._cache: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+
+    async def run(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[Any]],
+        should_cache: Optional[Callable[[Any], bool]] = None
+    ) -> Any:
+        """
+        Return the result for key, computing it only if no one else is.
+
+        Args:
+            key: Hash of the normalized request
+            compute: Coroutine function producing the result
+            should_cache: Whether a result may be kept for later callers (default: always)
+
+        Returns:
+            The (possibly shared) result
+        """
+        metrics = get_metrics()
+        cached = self._cached(key)
+        if cached is not None:
+            metrics.increment("coalesced_requests_total", endpoint=self.name, source="cache")
+            return cached[1]
+
+        future = self._inflight.get(key)
+        if future is not None:
+            metrics.increment("coalesced_requests_total", endpoint=self.name, source="inflight")
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise  # This caller was cancelled, not the computation
+                # The caller running the computation went away; run it again
+                return await self.run(key, compute, should_cache)
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        metrics.increment("coalesced_computations_total", endpoint=self.name)
+        try:
+            result = await compute()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # Mark retrieved: there may be no waiters
+            raise
+        finally:
+            self._inflight.pop(key, None)
+
+        future.set_result(result)
+        if self.ttl > 0 and (should_cache is None or should_cache(result)):
+            self._store(key, result)
+        return result
+
+    def _cached(self, key: str) -> Optional[Tuple[float, Any]]:
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._cache[key]
+            return None
+        return entry
+
+    def _store(self, key: str, result: Any) -> None:
+        self._cache[key] = (time.monotonic() + self.ttl, result)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop cached results (in-flight computations are unaffected)."""
+        self._cache.clear()
@@ -1,5 +1,8 @@
 """Configuration and constants for Resume Screening System."""
 
+import os
+import tempfile
+
 # Model configurations
 MODEL_NAME = "all-MiniLM-L6-v2"  # Lightweight, fast sentence transformer
 SPACY_MODEL = "en_core_web_sm"   # SpaCy model for NER
@@ -10,15 +13,124 @@ SKILL_WEIGHT = 0.3
 
 # Similarity thresholds
 SKILL_MATCH_THRESHOLD = 0.85  # Cosine similarity threshold for skill matching
+SKILL_MEMO_SIZE = 10000       # Free-text skill phrases whose canonical match is memoized
 
 # File upload settings
 MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
+INGEST_CHUNK_SIZE = 1024 * 1024   # Bytes read at a time while checking and hashing an upload
+
+# Archive (zip/tar) screening uploads
+ARCHIVE_MAX_FILE_SIZE = 100 * 1024 * 1024    # 100MB compressed archive
+ARCHIVE_MAX_ENTRIES = 1000                    # Entries of any kind, including skipped ones
+ARCHIVE_MAX_TOTAL_SIZE = 500 * 1024 * 1024    # 500MB uncompressed
+ARCHIVE_MAX_COMPRESSION_RATIO = 100           # Uncompressed / compressed size, per entry and overall
 ALLOWED_EXTENSIONS = {'pdf', 'docx', 'doc'}
 
 # Processing settings
 BATCH_SIZE = 32
 TOP_K_SKILLS = 10  # Number of top skills to extract
 
+# Executors for blocking handler work (see executors.py): "thread", "process" (also parse
+# resumes in a process pool) or "inline" (run on the event loop, for comparison)
+EXECUTOR_MODE = os.environ.get("EXECUTOR_MODE", "thread")
+EXECUTOR_THREADS = 4  # Model, scoring and database calls in flight per worker
+EXECUTOR_PARSE_PROCESSES = max((os.cpu_count() or 2) - 1, 1)
+
+# Shared model server (python -m backend_py.model_server); empty loads the models in every worker
+MODEL_SERVER_SOCKET = os.environ.get("MODEL_SERVER_SOCKET", "")
+MODEL_SERVER_BATCH_WINDOW_MS = 5  # Wait for other workers' texts to join an embedding batch
+MODEL_SERVER_MAX_BATCH = 256      # Texts that close a batch without waiting out the window
+MODEL_SERVER_TIMEOUT = 120        # Seconds a worker waits for a response
+
+# Near-duplicate resume detection (MinHash + LSH)
+NEAR_DUPLICATE_THRESHOLD = 0.8  # Estimated Jaccard similarity of word shingles
+MINHASH_PERMUTATIONS = 128
+MINHASH_BANDS = 16              # 16 bands x 8 rows: ~0.7 similarity detection knee
+SHINGLE_SIZE = 5                # Words per shingle
+
+# Candidate retrieval (BM25 prefilter before embedding rerank)
+MATCH_RETRIEVAL_DEPTH = int(os.environ.get("MATCH_RETRIEVAL_DEPTH", "2000"))  # Candidates reranked per match
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+# In-process candidate indexes (BM25, skills) pick up writes from other workers and the
+# Node backend: the collection is checked at this interval and the index rebuilt on change
+INDEX_REFRESH_CHECK_SECONDS = float(os.environ.get("INDEX_REFRESH_CHECK_SECONDS", "10"))
+INDEX_REFRESH_MAX_AGE_SECONDS = 600  # Rebuild regardless after this long
+
+# Stored embeddings
+EMBEDDING_INDEX_DIR = os.environ.get(
+    "EMBEDDING_INDEX_DIR",
+    os.path.join(tempfile.gettempdir(), "resume-screener-embeddings")
+)  # Shared by every worker on the host
+EMBEDDING_LOG_COMPACT_RECORDS = 5000  # Appended embeddings folded into the mapped matrix at once
+EMBEDDING_PRUNE_INTERVAL_SECONDS = 60 * 60  # Drop embeddings of edited or deleted resumes and jobs this often
+
+# Export settings
+EXPORT_CHUNK_ROWS = 500  # Rows fetched/encoded per chunk when streaming exports
+
 # API settings
 API_HOST = "0.0.0.0"
 API_PORT = 8000
+
+# Service dependencies
+MONGODB_URI = os.environ.get("MONGODB_URI", "mongodb://localhost:27017/")
+MONGODB_DB = os.environ.get("MONGODB_DB", "resume-shortlister")
+ENSURE_INDEXES_ON_STARTUP = True
+JOBS_API_URL = os.environ.get("JOBS_API_URL", "http://localhost:5000/api/jobs")
+JOBS_CACHE_TTL = 60  # Seconds a fetched job list (and its skills analysis) is reused
+
+# Explore page pagination
+EXPLORE_PAGE_SIZE = 20
+EXPLORE_MAX_PAGE_SIZE = 100
+
+# HTTP caching
+EXTRACT_SKILLS_MAX_AGE = 24 * 60 * 60  # Seconds clients may reuse /api/extract-skills results
+EXTRACT_SKILLS_CACHE_SIZE = 1024  # Job descriptions whose extracted skills are kept per worker
+
+# Request coalescing (identical concurrent match queries share one computation)
+COALESCE_CACHE_TTL = 2.0  # Seconds a finished result is reused by identical requests
+COALESCE_CACHE_SIZE = 64  # Cached results kept per worker
+
+# Admission control (per worker). Requests over their endpoint's or budget's concurrency
+# wait in a bounded FIFO queue; when it is full, or after ADMISSION_QUEUE_TIMEOUT seconds,
+# they get 429 with Retry-After. Unlisted /api/ paths use the "default" budget.
+ADMISSION_BUDGETS = {
+    'nlp': {'concurrency': 4, 'queue': 16},  # Parsing, embedding and scoring
+    'default': {'concurrency': 64, 'queue': 256},  # CRUD, exports and lookups
+}
+ADMISSION_ENDPOINTS = {  # Path (prefix if it ends in "/") -> (budget, per-endpoint concurrency or None)
+    '/api/screen-resumes': ('nlp', 2),
+    '/api/screen-resumes-archive': ('nlp', 1),
+    '/api/score-single': ('nlp', None),
+    '/api/match-candidates': ('default', None),  # Takes an nlp slot only to compute, not to await a coalesced result
+    '/api/match-jobs': ('nlp', None),
+    '/api/extract-skills': ('nlp', None),
+    '/api/skill-search': ('nlp', None),
+    '/api/apply-job': ('nlp', None),
+    '/api/apply-job-with-resume': ('nlp', None),
+    '/api/update-candidate': ('nlp', None),
+}
+ADMISSION_EXEMPT_PATHS = ('/health', '/api/metrics')
+ADMISSION_QUEUE_TIMEOUT = 30  # Seconds a request may wait for a slot
+ADMISSION_RETRY_AFTER = 5  # Seconds suggested to rejected clients
+
+# Response compression
+GZIP_MINIMUM_SIZE = 1024  # Responses smaller than this are sent uncompressed
+GZIP_COMPRESS_LEVEL = 6  # zlib level; higher levels cost CPU for little gain on JSON
+
+# Logging settings
+LOG_LEVEL = os.environ.get("LOG_LEVEL", "INFO")
+LOG_FORMAT = os.environ.get("LOG_FORMAT", "text")  # "text" or "json"
+LOG_SAMPLE_RATE = 0.01  # Fraction of requests that emit per-candidate debug records
+
+# Profiling settings (opt-in, per request)
+PROFILE_TOKEN = os.environ.get("PROFILE_TOKEN", "")  # Empty disables profiling entirely
+PROFILE_HEADER = "x-profile-token"
+PROFILE_DIR = os.environ.get(
+    "PROFILE_DIR",
+    os.path.join(tempfile.gettempdir(), "resume-screener-profiles")
+)
+PROFILE_MAX_FILES = 50
+PROFILE_MAX_BYTES = 200 * 1024 * 1024  # 200MB
+PROFILE_MAX_AGE_SECONDS = 24 * 60 * 60
@@ -0,0 +1,224 @@
+"""
+Index management for the resume-shortlister MongoDB collections.
+
+Usage:
+    python -m backend_py.db_indexes            # create missing indexes
+    python -m backend_py.db_indexes --explain  # also verify every query uses an index
+"""
+
+import logging
+import sys
+from typing import Dict, List
+
+from pymongo import ASCENDING, DESCENDING, IndexModel
+from pymongo.errors import OperationFailure
+
+logger = logging.getLogger(__name__)
+
+# Server error codes for an existing index whose options differ from ours
+INDEX_CONFLICT_CODES = {85, 86}  # IndexOptionsConflict, IndexKeySpecsConflict
+DUPLICATE_KEY_CODE = 11000
+
+# Collection name -> indexes the API's queries rely on
+INDEXES = {
+    'candidates': [
+        # Unique so registration can upsert by email without racing
+        IndexModel([('email', ASCENDING)], name='email_1', unique=True, sparse=True),
+        # Latest write, for the in-process index freshness check (index_refresh.py)
+        IndexModel([('updatedAt', DESCENDING)], name='updatedAt_-1'),
+    ],
+    'applications': [
+        # Recruiter view: all applications for a job, best match first
+        IndexModel([('jobId', ASCENDING), ('matchPercentage', DESCENDING)], name='jobId_1_matchPercentage_-1'),
+        # Candidate view, withdraw and status updates (candidateEmail + jobId)
+        IndexModel([('candidateEmail', ASCENDING), ('jobId', ASCENDING)], name='candidateEmail_1_jobId_1'),
+        # Unique so concurrent applications upsert into a single document
+        IndexModel([('duplicateKey', ASCENDING)], name='duplicateKey_1', unique=True, sparse=True),
+    ],
+    'jobs': [
+        IndexModel([('id', ASCENDING)], name='id_1'),
+    ],
+}
+
+# Representative form of every query the API issues, for explain-plan checks
+QUERIES = [
+    {'name': 'candidate_by_email', 'collection': 'candidates',
+     'filter': {'email': 'candidate@example.com'}},
+    {'name': 'latest_candidate_update', 'collection': 'candidates',
+     'filter': {'updatedAt': {'$exists': True}}, 'sort': [('updatedAt', DESCENDING)]},
+    {'name': 'applications_for_job', 'collection': 'applications',
+     'filter': {'jobId': 'job-1'}, 'sort': [('matchPercentage', DESCENDING)]},
+    {'name': 'applications_for_candidate', 'collection': 'applications',
+     'filter': {'candidateEmail': 'candidate@example.com'}},
+    {'name': 'application_by_candidate_and_job', 'collection': 'applications',
+     'filter': {'candidateEmail': 'candidate@example.com', 'jobId': 'job-1'}},
+    {'name': 'application_by_duplicate_key', 'collection': 'applications',
+     'filter': {'duplicateKey': '0' * 32}},
+    {'name': 'job_by_id', 'collection': 'jobs',
+     'filter': {'id': 'job-1'}},
+]
+
+INDEX_STAGES = {'IXSCAN', 'IDHACK', 'EXPRESS_IXSCAN', 'COUNT_SCAN', 'DISTINCT_SCAN'}
+
+
+def _has_duplicate_keys(collection, index: IndexModel) -> bool:
+    """Whether existing documents would violate a unique index (sparse indexes skip missing keys)."""
+    fields = list(index.document['key'])
+    pipeline = []
+    if index.document.get('sparse'):
+        pipeline.append({'$match': {field: {'$exists': True} for field in fields}})
+    pipeline += [
+        {'$group': {'_id': {field.replace('.', '_'): f"${field}" for field in fields}, 'count': {'$sum': 1}}},
+        {'$match': {'count': {'$gt': 1}}},
+        {'$limit': 1}
+    ]
+    return any(True for _ in collection.aggregate(pipeline, allowDiskUse=True))
+
+
+def _index_model_from_info(name: str, info: Dict) -> IndexModel:
+    """Rebuild an IndexModel from an index_information() entry."""
+    options = {key: value for key, value in info.items() if key not in ('key', 'v', 'ns')}
+    return IndexModel(info['key'], name=name, **options)
+
+
+def _create_index(collection, index: IndexModel) -> bool:
+    """
+    Create one index, replacing an existing index of the same name whose
+    options differ (e.g. a non-unique index that should now be unique).
+
+    MongoDB does not allow two indexes on the same keys with different
+    options, so the old index has to be dropped first. It is kept when the
+    replacement cannot be built, and restored if building it fails anyway.
+
+    Returns:
+        True if the index exists as specified afterwards
+    """
+    name = index.document['name']
+    try:
+        collection.create_indexes([index])
+        return True
+    except OperationFailure as e:
+        if e.code == DUPLICATE_KEY_CODE:
+            logger.warning(
+                "Cannot create unique index %s on %s: existing documents have duplicate keys",
+                name, collection.name
+            )
+            return False
+        if e.code not in INDEX_CONFLICT_CODES:
+            raise
+
+    previous = collection.index_information().get(name)
+    if previous is None:
+        # The same keys are indexed under another name; that index still serves the queries
+        logger.warning("Not creating index %s on %s: its keys are indexed under another name", name, collection.name)
+        return False
+    if index.document.get('unique') and _has_duplicate_keys(collection, index):
+        logger.warning(
+            "Keeping index %s on %s as is: existing documents have duplicate keys",
+            name, collection.name
+        )
+        return False
+
+    logger.info("Rebuilding index %s on %s with new options", name, collection.name)
+    collection.drop_index(name)
+    try:
+        collection.create_indexes([index])
+        return True
+    except OperationFailure as e:
+        # E.g. a duplicate written since the check; never leave the queries unindexed
+        collection.create_indexes([_index_model_from_info(name, previous)])
+        if e.code != DUPLICATE_KEY_CODE:
+            raise
+        logger.warning(
+            "Cannot create unique index %s on %s: existing documents have duplicate keys",
+            name, collection.name
+        )
+        return False
+
+
+def ensure_indexes(db) -> Dict[str, List[str]]:
+    """
+    Create any missing indexes. Existing matching indexes are left untouched.
+
+    Args:
+        db: pymongo Database
+
+    Returns:
+        Mapping of collection name to the index names ensured
+    """
+    created = {}
+    for collection_name, indexes in INDEXES.items():
+        collection = db[collection_name]
+        created[collection_name] = [
+            index.document['name'] for index in indexes if _create_index(collection, index)
+        ]
+        logger.info("Ensured indexes on %s: %s", collection_name, ', '.join(created[collection_name]))
+    return created
+
+
+def _plan_stages(plan) -> List[str]:
+    """Collect every stage name in an explain plan tree."""
+    stages = []
+    if isinstance(plan, dict):
+        if 'stage' in plan:
+            stages.append(plan['stage'])
+        for value in plan.values():
+            stages.extend(_plan_stages(value))
+    elif isinstance(plan, list):
+        for item in plan:
+            stages.extend(_plan_stages(item))
+    return stages
+
+
+def explain_queries(db) -> List[Dict]:
+    """
+    Explain every query in QUERIES and report whether its winning plan uses an index.
+
+    Args:
+        db: pymongo Database
+
+    Returns:
+        One dictionary per query with name, stages and uses_index
+    """
+    report = []
+    for query in QUERIES:
+        cursor = db[query['collection']].find(query['filter'])
+        if query.get('sort'):
+            cursor = cursor.sort(query['sort'])
+        explanation = cursor.explain()
+        stages = _plan_stages(explanation.get('queryPlanner', {}).get('winningPlan', {}))
+        report.append({
+            'name': query['name'],
+            'collection': query['collection'],
+            'stages': stages,
+            'uses_index': bool(INDEX_STAGES.intersection(stages)) and 'COLLSCAN' not in stages
+        })
+    return report
+
+
+def main(argv: List[str] = None) -> int:
+    from pymongo import MongoClient
+    from .config import MONGODB_URI, MONGODB_DB
+
+    argv = sys.argv[1:] if argv is None else argv
+    logging.basicConfig(level=logging.INFO)
+
+    client = MongoClient(MONGODB_URI, serverSelectionTimeoutMS=3000)
+    try:
+        db = client[MONGODB_DB]
+        ensure_indexes(db)
+        if '--explain' not in argv:
+            return 0
+
+        failures = 0
+        for row in explain_queries(db):
+            status = 'ok' if row['uses_index'] else 'COLLECTION SCAN'
+            print(f"{row['name']:<36} {' > '.join(row['stages']):<40} {status}")
+            failures += not row['uses_index']
+        return 1 if failures else 0
+    finally:
+        client.close()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,70 @@
+"""Atomic write helpers for applications and candidates."""
+
+import hashlib
+from datetime import datetime
+from typing import Callable, Dict
+
+from pymongo.errors import DuplicateKeyError
+
+
+def application_duplicate_key(candidate_email: str, job_id: str) -> str:
+    """
+    Build the key that identifies one candidate's application to one job.
+
+    Args:
+        candidate_email: Candidate email (case-insensitive)
+        job_id: Job identifier
+
+    Returns:
+        Hex digest stored in applications.duplicateKey
+    """
+    return hashlib.md5(f"{candidate_email.lower()}_{job_id}".encode()).hexdigest()
+
+
+def retry_on_duplicate_key(operation: Callable, attempts: int = 2):
+    """
+    Run an upsert, retrying if a concurrent upsert inserted the same key first.
+
+    With a unique index, two racing upserts can both miss and one of them
+    fails with a duplicate key error; on retry it matches the winner's
+    document and becomes an update.
+
+    Args:
+        operation: Zero-argument callable performing the write
+        attempts: Maximum number of attempts
+
+    Returns:
+        Whatever the operation returns
+    """
+    for attempt in range(attempts):
+        try:
+            return operation()
+        except DuplicateKeyError:
+            if attempt == attempts - 1:
+                raise
+
+
+def upsert_application(collection, duplicate_key: str, scores: Dict, insert_fields: Dict):
+    """
+    Insert or refresh an application in a single round trip.
+
+    Args:
+        collection: applications collection
+        duplicate_key: Output of application_duplicate_key
+        scores: Fields refreshed on every application (match results)
+        insert_fields: Fields only written when the application is created
+
+    Returns:
+        pymongo UpdateResult (upserted_id is set when a new application was created)
+    """
+    now = datetime.utcnow()
+    return retry_on_duplicate_key(
+        lambda: collection.update_one(
+            {'duplicateKey': duplicate_key},
+            {
+                '$set': {**scores, 'appliedAt': now, 'updatedAt': now},
+                '$setOnInsert': insert_fields
+            },
+            upsert=True
+        )
+    )
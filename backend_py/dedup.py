@@ -0,0 +1,245 @@
+"""Near-duplicate resume detection with MinHash signatures and LSH banding."""
+
+import hashlib
+import logging
+import threading
+import zlib
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from .config import (
+    NEAR_DUPLICATE_THRESHOLD,
+    MINHASH_PERMUTATIONS,
+    MINHASH_BANDS,
+    SHINGLE_SIZE
+)
+
+logger = logging.getLogger(__name__)
+
+# Largest prime below 2**32; with 32-bit hashes and coefficients, a*h + b fits in uint64
+_MERSENNE_PRIME = np.uint64(4294967291)
+_MAX_HASH = np.uint32(0xFFFFFFFF)
+
+
+def content_hash(data) -> str:
+    """Exact-duplicate key for raw file bytes or cleaned text."""
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    return hashlib.sha1(data).hexdigest()
+
+
+def shingles(text: str, size: int = SHINGLE_SIZE) -> List[str]:
+    """
+    Split text into overlapping word shingles.
+
+    Args:
+        text: Cleaned resume text (see clean_resume_text)
+        size: Words per shingle
+
+    Returns:
+        List of shingles (the whole text as one shingle if it is shorter than size)
+    """
+    words = text.lower().split()
+    if len(words) <= size:
+        return [' '.join(words)] if words else []
+    return [' '.join(words[i:i + size]) for i in range(len(words) - size + 1)]
+
+
+class MinHasher:
+    """Computes fixed-length MinHash signatures with random universal hash functions."""
+
+    def __init__(self, num_perm: int = MINHASH_PERMUTATIONS, seed: int = 1):
+        """
+        Args:
+            num_perm: Signature length
+            seed: Seed for the hash coefficients (signatures are only comparable with equal seeds)
+        """
+        rng = np.random.RandomState(seed)
+        self.num_perm = num_perm
+        self._a = rng.randint(1, 2 ** 32 - 1, size=num_perm, dtype=np.uint64)
+        self._b = rng.randint(0, 2 ** 32 - 1, size=num_perm, dtype=np.uint64)
+
+    def signature(self, text: str) -> np.ndarray:
+        """
+        Compute the MinHash signature of a text.
+
+        Args:
+            text: Cleaned resume text
+
+        Returns:
+            uint32 array of length num_perm
+        """
+        tokens = set(shingles(text))
+        if not tokens:
+            return np.full(self.num_perm, _MAX_HASH, dtype=np.uint32)
+
+        hashes = np.fromiter(
+            (zlib.crc32(token.encode('utf-8')) for token in tokens),
+            dtype=np.uint64,
+            count=len(tokens)
+        )
+        # [num_perm, n_shingles] permuted hashes, minimum per permutation
+        permuted = (np.outer(self._a, hashes) + self._b[:, None]) % _MERSENNE_PRIME
+        return permuted.min(axis=1).astype(np.uint32)
+
+
+def estimate_similarity(signature_a: np.ndarray, signature_b: np.ndarray) -> float:
+    """Estimated Jaccard similarity of two MinHash signatures."""
+    return float(np.mean(signature_a == signature_b))
+
+
+class NearDuplicateIndex:
+    """
+    LSH index over MinHash signatures.
+
+    Signatures are cut into bands; two documents become candidates when
+    any band matches exactly, so a lookup costs one dictionary probe per
+    band regardless of how many documents are indexed.
+    """
+
+    def __init__(
+        self,
+        threshold: float = NEAR_DUPLICATE_THRESHOLD,
+        num_perm: int = MINHASH_PERMUTATIONS,
+        bands: int = MINHASH_BANDS
+    ):
+        """
+        Args:
+            threshold: Minimum estimated Jaccard similarity to report a duplicate
+            num_perm: Signature length (must be divisible by bands)
+            bands: Number of LSH bands
+        """
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = num_perm // bands
+        self._buckets: List[Dict[bytes, List[str]]] = [defaultdict(list) for _ in range(bands)]
+        self._signatures: Dict[str, np.ndarray] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._signatures
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        return [signature[i * self.rows:(i + 1) * self.rows].tobytes() for i in range(self.bands)]
+
+    def add(self, key: str, signature: np.ndarray) -> None:
+        """
+        Index a document, replacing any earlier signature stored under the same key.
+
+        Args:
+            key: Document identifier (file name, candidate email, ...)
+            signature: Output of MinHasher.signature
+        """
+        with self._lock:
+            if key in self._signatures:
+                self._remove_locked(key)
+            self._signatures[key] = signature
+            for bucket, band_key in zip(self._buckets, self._band_keys(signature)):
+                bucket[band_key].append(key)
+
+    def remove(self, key: str) -> None:
+        """Drop a document from the index if present."""
+        with self._lock:
+            if key in self._signatures:
+                self._remove_locked(key)
+
+    def _remove_locked(self, key: str) -> None:
+        signature = self._signatures.pop(key)
+        for bucket, band_key in zip(self._buckets, self._band_keys(signature)):
+            keys = bucket.get(band_key)
+            if keys and key in keys:
+                keys.remove(key)
+                if not keys:
+                    del bucket[band_key]
+
+    def query(self, signature: np.ndarray, exclude: Optional[str] = None) -> Optional[Tuple[str, float]]:
+        """
+        Find the most similar indexed document above the threshold.
+
+        Args:
+            signature: Output of MinHasher.signature
+            exclude: Key to ignore (e.g. the document's own key)
+
+        Returns:
+            Tuple of (key, estimated_similarity), or None if there is no near-duplicate
+        """
+        with self._lock:
+            candidates = set()
+            for bucket, band_key in zip(self._buckets, self._band_keys(signature)):
+                candidates.update(bucket.get(band_key, ()))
+            candidates.discard(exclude)
+
+            best = None
+            for key in candidates:
+                similarity = estimate_similarity(signature, self._signatures[key])
+                if similarity >= self.threshold and (best is None or similarity > best[1]):
+                    best = (key, similarity)
+            return best
+
+
+def group_duplicates(duplicate_of: Dict[str, Tuple[str, float]]) -> List[Dict]:
+    """
+    Turn "document -> (original, similarity)" links into clusters.
+
+    Args:
+        duplicate_of: Mapping of each duplicate to the earlier document it matched
+
+    Returns:
+        One dictionary per cluster with the original, its duplicates and the lowest similarity
+    """
+    clusters: Dict[str, Dict] = {}
+    for duplicate, (original, similarity) in duplicate_of.items():
+        # Follow chains so a duplicate of a duplicate joins the first document's cluster
+        while original in duplicate_of:
+            original = duplicate_of[original][0]
+        cluster = clusters.setdefault(original, {'original': original, 'duplicates': [], 'min_similarity': 1.0})
+        cluster['duplicates'].append(duplicate)
+        cluster['min_similarity'] = round(min(cluster['min_similarity'], similarity), 4)
+    return list(clusters.values())
+
+
+# Global instances
+_minhasher: MinHasher = None
+_candidate_index: NearDuplicateIndex = None
+_candidate_index_lock = threading.Lock()
+
+
+def get_minhasher() -> MinHasher:
+    """Get or initialize global MinHasher instance."""
+    global _minhasher
+    if _minhasher is None:
+        _minhasher = MinHasher()
+    return _minhasher
+
+
+def get_candidate_index(collection=None) -> NearDuplicateIndex:
+    """
+    Get or initialize the global near-duplicate index of stored candidate resumes.
+
+    Args:
+        collection: candidates collection used to load stored signatures on first use
+
+    Returns:
+        NearDuplicateIndex keyed by candidate email
+    """
+    global _candidate_index
+    with _candidate_index_lock:
+        if _candidate_index is None:
+            index = NearDuplicateIndex()
+            if collection is not None:
+                stored = collection.find(
+                    {'resumeSignature': {'$exists': True}},
+                    {'email': 1, 'resumeSignature': 1}
+                )
+                for candidate in stored:
+                    index.add(candidate['email'], np.asarray(candidate['resumeSignature'], dtype=np.uint32))
+                logger.info("Loaded %d resume signatures into the near-duplicate index", len(index))
+            _candidate_index = index
+        return _candidate_index
@@ -0,0 +1,359 @@
+"""Candidate embedding index stored on disk and memory-mapped by every worker process."""
+
+import json
+import logging
+import os
+import struct
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # Windows: appends are only serialized within one process
+    fcntl = None
+
+from .config import EMBEDDING_INDEX_DIR, EMBEDDING_LOG_COMPACT_RECORDS, MODEL_NAME
+
+logger = logging.getLogger(__name__)
+
+# Log record: key length, dimensions (0 marks a removal), then key bytes and float16 values
+_RECORD = struct.Struct('<HH')
+_MANIFEST = 'manifest.json'
+
+
+class SharedEmbeddingIndex:
+    """
+    Key -> embedding store shared by all uvicorn workers on a host.
+
+    The bulk of the vectors live in one contiguous float16 matrix file per
+    generation, which each process opens read-only with np.load(mmap_mode='r'),
+    so the operating system keeps a single physical copy in its page cache.
+    Writes go to an append-only log (serialized across processes with flock)
+    that every process replays into a small in-memory overlay. Once the log
+    grows past EMBEDDING_LOG_COMPACT_RECORDS, the writer folds it into a new
+    matrix generation and switches the manifest atomically; other processes
+    notice the new generation on their next lookup and remap.
+
+    The manifest records which embedding model produced the vectors. A
+    process configured with a different model clears the index before
+    reading or writing it, so vectors from two models are never compared.
+    """
+
+    def __init__(
+        self,
+        directory: str = EMBEDDING_INDEX_DIR,
+        compact_records: int = EMBEDDING_LOG_COMPACT_RECORDS,
+        model: str = MODEL_NAME
+    ):
+        """
+        Args:
+            directory: Directory holding the manifest, matrix, keys and log files
+            compact_records: Log records that trigger a compaction
+            model: Name of the embedding model whose vectors are stored
+        """
+        self.directory = directory
+        self.compact_records = compact_records
+        self.model = model
+        self._lock = threading.RLock()
+        self._generation = None
+        self._dim = None
+        self._model = None
+        self._matrix = None
+        self._rows: Dict[str, int] = {}
+        self._overlay: Dict[str, Optional[np.ndarray]] = {}
+        self._log_offset = 0
+        self._log_records = 0
+        os.makedirs(directory, exist_ok=True)
+        if fcntl is None:
+            logger.warning(
+                "fcntl is unavailable: appends to the embedding index in %s are not locked across "
+                "processes; run a single worker or give each worker its own EMBEDDING_INDEX_DIR",
+                directory
+            )
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, name)
+
+    def _read_manifest(self) -> Dict:
+        try:
+            with open(self._path(_MANIFEST)) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {'generation': 0, 'dim': None, 'model': None}
+
+    @property
+    def dim(self) -> Optional[int]:
+        """Embedding dimensions, or None while the index is empty."""
+        self.refresh()
+        return self._dim
+
+    def __len__(self) -> int:
+        self.refresh()
+        with self._lock:
+            base = sum(1 for key in self._rows if key not in self._overlay)
+            return base + sum(1 for vector in self._overlay.values() if vector is not None)
+
+    def refresh(self) -> None:
+        """Map the current generation (if it changed) and replay new log records."""
+        with self._lock:
+            while True:
+                manifest = self._read_manifest()
+                if manifest['generation'] == self._generation:
+                    break
+                try:
+                    self._map_generation(manifest)
+                    break
+                except FileNotFoundError:
+                    continue  # Compacted again while mapping; read the newer manifest
+            self._replay_log()
+
+    def _refresh_for_model(self) -> None:
+        """Refresh, first clearing the index if another embedding model wrote it."""
+        self.refresh()
+        if self._model == self.model:
+            return
+        # Taken before the log lock (see _log_locked), and checked again under it
+        with self._lock, self._log_locked() as (generation, _):
+            stored_model = self._read_manifest().get('model')
+            if stored_model != self.model:
+                if generation:
+                    logger.warning(
+                        "Embedding index was built with model %s, not %s; clearing it", stored_model, self.model
+                    )
+                self._write_generation(generation + 1, [], None)
+        self.refresh()
+
+    def _map_generation(self, manifest: Dict) -> None:
+        generation = manifest['generation']
+        self._matrix = None
+        self._rows = {}
+        if manifest.get('count'):
+            self._matrix = np.load(self._path(f"matrix-{generation}.npy"), mmap_mode='r')
+            with open(self._path(f"keys-{generation}.json")) as f:
+                self._rows = {key: row for row, key in enumerate(json.load(f))}
+        self._generation = generation
+        self._dim = manifest.get('dim')
+        self._model = manifest.get('model')
+        self._overlay = {}
+        self._log_offset = 0
+        self._log_records = 0
+
+    def _replay_log(self) -> None:
+        try:
+            with open(self._path(f"log-{self._generation}.bin"), 'rb') as f:
+                f.seek(self._log_offset)
+                data = f.read()
+        except FileNotFoundError:
+            return
+
+        position = 0
+        while position + _RECORD.size <= len(data):
+            key_length, dim = _RECORD.unpack_from(data, position)
+            end = position + _RECORD.size + key_length + 2 * dim
+            if end > len(data):
+                break  # Record still being written
+            key = data[position + _RECORD.size:position + _RECORD.size + key_length].decode('utf-8')
+            if dim:
+                vector = np.frombuffer(data, dtype=np.float16, count=dim, offset=end - 2 * dim)
+                self._overlay[key] = vector
+                self._dim = dim
+            else:
+                self._overlay[key] = None
+            self._log_records += 1
+            position = end
+        self._log_offset += position
+
+    def lookup(self, keys: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Stored embeddings for keys.
+
+        Args:
+            keys: Content hashes of candidate or job texts (see content_hash)
+
+        Returns:
+            Tuple of (float32 matrix [len(keys), dim] with zero rows for
+            missing keys, boolean mask of keys found)
+        """
+        self._refresh_for_model()
+        with self._lock:
+            found = np.zeros(len(keys), dtype=bool)
+            if self._dim is None:
+                return np.zeros((len(keys), 0), dtype=np.float32), found
+
+            vectors = np.zeros((len(keys), self._dim), dtype=np.float32)
+            positions = []
+            rows = []
+            for position, key in enumerate(keys):
+                if key in self._overlay:
+                    vector = self._overlay[key]
+                    if vector is not None:
+                        vectors[position] = vector
+                        found[position] = True
+                elif key in self._rows:
+                    positions.append(position)
+                    rows.append(self._rows[key])
+            if rows:
+                # Fancy indexing reads just these rows out of the mapped file
+                vectors[positions] = self._matrix[rows]
+                found[positions] = True
+            return vectors, found
+
+    def add_many(self, items: Iterable[Tuple[str, np.ndarray]]) -> None:
+        """
+        Store embeddings, replacing earlier ones for the same keys.
+
+        Args:
+            items: Iterable of (key, vector)
+        """
+        self._refresh_for_model()
+        records = []
+        for key, vector in items:
+            vector = np.asarray(vector, dtype=np.float16).ravel()
+            encoded = key.encode('utf-8')
+            records.append(_RECORD.pack(len(encoded), len(vector)) + encoded + vector.tobytes())
+        self._append(records)
+
+    def add(self, key: str, vector: np.ndarray) -> None:
+        """Store one embedding, replacing any earlier one for the key."""
+        self.add_many([(key, vector)])
+
+    def remove(self, key: str) -> None:
+        """Forget a key's embedding (e.g. after its resume text changed)."""
+        self._refresh_for_model()
+        encoded = key.encode('utf-8')
+        self._append([_RECORD.pack(len(encoded), 0) + encoded])
+
+    def retain(self, keys: Iterable[str]) -> int:
+        """
+        Drop the embeddings of every key not in `keys`.
+
+        Keys are content hashes, so an edited resume or job description
+        leaves its old vector behind. Pass the hashes of all current texts
+        to reclaim them. Vectors added by other processes after `keys` was
+        collected may be dropped too; they are re-embedded on next use.
+
+        Args:
+            keys: Keys to keep
+
+        Returns:
+            Number of embeddings dropped
+        """
+        keep = set(keys)
+        self._refresh_for_model()
+        with self._lock, self._log_locked() as (generation, _):
+            self.refresh()
+            stale = [key for key in self._stored_keys() if key not in keep]
+            if stale:
+                self._compact_locked(generation, keep=keep)
+            return len(stale)
+
+    def clear(self) -> None:
+        """Drop every embedding (e.g. after switching embedding models)."""
+        with self._lock, self._log_locked() as (generation, _):
+            self._write_generation(generation + 1, [], None)
+
+    @contextmanager
+    def _log_locked(self):
+        """
+        Hold the current generation's log lock across processes.
+
+        Yields (generation, open log file). Retries if a compaction switched
+        generations while waiting for the lock.
+        """
+        while True:
+            generation = self._read_manifest()['generation']
+            with open(self._path(f"log-{generation}.bin"), 'ab') as log:
+                if fcntl is not None:
+                    fcntl.flock(log, fcntl.LOCK_EX)
+                try:
+                    if self._read_manifest()['generation'] == generation:
+                        yield generation, log
+                        return
+                finally:
+                    if fcntl is not None:
+                        fcntl.flock(log, fcntl.LOCK_UN)
+
+    def _append(self, records: List[bytes]) -> None:
+        if not records:
+            return
+        with self._lock, self._log_locked() as (generation, log):
+            self.refresh()
+            for record in records:
+                record_dim = _RECORD.unpack_from(record)[1]
+                if record_dim and self._dim is not None and record_dim != self._dim:
+                    raise ValueError(f"Embedding has {record_dim} dimensions, index has {self._dim}")
+            log.write(b''.join(records))
+            log.flush()
+
+            self._replay_log()
+            if self._log_records >= self.compact_records:
+                self._compact_locked(generation)
+
+    def compact(self) -> None:
+        """Fold the log into a new matrix generation."""
+        with self._lock, self._log_locked() as (generation, _):
+            self._compact_locked(generation)
+
+    def _stored_keys(self) -> List[str]:
+        """Keys with a vector: matrix rows not overridden by the log, then log additions."""
+        keys = [key for key in self._rows if key not in self._overlay]
+        return keys + [key for key, vector in self._overlay.items() if vector is not None]
+
+    def _compact_locked(self, generation: int, keep: Optional[set] = None) -> None:
+        self.refresh()
+        base_keys = [key for key in self._rows if key not in self._overlay and (keep is None or key in keep)]
+        keys = base_keys + [
+            key for key, vector in self._overlay.items() if vector is not None and (keep is None or key in keep)
+        ]
+        if not keys:
+            self._write_generation(generation + 1, [], None)
+            return
+
+        matrix = np.empty((len(keys), self._dim), dtype=np.float16)
+        if base_keys:
+            matrix[:len(base_keys)] = self._matrix[[self._rows[key] for key in base_keys]]
+        for row, key in enumerate(keys[len(base_keys):], start=len(base_keys)):
+            matrix[row] = self._overlay[key]
+        self._write_generation(generation + 1, keys, matrix)
+        logger.info("Compacted embedding index to generation %d (%d vectors)", generation + 1, len(keys))
+
+    def _write_generation(self, generation: int, keys: List[str], matrix: Optional[np.ndarray]) -> None:
+        if matrix is not None:
+            with open(self._path(f"matrix-{generation}.npy.tmp"), 'wb') as f:
+                np.save(f, matrix)
+            os.replace(self._path(f"matrix-{generation}.npy.tmp"), self._path(f"matrix-{generation}.npy"))
+            with open(self._path(f"keys-{generation}.json"), 'w') as f:
+                json.dump(keys, f)
+        open(self._path(f"log-{generation}.bin"), 'ab').close()
+
+        manifest = {
+            'generation': generation,
+            'dim': matrix.shape[1] if matrix is not None else None,
+            'count': len(keys),
+            'model': self.model
+        }
+        with open(self._path(f"{_MANIFEST}.tmp"), 'w') as f:
+            json.dump(manifest, f)
+        os.replace(self._path(f"{_MANIFEST}.tmp"), self._path(_MANIFEST))
+
+        # Processes that still map the old matrix keep reading it until they remap
+        for name in (f"matrix-{generation - 1}.npy", f"keys-{generation - 1}.json", f"log-{generation - 1}.bin"):
+            try:
+                os.remove(self._path(name))
+            except OSError:
+                pass  # Already removed, or still open where mapped files cannot be deleted
+
+
+# Global instance
+_embedding_index: SharedEmbeddingIndex = None
+
+
+def get_embedding_index() -> SharedEmbeddingIndex:
+    """Get or initialize global embedding index instance."""
+    global _embedding_index
+    if _embedding_index is None:
+        _embedding_index = SharedEmbeddingIndex()
+    return _embedding_index
@@ -0,0 +1,228 @@
+"""
+Compact storage formats for embeddings: float16, int8 with per-vector scale, optional PCA.
+
+Used by benchmarks/bench_embedding_store.py to measure what each format
+costs in ranking quality. The API does not store encoded embeddings;
+matching reads vectors from the shared embedding index (embedding_index.py).
+"""
+
+import struct
+from typing import Dict, List, Optional
+
+import numpy as np
+from bson import Binary
+
+# Header: format code, dimensions, scale (int8 only; 1.0 otherwise)
+_HEADER = struct.Struct('<BHf')
+_FORMAT_CODES = {'float32': 0, 'float16': 1, 'int8': 2}
+_CODE_FORMATS = {code: name for name, code in _FORMAT_CODES.items()}
+_DTYPES = {'float32': np.float32, 'float16': np.float16, 'int8': np.int8}
+
+STORAGE_FORMATS = tuple(_FORMAT_CODES)
+
+
+class PCAProjection:
+    """
+    Linear projection onto the top principal axes of a sample of embeddings.
+
+    The axes come from the uncentered data, so dot products (and therefore
+    cosine similarities) between projected vectors approximate those of
+    the originals.
+    """
+
+    def __init__(self, components: np.ndarray):
+        """
+        Args:
+            components: Principal axes, shape [n_components, dim]
+        """
+        self.components = np.asarray(components, dtype=np.float32)
+
+    @property
+    def n_components(self) -> int:
+        return self.components.shape[0]
+
+    @classmethod
+    def fit(cls, embeddings: np.ndarray, n_components: int) -> 'PCAProjection':
+        """
+        Fit the projection on a sample of embeddings.
+
+        Args:
+            embeddings: Matrix of shape [n_samples, dim]
+            n_components: Output dimensions to keep
+
+        Returns:
+            PCAProjection
+        """
+        _, _, vt = np.linalg.svd(np.asarray(embeddings, dtype=np.float32), full_matrices=False)
+        return cls(vt[:n_components])
+
+    def transform(self, embeddings: np.ndarray) -> np.ndarray:
+        """Project embeddings (shape [dim] or [n, dim]) onto the kept axes."""
+        return np.asarray(embeddings, dtype=np.float32) @ self.components.T
+
+    def save(self, path: str) -> None:
+        """Write the projection to an .npz file."""
+        np.savez(path, components=self.components)
+
+    @classmethod
+    def load(cls, path: str) -> 'PCAProjection':
+        """Read a projection written by save()."""
+        with np.load(path) as data:
+            return cls(data['components'])
+
+
+class EmbeddingCodec:
+    """
+    Encodes embeddings into compact bytes and back.
+
+    int8 stores each vector as round(x / scale) with scale = max|x| / 127,
+    so cosine similarity survives quantization closely while using a
+    quarter of the float32 size. PCA, when configured, is applied before
+    encoding; queries compared against decoded vectors must go through
+    prepare() so they live in the same space.
+    """
+
+    def __init__(self, storage_format: str = 'int8', projection: Optional[PCAProjection] = None):
+        """
+        Args:
+            storage_format: One of STORAGE_FORMATS
+            projection: Optional PCA projection applied before encoding
+        """
+        if storage_format not in _FORMAT_CODES:
+            raise ValueError(f"Unknown embedding storage format: {storage_format}")
+        self.storage_format = storage_format
+        self.projection = projection
+
+    def prepare(self, embeddings: np.ndarray) -> np.ndarray:
+        """Apply the codec's projection (if any) to full-precision embeddings."""
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+        return self.projection.transform(embeddings) if self.projection is not None else embeddings
+
+    def quantize(self, embeddings: np.ndarray):
+        """
+        Quantize a matrix of (prepared) embeddings.
+
+        Args:
+            embeddings: Matrix of shape [n, dim]
+
+        Returns:
+            Tuple of (values in the storage dtype, per-row float32 scales)
+        """
+        embeddings = np.atleast_2d(np.asarray(embeddings, dtype=np.float32))
+        if self.storage_format != 'int8':
+            return embeddings.astype(_DTYPES[self.storage_format]), np.ones(len(embeddings), dtype=np.float32)
+        scales = np.abs(embeddings).max(axis=1) / 127.0
+        scales[scales == 0] = 1.0
+        values = np.clip(np.rint(embeddings / scales[:, None]), -127, 127).astype(np.int8)
+        return values, scales.astype(np.float32)
+
+    @staticmethod
+    def dequantize(values: np.ndarray, scales: np.ndarray) -> np.ndarray:
+        """Float32 matrix from quantized values and per-row scales."""
+        return values.astype(np.float32) * np.asarray(scales, dtype=np.float32)[:, None]
+
+    def encode(self, embedding: np.ndarray) -> bytes:
+        """
+        Encode one embedding (projected first if the codec has a projection).
+
+        Args:
+            embedding: Vector of shape [dim]
+
+        Returns:
+            Header plus payload bytes
+        """
+        values, scales = self.quantize(self.prepare(embedding).reshape(1, -1))
+        return _HEADER.pack(_FORMAT_CODES[self.storage_format], values.shape[1], float(scales[0])) + values.tobytes()
+
+    @staticmethod
+    def decode(data: bytes) -> np.ndarray:
+        """
+        Decode bytes written by encode() (any format) to a float32 vector.
+
+        Args:
+            data: Encoded embedding
+
+        Returns:
+            Vector of shape [dim] (in the projected space if PCA was used)
+        """
+        code, dims, scale = _HEADER.unpack_from(data)
+        storage_format = _CODE_FORMATS[code]
+        values = np.frombuffer(data, dtype=_DTYPES[storage_format], count=dims, offset=_HEADER.size)
+        return values.astype(np.float32) * np.float32(scale)
+
+    def to_bson(self, embedding: np.ndarray) -> Binary:
+        """Encode one embedding as a BSON binary value for MongoDB."""
+        return Binary(self.encode(embedding))
+
+    @staticmethod
+    def from_bson(value) -> np.ndarray:
+        """
+        Decode an embedding stored by to_bson, or a legacy list of doubles.
+
+        Args:
+            value: bson Binary/bytes or list of floats
+
+        Returns:
+            float32 vector
+        """
+        if isinstance(value, (bytes, bytearray)):
+            return EmbeddingCodec.decode(bytes(value))
+        return np.asarray(value, dtype=np.float32)
+
+
+def _cosine_matrix(queries: np.ndarray, targets: np.ndarray) -> np.ndarray:
+    queries = queries / (np.linalg.norm(queries, axis=1, keepdims=True) + 1e-10)
+    targets = targets / (np.linalg.norm(targets, axis=1, keepdims=True) + 1e-10)
+    return queries @ targets.T
+
+
+def evaluate_ranking_impact(
+    embeddings: np.ndarray,
+    queries: np.ndarray,
+    codec: EmbeddingCodec,
+    top_k: int = 10
+) -> Dict:
+    """
+    Compare rankings from compressed embeddings against full precision.
+
+    The reference scores come from SkillMatcher.compute_semantic_similarity
+    on the original float32 vectors.
+
+    Args:
+        embeddings: Candidate embeddings, shape [n, dim]
+        queries: Query (job) embeddings, shape [n_queries, dim]
+        codec: Codec under test
+        top_k: Cut-off for recall
+
+    Returns:
+        Dictionary with recall_at_k, max/mean absolute cosine error and bytes_per_vector
+    """
+    from .skill_matcher import SkillMatcher
+
+    embeddings = np.asarray(embeddings, dtype=np.float32)
+    queries = np.atleast_2d(np.asarray(queries, dtype=np.float32))
+
+    reference = np.array([
+        [SkillMatcher.compute_semantic_similarity(embedding, query) for embedding in embeddings]
+        for query in queries
+    ])
+
+    values, scales = codec.quantize(codec.prepare(embeddings))
+    approximate = _cosine_matrix(codec.prepare(queries), codec.dequantize(values, scales))
+
+    k = min(top_k, len(embeddings))
+    recalls: List[float] = []
+    for ref_row, approx_row in zip(reference, approximate):
+        expected = set(np.argsort(-ref_row, kind='stable')[:k].tolist())
+        actual = set(np.argsort(-approx_row, kind='stable')[:k].tolist())
+        recalls.append(len(expected & actual) / k)
+
+    errors = np.abs(reference - approximate)
+    return {
+        'format': codec.storage_format,
+        'dimensions': values.shape[1],
+        'bytes_per_vector': len(codec.encode(embeddings[0])),
+        'recall_at_k': round(float(np.mean(recalls)), 4),
+        'max_abs_error': round(float(errors.max()), 5),
+        'mean_abs_error': round(float(errors.mean()), 6)
+    }
@@ -0,0 +1,159 @@
+"""Executors that keep blocking model, parsing and database work off the event loop."""
+
+import asyncio
+import contextvars
+import functools
+import logging
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import BinaryIO, Callable, Optional, Tuple
+
+from .config import EXECUTOR_MODE, EXECUTOR_THREADS, EXECUTOR_PARSE_PROCESSES
+from .metrics import get_metrics
+from .profiling import profile_call
+from .resume_parser import extract_text_from_resume, clean_resume_text
+
+logger = logging.getLogger(__name__)
+
+EXECUTOR_MODES = ('thread', 'process', 'inline')
+
+
+def parse_resume(file_content, filename: str) -> Tuple[str, str]:
+    """
+    Extract and clean resume text.
+
+    Args:
+        file_content: Binary content or a binary file handle
+        filename: Name of the file
+
+    Returns:
+        Tuple of (cleaned_text, file_format)
+
+    Raises:
+        ValueError: If the document is unsupported or cannot be parsed
+    """
+    text, file_format = extract_text_from_resume(file_content, filename)
+    return clean_resume_text(text), file_format
+
+
+def _parse_resume_in_process(content: bytes, filename: str):
+    """Process pool entry point: parse, and hand back the metrics the parse recorded."""
+    metrics = get_metrics()
+    metrics.reset()
+    try:
+        result, error = parse_resume(content, filename), None
+    except ValueError as e:
+        result, error = None, e
+    return result, error, metrics.export()
+
+
+class BlockingExecutors:
+    """
+    Runs the blocking parts of request handlers outside the event loop.
+
+    Model inference, scoring and database calls go to a bounded thread pool:
+    torch and numpy release the GIL for the heavy part, and the models stay
+    shared in-process. Resume parsing (pdfplumber and python-docx are pure
+    Python and hold the GIL) uses the same threads in "thread" mode, or a
+    process pool in "process" mode so it runs truly in parallel. "inline"
+    runs everything on the event loop, as the handlers originally did; it
+    exists for comparison and debugging.
+    """
+
+    def __init__(
+        self,
+        mode: str = EXECUTOR_MODE,
+        threads: int = EXECUTOR_THREADS,
+        parse_processes: int = EXECUTOR_PARSE_PROCESSES
+    ):
+        """
+        Args:
+            mode: "thread", "process" or "inline"
+            threads: Size of the thread pool
+            parse_processes: Size of the parsing process pool ("process" mode)
+        """
+        if mode not in EXECUTOR_MODES:
+            raise ValueError(f"Unknown executor mode {mode!r}; expected one of {', '.join(EXECUTOR_MODES)}")
+        self.mode = mode
+        self._threads = None if mode == 'inline' else ThreadPoolExecutor(threads, thread_name_prefix='blocking')
+        self._processes = ProcessPoolExecutor(parse_processes) if mode == 'process' else None
+
+    async def run(self, func: Callable, *args, **kwargs):
+        """
+        Run a blocking call in the thread pool and await its result.
+
+        The call runs in a copy of the request's context, so per-request
+        state such as log sampling carries over, and it is profiled in its
+        thread when the request is (see profiling.profile_call).
+        """
+        if self._threads is None:
+            return contextvars.copy_context().run(func, *args, **kwargs)
+        call = functools.partial(contextvars.copy_context().run, profile_call, func, *args, **kwargs)
+        return await asyncio.get_running_loop().run_in_executor(self._threads, call)
+
+    async def parse_resume(self, file: BinaryIO, filename: str) -> Tuple[str, str]:
+        """
+        Extract and clean resume text off the event loop (see parse_resume).
+
+        In "process" mode the content is read and sent to a parsing process;
+        the metrics it records are merged back into this process.
+        """
+        if self._processes is None:
+            return await self.run(parse_resume, file, filename)
+
+        content = await self.run(_read_all, file)
+        result, error, counters = await asyncio.get_running_loop().run_in_executor(
+            self._processes, _parse_resume_in_process, content, filename
+        )
+        get_metrics().merge(counters)
+        if error is not None:
+            raise error
+        return result
+
+    def shutdown(self) -> None:
+        """Stop the pools, letting queued work finish."""
+        if self._threads is not None:
+            self._threads.shutdown(wait=True)
+        if self._processes is not None:
+            self._processes.shutdown(wait=True)
+
+
+def _read_all(file: BinaryIO) -> bytes:
+    file.seek(0)
+    return file.read()
+
+
+# Global instance
+_executors: BlockingExecutors = None
+
+
+def get_executors() -> BlockingExecutors:
+    """Get or initialize global executors."""
+    global _executors
+    if _executors is None:
+        _executors = BlockingExecutors()
+    return _executors
+
+
+def configure_executors(mode: Optional[str] = None, **kwargs) -> BlockingExecutors:
+    """
+    Replace the global executors, shutting down the previous pools.
+
+    Args:
+        mode: Executor mode (defaults to EXECUTOR_MODE)
+        **kwargs: Other BlockingExecutors arguments
+
+    Returns:
+        The new global executors
+    """
+    global _executors
+    previous = _executors
+    _executors = BlockingExecutors(mode or EXECUTOR_MODE, **kwargs)
+    if previous is not None:
+        previous.shutdown()
+    logger.info("Blocking work runs in %s mode", _executors.mode)
+    return _executors
+
+
+async def run_blocking(func: Callable, *args, **kwargs):
+    """Run a blocking call through the global executors (see BlockingExecutors.run)."""
+    return await get_executors().run(func, *args, **kwargs)
@@ -0,0 +1,174 @@
+"""Streaming exporters for candidate/application reports (XLSX, CSV, Parquet)."""
+
+import csv
+import io
+import re
+from typing import Dict, Iterable, Iterator, List
+
+import xlsxwriter
+
+from .config import EXPORT_CHUNK_ROWS
+
+# Column name -> fixed width, so no pass over the data is needed to size columns
+EXPORT_COLUMNS = [
+    ('Name', 24),
+    ('Email', 32),
+    ('Phone', 16),
+    ('Experience', 14),
+    ('Current Status', 16),
+    ('Match %', 10),
+    ('Matched Skills', 48),
+    ('Missing Skills', 48),
+    ('Semantic Score', 15),
+    ('Skill Score', 12),
+    ('Applied At', 28),
+]
+
+EXPORT_FORMATS = {
+    'xlsx': 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+    'csv': 'text/csv',
+    'parquet': 'application/vnd.apache.parquet',
+}
+
+
+def format_export_row(candidate: Dict) -> List[str]:
+    """
+    Format one application/candidate record as an export row.
+
+    Args:
+        candidate: Application dictionary (candidateName, matchPercentage, ...)
+
+    Returns:
+        Cell values in EXPORT_COLUMNS order
+    """
+    status = candidate.get('status')
+    return [
+        candidate.get('candidateName', ''),
+        candidate.get('candidateEmail', ''),
+        candidate.get('phone', '') or '',
+        candidate.get('experience', '') or '',
+        status.replace('_', ' ').title() if status else 'Applied',
+        f"{candidate.get('matchPercentage', 0):.1f}%",
+        ', '.join(candidate.get('matchedSkills', [])),
+        ', '.join(candidate.get('missingSkills', [])),
+        f"{candidate.get('semanticScore', 0)*100:.1f}%" if candidate.get('semanticScore') else '',
+        f"{candidate.get('skillScore', 0)*100:.1f}%" if candidate.get('skillScore') else '',
+        str(candidate.get('appliedAt', '') or ''),
+    ]
+
+
+def safe_export_filename(title: str, extension: str) -> str:
+    """
+    Build an ASCII-only attachment filename from a job title.
+
+    Args:
+        title: Job title or identifier
+        extension: File extension without the dot
+
+    Returns:
+        Sanitized filename
+    """
+    safe_title = re.sub(r'[^\x00-\x7F]+', '_', title)
+    safe_title = re.sub(r'[\\/*?:"<>|]', '_', safe_title)
+    return f"{safe_title.strip('_')}_candidates.{extension}"
+
+
+def write_xlsx(rows: Iterable[List[str]], path: str) -> int:
+    """
+    Write rows to an XLSX file in xlsxwriter's constant_memory mode.
+
+    Rows are flushed to disk as they are written, so memory does not grow
+    with the number of rows.
+
+    Args:
+        rows: Rows in EXPORT_COLUMNS order
+        path: Output file path
+
+    Returns:
+        Number of data rows written
+    """
+    workbook = xlsxwriter.Workbook(path, {'constant_memory': True})
+    try:
+        worksheet = workbook.add_worksheet('Candidates')
+        header_format = workbook.add_format({'bold': True})
+        for col, (name, width) in enumerate(EXPORT_COLUMNS):
+            worksheet.set_column(col, col, width)
+            worksheet.write_string(0, col, name, header_format)
+
+        count = 0
+        for count, row in enumerate(rows, 1):
+            for col, value in enumerate(row):
+                worksheet.write_string(count, col, value)
+    finally:
+        workbook.close()
+    return count
+
+
+def iter_csv(rows: Iterable[List[str]], chunk_rows: int = EXPORT_CHUNK_ROWS) -> Iterator[bytes]:
+    """
+    Encode rows as CSV, yielding one chunk per chunk_rows rows.
+
+    Args:
+        rows: Rows in EXPORT_COLUMNS order
+        chunk_rows: Rows per yielded chunk
+
+    Yields:
+        UTF-8 encoded CSV chunks, starting with the header
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow([name for name, _ in EXPORT_COLUMNS])
+    pending = 0
+    for row in rows:
+        writer.writerow(row)
+        pending += 1
+        if pending >= chunk_rows:
+            yield buffer.getvalue().encode('utf-8')
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+    if buffer.tell():
+        yield buffer.getvalue().encode('utf-8')
+
+
+def _rows_to_table(pa, rows: List[List[str]], schema):
+    columns = [pa.array(list(column), type=pa.string()) for column in zip(*rows)]
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+def write_parquet(rows: Iterable[List[str]], path: str, chunk_rows: int = EXPORT_CHUNK_ROWS) -> int:
+    """
+    Write rows to a Parquet file one row group per chunk.
+
+    Args:
+        rows: Rows in EXPORT_COLUMNS order
+        path: Output file path
+        chunk_rows: Rows per row group
+
+    Returns:
+        Number of data rows written
+
+    Raises:
+        ValueError: If pyarrow is not installed
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ValueError("Parquet export requires pyarrow to be installed")
+
+    names = [name for name, _ in EXPORT_COLUMNS]
+    schema = pa.schema([(name, pa.string()) for name in names])
+    count = 0
+    with pq.ParquetWriter(path, schema) as writer:
+        chunk = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= chunk_rows:
+                writer.write_table(_rows_to_table(pa, chunk, schema))
+                count += len(chunk)
+                chunk = []
+        if chunk:
+            writer.write_table(_rows_to_table(pa, chunk, schema))
+            count += len(chunk)
+    return count
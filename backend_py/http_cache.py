@@ -0,0 +1,90 @@
+"""HTTP caching helpers: strong ETags, If-None-Match handling and a small response LRU."""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Optional
+
+from fastapi import Response
+
+
+def compute_etag(payload) -> str:
+    """Compute a strong ETag from the JSON form of a payload."""
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode()
+    return '"' + hashlib.sha1(encoded).hexdigest() + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Whether an If-None-Match header matches an ETag.
+
+    Uses the weak comparison RFC 9110 prescribes for If-None-Match, so a
+    W/ prefix added by a proxy still matches; "*" matches anything.
+    """
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(',')]
+    return '*' in tags or etag in [tag[2:] if tag.startswith('W/') else tag for tag in tags]
+
+
+def not_modified(
+    response: Response,
+    etag: str,
+    if_none_match: Optional[str],
+    cache_control: str = 'no-cache'
+) -> Optional[Response]:
+    """
+    Apply caching headers; return a 304 response if the client's copy is current.
+
+    Args:
+        response: The endpoint's response (headers are set on it)
+        etag: Strong ETag of the current representation
+        if_none_match: The request's If-None-Match header
+        cache_control: Cache-Control value
+
+    Returns:
+        A 304 Response to return as is, or None to send the full body
+    """
+    headers = {'ETag': etag, 'Cache-Control': cache_control}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
+
+
+class LRUCache:
+    """Thread-safe least-recently-used cache."""
+
+    def __init__(self, maxsize: int):
+        """
+        Args:
+            maxsize: Maximum number of entries
+        """
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Any, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key, default=None):
+        """Cached value for key (marking it recently used), or default."""
+        with self._lock:
+            if key not in self._entries:
+                return default
+            self._entries.move_to_end(key)
+            return self._entries[key]
+
+    def put(self, key, value) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
@@ -0,0 +1,94 @@
+"""Keep per-process indexes built from a MongoDB collection in step with writes made elsewhere."""
+
+import logging
+import threading
+import time
+from typing import Callable, Optional, Tuple
+
+from .config import INDEX_REFRESH_CHECK_SECONDS, INDEX_REFRESH_MAX_AGE_SECONDS
+
+logger = logging.getLogger(__name__)
+
+
+def collection_version(collection) -> Tuple[int, Optional[object]]:
+    """
+    Cheap fingerprint of a collection: estimated document count and latest updatedAt.
+
+    Args:
+        collection: pymongo Collection
+
+    Returns:
+        Tuple of (count, latest updatedAt or None)
+    """
+    latest = collection.find_one(
+        {'updatedAt': {'$exists': True}}, {'updatedAt': 1, '_id': 0}, sort=[('updatedAt', -1)]
+    )
+    return collection.estimated_document_count(), latest.get('updatedAt') if latest else None
+
+
+class IndexRefresher:
+    """
+    Decides when an in-process index must be rebuilt from its collection.
+
+    Each API worker builds its indexes from MongoDB and updates them for the
+    writes it handles itself. Writes by other workers or by the Node backend
+    are picked up here. At most every `check_interval` seconds, the
+    collection's fingerprint is compared with the one taken when the index
+    was built. The index is rebuilt when the fingerprint differs, or when the
+    index is older than `max_age` (this catches edits that change neither the
+    count nor updatedAt). Only the first load blocks callers. Later rebuilds
+    run in one caller while the others keep using the current index.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        check_interval: float = INDEX_REFRESH_CHECK_SECONDS,
+        max_age: float = INDEX_REFRESH_MAX_AGE_SECONDS
+    ):
+        """
+        Args:
+            name: Index name used in log messages
+            check_interval: Minimum seconds between fingerprint checks
+            max_age: Seconds after which the index is rebuilt regardless
+        """
+        self.name = name
+        self.check_interval = check_interval
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._version = None
+        self._built_at = 0.0
+        self._checked_at = 0.0
+
+    def ensure_fresh(self, collection, index, rebuild: Callable[[], None]) -> None:
+        """
+        Build the index on first use and rebuild it when the collection changed.
+
+        Args:
+            collection: Source pymongo Collection
+            index: Index with a `loaded` attribute
+            rebuild: Reloads the index from the collection
+        """
+        if index.loaded:
+            if time.monotonic() - self._checked_at < self.check_interval:
+                return
+            if not self._lock.acquire(blocking=False):
+                return  # Another caller is checking or rebuilding
+        else:
+            self._lock.acquire()
+        try:
+            now = time.monotonic()
+            if index.loaded and now - self._checked_at < self.check_interval:
+                return
+            self._checked_at = now
+            # Taken before reading, so writes made during the rebuild trigger another one
+            version = collection_version(collection)
+            if index.loaded and version == self._version and now - self._built_at < self.max_age:
+                return
+            if index.loaded:
+                logger.info("Rebuilding the %s index: the collection changed or the index expired", self.name)
+            rebuild()
+            self._version = version
+            self._built_at = self._checked_at = time.monotonic()
+        finally:
+            self._lock.release()
@@ -0,0 +1,269 @@
+"""Bounded upload ingestion: size limits and content hashes without copying uploads into memory."""
+
+import hashlib
+import logging
+import posixpath
+import tarfile
+import zipfile
+from tempfile import SpooledTemporaryFile
+from typing import BinaryIO, Iterator, List, Optional, Tuple
+
+from fastapi import UploadFile
+
+from .config import (
+    MAX_FILE_SIZE,
+    INGEST_CHUNK_SIZE,
+    ALLOWED_EXTENSIONS,
+    ARCHIVE_MAX_ENTRIES,
+    ARCHIVE_MAX_TOTAL_SIZE,
+    ARCHIVE_MAX_COMPRESSION_RATIO
+)
+from .utils import validate_file_extension
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_EXTENSIONS = ('.zip', '.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tbz2', '.tar.xz', '.txz')
+
+
+class FileTooLargeError(ValueError):
+    """Raised when an upload exceeds MAX_FILE_SIZE."""
+
+
+class ArchiveLimitError(ValueError):
+    """Raised when an archive exceeds the entry count, total size or compression ratio limits."""
+
+
+class IngestedFile:
+    """An upload that passed the size limit, with its content hash and a file handle for the parsers."""
+
+    def __init__(self, filename: str, file: BinaryIO, size: int, sha1: str):
+        """
+        Args:
+            filename: Client-supplied file name
+            file: Binary file handle positioned at the start of the content
+            size: Content size in bytes
+            sha1: Hex SHA-1 of the content (same as dedup.content_hash of the bytes)
+        """
+        self.filename = filename
+        self.file = file
+        self.size = size
+        self.sha1 = sha1
+
+
+async def ingest_upload(
+    upload: UploadFile,
+    max_size: int = MAX_FILE_SIZE,
+    chunk_size: int = INGEST_CHUNK_SIZE
+) -> IngestedFile:
+    """
+    Check an upload against the size limit and hash it, one chunk at a time.
+
+    The multipart parser has already spooled the upload to a temporary file
+    (in memory up to 1MB, on disk beyond), so the parsers are handed that
+    file instead of a bytes copy of it. Uploads whose declared size is over
+    the limit are rejected before any content is read.
+
+    Args:
+        upload: Uploaded file
+        max_size: Maximum size in bytes
+        chunk_size: Bytes read per chunk
+
+    Returns:
+        IngestedFile positioned at the start of the content
+
+    Raises:
+        FileTooLargeError: If the upload exceeds max_size
+    """
+    if upload.size is not None and upload.size > max_size:
+        raise FileTooLargeError(_too_large_message(upload.filename, max_size))
+
+    digest = hashlib.sha1()
+    size = 0
+    await upload.seek(0)
+    while True:
+        chunk = await upload.read(chunk_size)
+        if not chunk:
+            break
+        size += len(chunk)
+        if size > max_size:
+            raise FileTooLargeError(_too_large_message(upload.filename, max_size))
+        digest.update(chunk)
+    await upload.seek(0)
+    return IngestedFile(upload.filename, upload.file, size, digest.hexdigest())
+
+
+def _too_large_message(filename: str, max_size: int) -> str:
+    return f"{filename} exceeds the maximum file size of {max_size // (1024 * 1024)}MB"
+
+
+def is_archive(filename: str) -> bool:
+    """Whether a file name has a supported zip or tar extension."""
+    return bool(filename) and filename.lower().endswith(ARCHIVE_EXTENSIONS)
+
+
+def _entry_basename(name: str) -> str:
+    # Archives made on Windows may use backslashes as separators
+    return posixpath.basename(name.replace('\\', '/'))
+
+
+class ArchiveReader:
+    """
+    Streams the resume entries of a zip or tar archive, one at a time.
+
+    Each accepted entry is decompressed into its own in-memory spool (never
+    to disk) while its size and hash are computed, and is yielded before
+    the next entry is read. Entries with other extensions, oversize entries
+    and unreadable entries are skipped and listed in `skipped`. Exceeding the
+    entry count, the total uncompressed size or the compression ratio
+    aborts the whole archive, since that is what decompression bombs do.
+    """
+
+    def __init__(
+        self,
+        file: BinaryIO,
+        filename: str,
+        allowed_extensions=ALLOWED_EXTENSIONS,
+        max_entries: int = ARCHIVE_MAX_ENTRIES,
+        max_total_size: int = ARCHIVE_MAX_TOTAL_SIZE,
+        max_ratio: float = ARCHIVE_MAX_COMPRESSION_RATIO,
+        max_entry_size: int = MAX_FILE_SIZE
+    ):
+        """
+        Args:
+            file: Seekable binary handle of the archive
+            filename: Archive name (selects zip or tar)
+            allowed_extensions: Entry extensions to ingest
+            max_entries: Maximum number of entries of any kind
+            max_total_size: Maximum total uncompressed bytes
+            max_ratio: Maximum uncompressed / compressed size
+            max_entry_size: Maximum size of one entry (larger entries are skipped)
+        """
+        self.file = file
+        self.filename = filename
+        self.allowed_extensions = allowed_extensions
+        self.max_entries = max_entries
+        self.max_total_size = max_total_size
+        self.max_ratio = max_ratio
+        self.max_entry_size = max_entry_size
+        self.entries = 0
+        self.total_size = 0
+        self.skipped: List[Tuple[str, str]] = []
+
+        file.seek(0, 2)
+        self.archive_size = max(file.tell(), 1)
+        file.seek(0)
+
+    def __iter__(self) -> Iterator[IngestedFile]:
+        """
+        Yield accepted entries as IngestedFile (filename is the entry's base name).
+
+        Raises:
+            ArchiveLimitError: If a limit is exceeded
+            ValueError: If the archive cannot be read
+        """
+        try:
+            if self.filename.lower().endswith('.zip'):
+                yield from self._iter_zip()
+            else:
+                yield from self._iter_tar()
+        except (zipfile.BadZipFile, tarfile.TarError) as e:
+            raise ValueError(f"Could not read archive {self.filename}: {str(e)}")
+
+    def _iter_zip(self) -> Iterator[IngestedFile]:
+        with zipfile.ZipFile(self.file) as archive:
+            members = archive.infolist()
+            # The central directory gives every count and size before anything is decompressed
+            self._count_entries(len(members))
+            if sum(info.file_size for info in members) > self.max_total_size:
+                raise ArchiveLimitError(self._total_size_message())
+
+            for info in members:
+                if info.is_dir():
+                    continue
+                if not self._accept(info.filename, info.file_size):
+                    continue
+                try:
+                    with archive.open(info) as stream:
+                        ingested = self._spool(info.filename, stream, info.compress_size)
+                except (RuntimeError, zipfile.BadZipFile, NotImplementedError) as e:
+                    # Encrypted, corrupt or unsupported compression
+                    self._skip(info.filename, str(e))
+                    continue
+                if ingested is not None:
+                    yield ingested
+
+    def _iter_tar(self) -> Iterator[IngestedFile]:
+        with tarfile.open(fileobj=self.file, mode='r:*') as archive:
+            # Members are read header by header, so entries are counted as they come
+            for member in archive:
+                self._count_entries(self.entries + 1)
+                if not member.isfile():
+                    continue
+                if not self._accept(member.name, member.size):
+                    # Skipping still decompresses the entry's bytes in compressed tars
+                    self._add_total(member.size)
+                    continue
+                stream = archive.extractfile(member)
+                ingested = self._spool(member.name, stream, None)
+                if ingested is not None:
+                    yield ingested
+
+    def _count_entries(self, count: int) -> None:
+        self.entries = count
+        if count > self.max_entries:
+            raise ArchiveLimitError(
+                f"{self.filename} has more than the maximum of {self.max_entries} entries"
+            )
+
+    def _accept(self, name: str, declared_size: int) -> bool:
+        base_name = _entry_basename(name)
+        if not base_name or base_name.startswith('.') or name.startswith('__MACOSX/'):
+            return False
+        if not validate_file_extension(base_name, self.allowed_extensions):
+            self._skip(name, "unsupported format")
+            return False
+        if declared_size > self.max_entry_size:
+            self._skip(name, "exceeds the maximum file size")
+            return False
+        return True
+
+    def _skip(self, name: str, reason: str) -> None:
+        logger.warning("Skipping archive entry %s: %s", name, reason)
+        self.skipped.append((name, reason))
+
+    def _add_total(self, size: int) -> None:
+        self.total_size += size
+        if self.total_size > self.max_total_size:
+            raise ArchiveLimitError(self._total_size_message())
+        if self.total_size > self.archive_size * self.max_ratio:
+            raise ArchiveLimitError(
+                f"{self.filename} exceeds the maximum compression ratio of {self.max_ratio:g}"
+            )
+
+    def _total_size_message(self) -> str:
+        return (f"{self.filename} exceeds the maximum uncompressed size of "
+                f"{self.max_total_size // (1024 * 1024)}MB")
+
+    def _spool(self, name: str, stream: BinaryIO, compressed_size: Optional[int]) -> Optional[IngestedFile]:
+        """Decompress one entry into memory in chunks, checking every limit as bytes arrive."""
+        spool = SpooledTemporaryFile(max_size=self.max_entry_size + 1)
+        digest = hashlib.sha1()
+        size = 0
+        while True:
+            chunk = stream.read(INGEST_CHUNK_SIZE)
+            if not chunk:
+                break
+            size += len(chunk)
+            self._add_total(len(chunk))
+            if compressed_size is not None and size > max(compressed_size, 1) * self.max_ratio:
+                raise ArchiveLimitError(
+                    f"{name} in {self.filename} exceeds the maximum compression ratio of {self.max_ratio:g}"
+                )
+            if size > self.max_entry_size:
+                spool.close()
+                self._skip(name, "exceeds the maximum file size")
+                return None
+            digest.update(chunk)
+            spool.write(chunk)
+        spool.seek(0)
+        return IngestedFile(_entry_basename(name), spool, size, digest.hexdigest())
@@ -0,0 +1,222 @@
+"""Cached job catalog fetched from the Node.js backend, with precomputed skill analytics."""
+
+import json
+import logging
+import threading
+import time
+from collections import Counter
+from typing import Dict, List, Optional
+
+import requests
+
+from .config import JOBS_API_URL, JOBS_CACHE_TTL
+from .http_cache import compute_etag
+
+logger = logging.getLogger(__name__)
+
+# Served by the Explore page when the jobs API is unavailable
+SAMPLE_JOBS = [
+    {
+        "id": 1,
+        "title": "Senior Python Developer",
+        "company": "TechCorp Inc.",
+        "location": "San Francisco, CA",
+        "type": "Full-time",
+        "experience": "Senior",
+        "description": "We are looking for an experienced Python developer with expertise in Django, Flask, and cloud technologies. You will be working on scalable web applications and microservices architecture.",
+        "requiredSkills": ["Python", "Django", "Flask", "PostgreSQL", "AWS", "Docker", "REST API"],
+        "optionalSkills": ["React", "Redis", "Kubernetes", "GraphQL"],
+        "salary": "$120,000 - $160,000",
+        "posted": "2 days ago"
+    },
+    {
+        "id": 2,
+        "title": "Frontend React Developer",
+        "company": "Digital Solutions Ltd",
+        "location": "New York, NY",
+        "type": "Full-time",
+        "experience": "Mid-level",
+        "description": "Join our frontend team to build amazing user interfaces using React, TypeScript, and modern CSS frameworks. Experience with state management and testing required.",
+        "requiredSkills": ["React", "JavaScript", "TypeScript", "CSS", "HTML", "Redux"],
+        "optionalSkills": ["Next.js", "Vue.js", "Angular", "Testing Libraries"],
+        "salary": "$90,000 - $120,000",
+        "posted": "1 week ago"
+    },
+    {
+        "id": 3,
+        "title": "Full Stack Node.js Engineer",
+        "company": "StartupHub",
+        "location": "Remote",
+        "type": "Full-time",
+        "experience": "Mid-level",
+        "description": "Looking for a versatile Node.js developer who can handle both frontend and backend development. Experience with Express, MongoDB, and modern frontend frameworks required.",
+        "requiredSkills": ["Node.js", "Express", "MongoDB", "JavaScript", "React", "REST API"],
+        "optionalSkills": ["TypeScript", "PostgreSQL", "Docker", "AWS", "GraphQL"],
+        "salary": "$100,000 - $140,000",
+        "posted": "3 days ago"
+    },
+    {
+        "id": 4,
+        "title": "Data Science Engineer",
+        "company": "AI Analytics Corp",
+        "location": "Boston, MA",
+        "type": "Full-time",
+        "experience": "Senior",
+        "description": "Seeking a data scientist with strong Python skills and experience in machine learning, deep learning, and big data technologies. PhD or Masters preferred.",
+        "requiredSkills": ["Python", "Machine Learning", "TensorFlow", "SQL", "Statistics", "Data Analysis"],
+        "optionalSkills": ["PyTorch", "Scikit-learn", "Big Data", "AWS", "Docker"],
+        "salary": "$130,000 - $180,000",
+        "posted": "1 day ago"
+    },
+    {
+        "id": 5,
+        "title": "DevOps Engineer",
+        "company": "Cloud Systems Inc",
+        "location": "Seattle, WA",
+        "type": "Full-time",
+        "experience": "Mid-level",
+        "description": "We need a DevOps engineer to manage our cloud infrastructure, implement CI/CD pipelines, and ensure system reliability. Experience with AWS and containerization required.",
+        "requiredSkills": ["AWS", "Docker", "Kubernetes", "CI/CD", "Linux", "Bash"],
+        "optionalSkills": ["Terraform", "Ansible", "Monitoring Tools", "Networking"],
+        "salary": "$110,000 - $150,000",
+        "posted": "4 days ago"
+    },
+    {
+        "id": 6,
+        "title": "Mobile React Native Developer",
+        "company": "AppWorks Studio",
+        "location": "Austin, TX",
+        "type": "Full-time",
+        "experience": "Mid-level",
+        "description": "Create amazing mobile experiences using React Native. You'll work on iOS and Android apps, collaborate with designers, and implement best practices for mobile development.",
+        "requiredSkills": ["React Native", "JavaScript", "React", "Mobile Development", "iOS", "Android"],
+        "optionalSkills": ["TypeScript", "Redux", "Native Modules", "Performance Optimization"],
+        "salary": "$95,000 - $130,000",
+        "posted": "5 days ago"
+    }
+]
+
+
+def build_skills_analysis(jobs: List[Dict]) -> List[Dict]:
+    """
+    Count how many jobs require or optionally list each skill, in one pass.
+
+    Args:
+        jobs: Job dictionaries with requiredSkills/optionalSkills lists
+
+    Returns:
+        Skill analysis rows sorted by number of jobs (descending)
+    """
+    required = Counter()
+    optional = Counter()
+    for job in jobs:
+        # A skill listed twice in one job still counts that job once
+        required.update(set(job.get('requiredSkills') or []))
+        optional.update(set(job.get('optionalSkills') or []))
+
+    skills_analysis = []
+    for skill in required.keys() | optional.keys():
+        required_count = required[skill]
+        total_count = required_count + optional[skill]
+        skills_analysis.append({
+            "name": skill,
+            "requiredIn": required_count,
+            "optionalIn": optional[skill],
+            "totalJobs": total_count,
+            "importance": "core" if required_count > total_count * 0.5 else "optional"
+        })
+
+    skills_analysis.sort(key=lambda x: (-x['totalJobs'], x['name']))
+    return skills_analysis
+
+
+class JobsCatalog:
+    """Job list cache that refreshes from the jobs API at most once per TTL."""
+
+    def __init__(
+        self,
+        fallback_jobs: Optional[List[Dict]] = None,
+        url: str = JOBS_API_URL,
+        ttl: float = JOBS_CACHE_TTL
+    ):
+        """
+        Initialize the catalog.
+
+        Args:
+            fallback_jobs: Jobs to serve when the jobs API is unavailable
+            url: Jobs API endpoint
+            ttl: Seconds a fetched snapshot stays fresh
+        """
+        self.fallback_jobs = fallback_jobs or []
+        self.url = url
+        self.ttl = ttl
+        self._snapshot: Optional[Dict] = None
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+
+    def cached_snapshot(self) -> Optional[Dict]:
+        """Return the current snapshot if it is still fresh, without any I/O."""
+        if self._snapshot is not None and time.monotonic() < self._expires_at:
+            return self._snapshot
+        return None
+
+    def get_snapshot(self) -> Dict:
+        """
+        Return a fresh snapshot, fetching from the jobs API if needed.
+
+        This may block on the network; call it from a worker thread.
+
+        Returns:
+            Dictionary with jobs, skills (analysis), etag and source
+        """
+        snapshot = self.cached_snapshot()
+        if snapshot is not None:
+            return snapshot
+
+        with self._lock:
+            # Another thread may have refreshed while we waited
+            snapshot = self.cached_snapshot()
+            if snapshot is not None:
+                return snapshot
+
+            jobs = self._fetch()
+            source = 'backend'
+            if not jobs:
+                jobs = self.fallback_jobs
+                source = 'fallback'
+
+            self._snapshot = {
+                'jobs': jobs,
+                'skills': build_skills_analysis(jobs),
+                'etag': compute_etag(jobs),
+                'source': source
+            }
+            self._expires_at = time.monotonic() + self.ttl
+            return self._snapshot
+
+    def invalidate(self) -> None:
+        """Drop the cached snapshot so the next call refetches."""
+        self._expires_at = 0.0
+
+    def _fetch(self) -> List[Dict]:
+        try:
+            response = requests.get(self.url, timeout=5)
+            if response.status_code == 200:
+                jobs = response.json()
+                logger.info("Fetched %d jobs from Node.js backend", len(jobs))
+                return jobs
+        except Exception as e:
+            logger.warning("Could not fetch jobs from Node.js backend: %s", e)
+        return []
+
+
+# Global instance
+_jobs_catalog: JobsCatalog = None
+
+
+def get_jobs_catalog() -> JobsCatalog:
+    """Get or initialize global job catalog instance."""
+    global _jobs_catalog
+    if _jobs_catalog is None:
+        _jobs_catalog = JobsCatalog(fallback_jobs=SAMPLE_JOBS)
+    return _jobs_catalog
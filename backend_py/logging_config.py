@@ -0,0 +1,113 @@
+"""Logging setup: structured records, per-request sampling and off-thread I/O."""
+
+import atexit
+import contextvars
+import json
+import logging
+import logging.handlers
+import queue
+import random
+from typing import Optional
+
+from .config import LOG_LEVEL, LOG_FORMAT, LOG_SAMPLE_RATE
+
+TEXT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_request_sampled = contextvars.ContextVar('request_sampled', default=False)
+
+
+class StructuredFormatter(logging.Formatter):
+    """
+    Formatter that renders the `fields` passed via `extra`.
+
+    Text mode appends them as key=value pairs; JSON mode emits one JSON
+    object per record.
+    """
+
+    def __init__(self, output_format: str = 'text'):
+        super().__init__(TEXT_FORMAT)
+        self.output_format = output_format
+
+    def format(self, record: logging.LogRecord) -> str:
+        fields = getattr(record, 'fields', None) or {}
+        if self.output_format == 'json':
+            payload = {
+                'time': self.formatTime(record),
+                'logger': record.name,
+                'level': record.levelname,
+                'message': record.getMessage(),
+                **fields
+            }
+            if record.exc_info:
+                payload['exc_info'] = self.formatException(record.exc_info)
+            return json.dumps(payload, default=str)
+
+        message = super().format(record)
+        if fields:
+            message += ' ' + ' '.join(f"{key}={value}" for key, value in fields.items())
+        return message
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler that leaves formatting to the listener thread.
+
+    The stock handler formats the message in the calling thread; records
+    here stay in-process, so they can be queued as-is.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def configure_logging(level: str = LOG_LEVEL, output_format: str = LOG_FORMAT) -> None:
+    """
+    Route all logging through a queue drained by a background listener.
+
+    Safe to call more than once; only the first call has an effect.
+
+    Args:
+        level: Root log level name
+        output_format: "text" or "json"
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(StructuredFormatter(output_format))
+
+    log_queue = queue.SimpleQueue()
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(DeferredQueueHandler(log_queue))
+    root.setLevel(level)
+
+    _listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+    atexit.register(_listener.stop)
+
+
+def start_request_sampling(rate: float = LOG_SAMPLE_RATE) -> bool:
+    """
+    Decide whether the current request emits per-item debug records.
+
+    Call once at the start of a request handler; the decision is stored in
+    a context variable so it only applies to that request.
+
+    Args:
+        rate: Fraction of requests to sample (0-1)
+
+    Returns:
+        True if this request is sampled
+    """
+    sampled = rate >= 1 or random.random() < rate
+    _request_sampled.set(sampled)
+    return sampled
+
+
+def should_log_item(logger: logging.Logger) -> bool:
+    """Check whether per-item debug records should be emitted for this request."""
+    return _request_sampled.get() and logger.isEnabledFor(logging.DEBUG)
@@ -0,0 +1,78 @@
+"""In-process counters exposed by /api/metrics."""
+
+import threading
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+
+class MetricsRegistry:
+    """Thread-safe named counters with optional labels (per worker process)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], float] = defaultdict(float)
+
+    def increment(self, name: str, amount: float = 1, **labels: str) -> None:
+        """
+        Add to a counter.
+
+        Args:
+            name: Counter name, e.g. "resume_rejections_total"
+            amount: Amount to add
+            **labels: Label values, e.g. reason="image_only_pdf"
+        """
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] += amount
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """
+        Current counter values.
+
+        Returns:
+            Mapping of counter name to {label string: value}; the label
+            string is "" for unlabelled counters and "k=v,k2=v2" otherwise
+        """
+        with self._lock:
+            items = list(self._counters.items())
+        result: Dict[str, Dict[str, float]] = {}
+        for (name, labels), value in sorted(items):
+            result.setdefault(name, {})[','.join(f"{k}={v}" for k, v in labels)] = value
+        return result
+
+    def render_prometheus(self) -> str:
+        """Counters in the Prometheus text exposition format."""
+        with self._lock:
+            items = sorted(self._counters.items())
+        lines = []
+        for (name, labels), value in items:
+            label_text = ','.join(f'{k}="{v}"' for k, v in labels)
+            lines.append(f"{name}{{{label_text}}} {value:g}" if labels else f"{name} {value:g}")
+        return '\n'.join(lines) + '\n'
+
+    def export(self) -> List[Tuple[str, Dict[str, str], float]]:
+        """Counters as (name, labels, value) tuples, e.g. to send from a worker process."""
+        with self._lock:
+            return [(name, dict(labels), value) for (name, labels), value in self._counters.items()]
+
+    def merge(self, counters: List[Tuple[str, Dict[str, str], float]]) -> None:
+        """Add counters exported by another registry."""
+        for name, labels, value in counters:
+            self.increment(name, value, **labels)
+
+    def reset(self) -> None:
+        """Clear all counters."""
+        with self._lock:
+            self._counters.clear()
+
+
+# Global instance
+_metrics: MetricsRegistry = None
+
+
+def get_metrics() -> MetricsRegistry:
+    """Get or initialize global metrics registry."""
+    global _metrics
+    if _metrics is None:
+        _metrics = MetricsRegistry()
+    return _metrics
@@ -0,0 +1,269 @@
+"""
+Model server: one process owns the NLP models and serves every API worker.
+
+Start it once per host, then start the API workers with MODEL_SERVER_SOCKET
+pointing at the same path:
+
+    MODEL_SERVER_SOCKET=/tmp/resume-models.sock python -m backend_py.model_server
+    MODEL_SERVER_SOCKET=/tmp/resume-models.sock uvicorn backend_py.app:app --workers 4
+
+Embedding requests from all workers that arrive within a short window are
+encoded together in one model call.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import socket
+import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from .config import (
+    BATCH_SIZE,
+    MODEL_SERVER_SOCKET,
+    MODEL_SERVER_BATCH_WINDOW_MS,
+    MODEL_SERVER_MAX_BATCH,
+    MODEL_SERVER_TIMEOUT
+)
+from .logging_config import configure_logging
+from .nlp_processor import NLPProcessor
+
+logger = logging.getLogger(__name__)
+
+# Frame: header length, payload length, then a JSON header and raw payload bytes
+_FRAME = struct.Struct('>II')
+
+
+def _encode_frame(header: Dict, payload: bytes = b'') -> bytes:
+    encoded = json.dumps(header).encode('utf-8')
+    return _FRAME.pack(len(encoded), len(payload)) + encoded + payload
+
+
+class ModelServer:
+    """Serves get_embeddings and extract_key_phrases over a Unix socket with micro-batching."""
+
+    def __init__(
+        self,
+        processor: NLPProcessor,
+        socket_path: str = MODEL_SERVER_SOCKET,
+        batch_window_ms: float = MODEL_SERVER_BATCH_WINDOW_MS,
+        max_batch: int = MODEL_SERVER_MAX_BATCH
+    ):
+        """
+        Args:
+            processor: NLPProcessor that owns the models
+            socket_path: Unix socket to listen on
+            batch_window_ms: How long to wait for more embedding requests to join a batch
+            max_batch: Texts per batch that end the wait early
+        """
+        self.processor = processor
+        self.socket_path = socket_path
+        self.batch_window = batch_window_ms / 1000.0
+        self.max_batch = max_batch
+        # Models run on one thread; batching, not concurrency, provides the throughput
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='model')
+        self._queue: asyncio.Queue = None
+
+    async def serve_forever(self) -> None:
+        """Listen on the socket until cancelled."""
+        if os.path.exists(self.socket_path):
+            os.remove(self.socket_path)
+        self._queue = asyncio.Queue()
+        batcher = asyncio.ensure_future(self._batch_embeddings())
+        server = await asyncio.start_unix_server(self._handle, path=self.socket_path)
+        os.chmod(self.socket_path, 0o600)
+        logger.info("Model server listening on %s", self.socket_path)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            batcher.cancel()
+            if os.path.exists(self.socket_path):
+                os.remove(self.socket_path)
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                try:
+                    header_length, payload_length = _FRAME.unpack(await reader.readexactly(_FRAME.size))
+                    request = json.loads(await reader.readexactly(header_length))
+                    await reader.readexactly(payload_length)
+                except asyncio.IncompleteReadError:
+                    return  # Client closed the connection
+
+                try:
+                    writer.write(await self._dispatch(request))
+                except Exception as e:
+                    logger.error("Model server request failed: %s", e)
+                    writer.write(_encode_frame({'error': str(e)}))
+                await writer.drain()
+        finally:
+            writer.close()
+
+    async def _dispatch(self, request: Dict) -> bytes:
+        op = request.get('op')
+        if op == 'embed':
+            embeddings = await self._embed(request['texts'])
+            return _encode_frame(
+                {'shape': list(embeddings.shape), 'dtype': 'float32'},
+                embeddings.astype(np.float32).tobytes()
+            )
+        if op == 'key_phrases':
+            phrases = await asyncio.get_running_loop().run_in_executor(
+                self._executor, self.processor.extract_key_phrases, request['text'], request['max_phrases']
+            )
+            return _encode_frame({'result': phrases})
+        if op == 'ping':
+            return _encode_frame({'result': 'pong'})
+        raise ValueError(f"Unknown operation: {op}")
+
+    async def _embed(self, texts: List[str]) -> np.ndarray:
+        if not texts:
+            return np.zeros(0, dtype=np.float32)
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((texts, future))
+        return await future
+
+    async def _batch_embeddings(self) -> None:
+        """Collect embedding requests for up to batch_window and encode them in one call."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            count = len(batch[0][0])
+            deadline = loop.time() + self.batch_window
+            while count < self.max_batch:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+                count += len(batch[-1][0])
+
+            texts = [text for request_texts, _ in batch for text in request_texts]
+            try:
+                embeddings = await loop.run_in_executor(
+                    self._executor, self.processor.get_embeddings, texts, BATCH_SIZE
+                )
+                embeddings = np.asarray(embeddings, dtype=np.float32).reshape(len(texts), -1)
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            offset = 0
+            for request_texts, future in batch:
+                if not future.done():
+                    future.set_result(embeddings[offset:offset + len(request_texts)])
+                offset += len(request_texts)
+
+
+class ModelServerClient(NLPProcessor):
+    """
+    NLPProcessor that forwards model calls to the model server.
+
+    Skill extraction is plain pattern matching, so it still runs in the
+    worker; embeddings and spaCy key phrases come from the server.
+    """
+
+    def __init__(self, socket_path: str = MODEL_SERVER_SOCKET, timeout: float = MODEL_SERVER_TIMEOUT):
+        """
+        Args:
+            socket_path: Unix socket the model server listens on
+            timeout: Seconds to wait for a response
+        """
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self.embedding_model = None
+        self.nlp = None
+        self._local = threading.local()
+        # Fail at startup rather than on the first request if the server is missing
+        self._request({'op': 'ping'})
+
+    def _connection(self) -> socket.socket:
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            connection.settimeout(self.timeout)
+            connection.connect(self.socket_path)
+            self._local.connection = connection
+        return connection
+
+    def _close(self) -> None:
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    def _receive(self, connection: socket.socket, size: int) -> bytearray:
+        # Read straight into one mutable buffer, so arrays built on it are writable
+        buffer = bytearray(size)
+        view = memoryview(buffer)
+        received = 0
+        while received < size:
+            count = connection.recv_into(view[received:], min(size - received, 1 << 20))
+            if not count:
+                raise ConnectionError("Model server closed the connection")
+            received += count
+        return buffer
+
+    def _request(self, header: Dict) -> Tuple[Dict, bytearray]:
+        """Send one request on this thread's connection, reconnecting once if it dropped."""
+        for attempt in range(2):
+            try:
+                connection = self._connection()
+                connection.sendall(_encode_frame(header))
+                header_length, payload_length = _FRAME.unpack(self._receive(connection, _FRAME.size))
+                response = json.loads(self._receive(connection, header_length))
+                payload = self._receive(connection, payload_length)
+                break
+            except (OSError, ConnectionError):
+                self._close()
+                if attempt:
+                    raise
+        if 'error' in response:
+            raise RuntimeError(f"Model server error: {response['error']}")
+        return response, payload
+
+    def get_embeddings(self, texts: List[str], batch_size: int = BATCH_SIZE) -> np.ndarray:
+        """
+        Generate embeddings on the model server.
+
+        Args:
+            texts: List of text strings to embed
+            batch_size: Ignored; the server batches requests from all workers
+
+        Returns:
+            Writable NumPy array of embeddings (shape: [n_texts, embedding_dim]),
+            like the one a local NLPProcessor returns
+        """
+        response, payload = self._request({'op': 'embed', 'texts': list(texts)})
+        return np.frombuffer(payload, dtype=response['dtype']).reshape(response['shape'])
+
+    def extract_key_phrases(self, text: str, max_phrases: int = 5) -> List[str]:
+        """Extract key phrases (spaCy NER) on the model server."""
+        response, _ = self._request({'op': 'key_phrases', 'text': text, 'max_phrases': max_phrases})
+        return response['result']
+
+
+def main() -> None:
+    """Load the models and serve them on MODEL_SERVER_SOCKET."""
+    configure_logging()
+    if not MODEL_SERVER_SOCKET:
+        raise SystemExit("Set MODEL_SERVER_SOCKET to the Unix socket path to serve on")
+    server = ModelServer(NLPProcessor())
+    try:
+        asyncio.run(server.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
@@ -3,10 +3,8 @@
 import re
 from typing import List, Dict, Tuple, Set
 import numpy as np
-import spacy
-from sentence_transformers import SentenceTransformer
 
-from .config import MODEL_NAME, SPACY_MODEL, TOP_K_SKILLS
+from .config import MODEL_NAME, SPACY_MODEL, TOP_K_SKILLS, BATCH_SIZE, MODEL_SERVER_SOCKET
 from .skills_database import SKILLS_LOWERCASE
 
 
@@ -15,6 +13,10 @@ class NLPProcessor:
     
     def __init__(self):
         """Initialize NLP models."""
+        # Imported here so workers using the model server never load the model libraries
+        import spacy
+        from sentence_transformers import SentenceTransformer
+        
         self.embedding_model = SentenceTransformer(MODEL_NAME)
         self.nlp = None
         try:
@@ -24,17 +26,18 @@ class NLPProcessor:
             # Continue without spacy - it's optional for the matching endpoint
             pass
     
-    def get_embeddings(self, texts: List[str]) -> np.ndarray:
+    def get_embeddings(self, texts: List[str], batch_size: int = BATCH_SIZE) -> np.ndarray:
         """
         Generate embeddings for a list of texts.
         
         Args:
             texts: List of text strings to embed
+            batch_size: Number of texts encoded per model forward pass
             
         Returns:
             NumPy array of embeddings (shape: [n_texts, embedding_dim])
         """
-        embeddings = self.embedding_model.encode(texts, show_progress_bar=False)
+        embeddings = self.embedding_model.encode(texts, batch_size=batch_size, show_progress_bar=False)
         return np.array(embeddings)
     
     def extract_skills(self, text: str) -> Dict[str, Dict]:
@@ -162,8 +165,17 @@ _nlp_processor: NLPProcessor = None
 
 
 def get_nlp_processor() -> NLPProcessor:
-    """Get or initialize global NLP processor instance."""
+    """
+    Get or initialize global NLP processor instance.
+    
+    With MODEL_SERVER_SOCKET set this is a client of the shared model server
+    (see model_server.py) instead of a processor holding its own models.
+    """
     global _nlp_processor
     if _nlp_processor is None:
-        _nlp_processor = NLPProcessor()
+        if MODEL_SERVER_SOCKET:
+            from .model_server import ModelServerClient
+            _nlp_processor = ModelServerClient(MODEL_SERVER_SOCKET)
+        else:
+            _nlp_processor = NLPProcessor()
     return _nlp_processor
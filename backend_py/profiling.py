@@ -0,0 +1,281 @@
+"""Opt-in per-request profiling for diagnosing slow API calls."""
+
+import cProfile
+import contextvars
+import hmac
+import io
+import json
+import os
+import pstats
+import re
+import threading
+import time
+import uuid
+from typing import Callable, Dict, List, Optional
+
+from .config import (
+    PROFILE_TOKEN,
+    PROFILE_HEADER,
+    PROFILE_DIR,
+    PROFILE_MAX_FILES,
+    PROFILE_MAX_BYTES,
+    PROFILE_MAX_AGE_SECONDS
+)
+
+PROFILE_ID_PATTERN = re.compile(r'^[0-9a-f]{32}$')
+
+# Profilers of the request being profiled, one per thread that worked on it
+_request_profilers: contextvars.ContextVar[Optional[List[cProfile.Profile]]] = contextvars.ContextVar(
+    'request_profilers', default=None
+)
+
+
+def profile_call(func: Callable, *args, **kwargs):
+    """
+    Call func, under a profiler of its own if the current request is being profiled.
+
+    cProfile only sees the thread that enabled it, so work a profiled request
+    hands to the executor threads is profiled there and merged into the
+    request's profile when it is saved.
+    """
+    profilers = _request_profilers.get()
+    if profilers is None:
+        return func(*args, **kwargs)
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError:
+        # Python 3.12+ profiles every thread from one interpreter-wide profiler
+        return func(*args, **kwargs)
+    try:
+        return func(*args, **kwargs)
+    finally:
+        profiler.disable()
+        # Work still running when the request's profile is saved is left out
+        profilers.append(profiler)
+
+
+class ProfileStore:
+    """Bounded on-disk store for captured request profiles."""
+
+    def __init__(
+        self,
+        directory: str = PROFILE_DIR,
+        max_files: int = PROFILE_MAX_FILES,
+        max_bytes: int = PROFILE_MAX_BYTES,
+        max_age_seconds: int = PROFILE_MAX_AGE_SECONDS
+    ):
+        """
+        Initialize the profile store.
+
+        Args:
+            directory: Directory where profiles are written
+            max_files: Maximum number of profiles to retain
+            max_bytes: Maximum total size of retained profiles
+            max_age_seconds: Profiles older than this are deleted
+        """
+        self.directory = directory
+        self.max_files = max_files
+        self.max_bytes = max_bytes
+        self.max_age_seconds = max_age_seconds
+        self._lock = threading.Lock()
+
+    def _stats_path(self, profile_id: str) -> str:
+        return os.path.join(self.directory, f"{profile_id}.prof")
+
+    def _meta_path(self, profile_id: str) -> str:
+        return os.path.join(self.directory, f"{profile_id}.json")
+
+    def save(self, profile_id: str, profilers: List[cProfile.Profile], metadata: Dict) -> None:
+        """
+        Persist a profile in pstats format and apply retention limits.
+
+        Args:
+            profile_id: Identifier returned to the caller
+            profilers: Finished profilers, merged into one profile
+            metadata: Request details stored alongside the stats
+        """
+        stats = pstats.Stats(*profilers)
+        with self._lock:
+            os.makedirs(self.directory, exist_ok=True)
+            stats.dump_stats(self._stats_path(profile_id))
+            with open(self._meta_path(profile_id), 'w') as f:
+                json.dump({**metadata, 'id': profile_id}, f)
+            self._prune()
+
+    def _prune(self) -> None:
+        """Delete expired profiles, then the oldest ones beyond the count/size limits."""
+        entries = []
+        now = time.time()
+        for name in os.listdir(self.directory):
+            if not name.endswith('.prof'):
+                continue
+            profile_id = name[:-len('.prof')]
+            try:
+                stat = os.stat(self._stats_path(profile_id))
+            except OSError:
+                continue
+            if now - stat.st_mtime > self.max_age_seconds:
+                self._delete(profile_id)
+                continue
+            entries.append((stat.st_mtime, stat.st_size, profile_id))
+
+        entries.sort(reverse=True)  # Newest first
+        total_bytes = 0
+        for index, (_, size, profile_id) in enumerate(entries):
+            total_bytes += size
+            if index >= self.max_files or total_bytes > self.max_bytes:
+                self._delete(profile_id)
+
+    def _delete(self, profile_id: str) -> None:
+        for path in (self._stats_path(profile_id), self._meta_path(profile_id)):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def list_profiles(self) -> List[Dict]:
+        """Return metadata for all retained profiles, newest first."""
+        if not os.path.isdir(self.directory):
+            return []
+        profiles = []
+        for name in os.listdir(self.directory):
+            if not name.endswith('.json'):
+                continue
+            try:
+                with open(os.path.join(self.directory, name)) as f:
+                    profiles.append(json.load(f))
+            except (OSError, ValueError):
+                continue
+        profiles.sort(key=lambda p: p.get('created_at', 0), reverse=True)
+        return profiles
+
+    def get_stats_path(self, profile_id: str) -> Optional[str]:
+        """
+        Get the path of a stored pstats file.
+
+        Args:
+            profile_id: Profile identifier
+
+        Returns:
+            Path to the .prof file, or None if it does not exist
+        """
+        if not PROFILE_ID_PATTERN.match(profile_id):
+            return None
+        path = self._stats_path(profile_id)
+        return path if os.path.exists(path) else None
+
+    def render_text(self, profile_id: str, sort_by: str = 'cumulative', limit: int = 50) -> Optional[str]:
+        """
+        Render a stored profile as a human-readable pstats report.
+
+        Args:
+            profile_id: Profile identifier
+            sort_by: pstats sort key
+            limit: Number of functions to include
+
+        Returns:
+            Report text, or None if the profile does not exist
+        """
+        path = self.get_stats_path(profile_id)
+        if not path:
+            return None
+        output = io.StringIO()
+        stats = pstats.Stats(path, stream=output)
+        stats.sort_stats(sort_by).print_stats(limit)
+        return output.getvalue()
+
+
+def is_authorized(token: Optional[str]) -> bool:
+    """Check a caller-supplied token against the configured profiling token."""
+    if not PROFILE_TOKEN or not token:
+        return False
+    return hmac.compare_digest(token.encode(), PROFILE_TOKEN.encode())
+
+
+def _requested_token(scope: Dict) -> Optional[str]:
+    """
+    Find the profiling token in the request headers.
+
+    The token is never read from the query string, where it would end up in
+    access logs, proxies and browser history.
+    """
+    header_name = PROFILE_HEADER.encode()
+    for name, value in scope.get('headers', []):
+        if name == header_name:
+            return value.decode('latin-1')
+    return None
+
+
+class ProfilingMiddleware:
+    """
+    ASGI middleware that runs flagged requests under cProfile.
+
+    Requests without the profiling header are passed straight through.
+    Only one request is profiled at a time because cProfile hooks the
+    whole interpreter thread; concurrent coroutines on the event loop
+    will show up in the profile as well. Blocking work the request runs
+    through the executors is profiled in its thread (see profile_call) and
+    merged in. Resume parsing in a process pool ("process" executor mode)
+    is not.
+    """
+
+    def __init__(self, app, store: Optional[ProfileStore] = None):
+        self.app = app
+        self.store = store or get_profile_store()
+        self._active = threading.Lock()
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            return await self.app(scope, receive, send)
+
+        token = _requested_token(scope)
+        if token is None or not is_authorized(token):
+            return await self.app(scope, receive, send)
+
+        if not self._active.acquire(blocking=False):
+            # Another profile is running; serve the request normally
+            return await self.app(scope, receive, send)
+
+        profile_id = uuid.uuid4().hex
+        status = {'code': None}
+
+        async def send_with_profile_id(message):
+            if message['type'] == 'http.response.start':
+                status['code'] = message['status']
+                headers = list(message.get('headers', []))
+                headers.append((b'x-profile-id', profile_id.encode()))
+                message = {**message, 'headers': headers}
+            await send(message)
+
+        profiler = cProfile.Profile()
+        profilers = [profiler]
+        context_token = _request_profilers.set(profilers)
+        started = time.time()
+        profiler.enable()
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            profiler.disable()
+            _request_profilers.reset(context_token)
+            self._active.release()
+            self.store.save(profile_id, profilers, {
+                'method': scope.get('method'),
+                'path': scope.get('path'),
+                'status_code': status['code'],
+                'duration_ms': round((time.time() - started) * 1000, 2),
+                'threads': len(profilers),
+                'created_at': started
+            })
+
+
+# Global instance
+_profile_store: ProfileStore = None
+
+
+def get_profile_store() -> ProfileStore:
+    """Get or initialize global profile store instance."""
+    global _profile_store
+    if _profile_store is None:
+        _profile_store = ProfileStore()
+    return _profile_store
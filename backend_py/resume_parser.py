@@ -1,30 +1,133 @@
 """Resume parsing utilities for PDF and DOCX files."""
 
 import io
-from typing import Optional, Tuple
+import zipfile
+from typing import BinaryIO, Optional, Tuple, Union
 import pdfplumber
+from pdfminer.pdftypes import resolve1
 from docx import Document
 
+from .metrics import get_metrics
 
-def extract_text_from_pdf(file_content: bytes) -> str:
+# Leading bytes of each container format
+_PDF_MAGIC = b'%PDF-'
+_ZIP_MAGIC = b'PK\x03\x04'
+_OLE_MAGIC = b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1'  # Legacy binary Word (.doc) and other Office 97 files
+_RTF_MAGIC = b'{\\rtf'
+_PDF_HEADER_WINDOW = 1024  # Readers accept the %PDF- header anywhere in the first 1KB
+
+_REJECTION_MESSAGES = {
+    'doc': ('legacy_doc', "Legacy Word (.doc) files are not supported; save the resume as DOCX or PDF"),
+    'rtf': ('rtf', "RTF files are not supported; save the resume as DOCX or PDF"),
+}
+
+
+class UnsupportedDocumentError(ValueError):
+    """Raised when a document is rejected before parsing; `reason` labels the rejection in metrics."""
+    
+    def __init__(self, message: str, reason: str):
+        super().__init__(message)
+        self.reason = reason
+    
+    def __reduce__(self):
+        # Keep the reason when the error is sent back from a parsing process
+        return type(self), (str(self), self.reason)
+
+
+def _as_file(file_content: Union[bytes, BinaryIO]) -> BinaryIO:
+    """File handle for parsers: wraps bytes, rewinds an open binary file."""
+    if isinstance(file_content, (bytes, bytearray)):
+        return io.BytesIO(file_content)
+    file_content.seek(0)
+    return file_content
+
+
+def sniff_format(file_content: Union[bytes, BinaryIO]) -> str:
+    """
+    Identify a document from its leading bytes, whatever its file name says.
+    
+    Args:
+        file_content: Binary content, or a binary file handle (rewound afterwards)
+        
+    Returns:
+        "pdf", "docx", "doc" (legacy binary Word), "rtf" or "unknown"
+    """
+    file = _as_file(file_content)
+    head = file.read(_PDF_HEADER_WINDOW)
+    file.seek(0)
+    
+    # Signatures fixed at offset 0 come first: a DOCX or .doc can contain the
+    # bytes "%PDF-" in its first 1KB (a file name, an embedded attachment)
+    if head.startswith(_ZIP_MAGIC):
+        # Any zip could be renamed .docx; a Word document has its main part in the central directory
+        try:
+            with zipfile.ZipFile(file) as archive:
+                names = set(archive.namelist())
+        except zipfile.BadZipFile:
+            return "unknown"
+        finally:
+            file.seek(0)
+        return "docx" if "word/document.xml" in names else "unknown"
+    if head.startswith(_OLE_MAGIC):
+        return "doc"
+    if head.startswith(_RTF_MAGIC):
+        return "rtf"
+    if _PDF_MAGIC in head:
+        return "pdf"
+    return "unknown"
+
+
+def _has_text_layer(pdf, max_form_depth: int = 2) -> bool:
+    """
+    Whether any page can draw text, judged from resource dictionaries alone.
+    
+    Text needs a font, so a PDF none of whose pages (or form XObjects drawn
+    on them) declare one is a scan or otherwise image-only. This reads only
+    the page dictionaries, not the content streams.
+    """
+    def declares_font(resources, depth: int) -> bool:
+        resources = resolve1(resources) or {}
+        if resolve1(resources.get('Font')):
+            return True
+        if depth >= max_form_depth:
+            return False
+        for xobject in (resolve1(resources.get('XObject')) or {}).values():
+            xobject = resolve1(xobject)
+            attrs = getattr(xobject, 'attrs', {})
+            if getattr(resolve1(attrs.get('Subtype')), 'name', None) == 'Form' and declares_font(attrs.get('Resources'), depth + 1):
+                return True
+        return False
+    
+    return any(declares_font(page.page_obj.resources, 0) for page in pdf.pages)
+
+
+def extract_text_from_pdf(file_content: Union[bytes, BinaryIO]) -> str:
     """
     Extract text from PDF file.
     
     Args:
-        file_content: Binary content of PDF file
+        file_content: Binary content of PDF file, or a binary file handle
         
     Returns:
         Extracted text from PDF
         
     Raises:
         ValueError: If PDF is corrupted or empty
+        UnsupportedDocumentError: If the PDF has no text layer (scanned/image-only)
     """
     try:
         text = ""
-        with pdfplumber.open(io.BytesIO(file_content)) as pdf:
+        with pdfplumber.open(_as_file(file_content)) as pdf:
             if len(pdf.pages) == 0:
                 raise ValueError("PDF file is empty")
             
+            # Reject scans before laying out every page only to find no text
+            if not _has_text_layer(pdf):
+                raise UnsupportedDocumentError(
+                    "PDF has no text layer (scanned or image-only); upload a text-based PDF or DOCX",
+                    reason="image_only_pdf"
+                )
+            
             for page in pdf.pages:
                 page_text = page.extract_text()
                 if page_text:
@@ -34,16 +137,18 @@ def extract_text_from_pdf(file_content: bytes) -> str:
             raise ValueError("No text could be extracted from PDF")
         
         return text
+    except UnsupportedDocumentError:
+        raise
     except Exception as e:
         raise ValueError(f"Error parsing PDF: {str(e)}")
 
 
-def extract_text_from_docx(file_content: bytes) -> str:
+def extract_text_from_docx(file_content: Union[bytes, BinaryIO]) -> str:
     """
     Extract text from DOCX file.
     
     Args:
-        file_content: Binary content of DOCX file
+        file_content: Binary content of DOCX file, or a binary file handle
         
     Returns:
         Extracted text from DOCX
@@ -52,7 +157,7 @@ def extract_text_from_docx(file_content: bytes) -> str:
         ValueError: If DOCX is corrupted or empty
     """
     try:
-        doc = Document(io.BytesIO(file_content))
+        doc = Document(_as_file(file_content))
         
         text = ""
         for paragraph in doc.paragraphs:
@@ -74,30 +179,45 @@ def extract_text_from_docx(file_content: bytes) -> str:
         raise ValueError(f"Error parsing DOCX: {str(e)}")
 
 
-def extract_text_from_resume(file_content: bytes, filename: str) -> Tuple[str, str]:
+def extract_text_from_resume(file_content: Union[bytes, BinaryIO], filename: str) -> Tuple[str, str]:
     """
     Extract text from resume file (PDF or DOCX).
     
+    The format is taken from the file's magic bytes rather than its name, so
+    legacy .doc, RTF and unknown files are rejected before any parser runs.
+    Every document and rejection is counted in metrics.
+    
     Args:
-        file_content: Binary content of resume file
-        filename: Name of the file (to determine format)
+        file_content: Binary content of resume file, or a binary file handle
+        filename: Name of the file (used in error messages)
         
     Returns:
         Tuple of (extracted_text, file_format)
         
     Raises:
-        ValueError: If file format is unsupported or extraction fails
+        UnsupportedDocumentError: If the format is unsupported or the PDF is image-only
+        ValueError: If extraction fails
     """
-    filename_lower = filename.lower()
+    metrics = get_metrics()
+    file = _as_file(file_content)
+    file_format = sniff_format(file)
+    metrics.increment("resume_documents_total", format=file_format)
     
-    if filename_lower.endswith('.pdf'):
-        text = extract_text_from_pdf(file_content)
-        return text, "pdf"
-    elif filename_lower.endswith(('.docx', '.doc')):
-        text = extract_text_from_docx(file_content)
-        return text, "docx"
-    else:
-        raise ValueError(f"Unsupported file format: {filename}")
+    try:
+        if file_format == "pdf":
+            return extract_text_from_pdf(file), "pdf"
+        if file_format == "docx":
+            return extract_text_from_docx(file), "docx"
+        reason, message = _REJECTION_MESSAGES.get(
+            file_format, ("unknown_format", f"Unsupported file format: {filename}")
+        )
+        raise UnsupportedDocumentError(message, reason=reason)
+    except UnsupportedDocumentError as e:
+        metrics.increment("resume_rejections_total", reason=e.reason)
+        raise
+    except ValueError:
+        metrics.increment("resume_parse_failures_total", format=file_format)
+        raise
 
 def clean_resume_text(text: str) -> str:
     """
@@ -0,0 +1,346 @@
+"""Vectorized scoring engine shared by all matching endpoints."""
+
+import logging
+import operator
+from itertools import chain, compress, repeat
+from typing import Dict, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from .config import SEMANTIC_WEIGHT, SKILL_WEIGHT, BATCH_SIZE
+from .dedup import content_hash
+
+logger = logging.getLogger(__name__)
+
+# Skill score used when no skills are required, as the endpoints have always done
+DEFAULT_EMPTY_SKILL_SCORE = 0.5
+
+
+def cosine_scores(query_embedding: np.ndarray, target_embeddings: np.ndarray, clamp: bool = True) -> np.ndarray:
+    """
+    Cosine similarity between one query vector and many target vectors.
+
+    Args:
+        query_embedding: Vector of shape [dim]
+        target_embeddings: Matrix of shape [n_targets, dim]
+        clamp: Clip scores to [0, 1]
+
+    Returns:
+        Array of shape [n_targets]
+    """
+    query = np.asarray(query_embedding, dtype=np.float32).ravel()
+    targets = np.atleast_2d(np.asarray(target_embeddings, dtype=np.float32))
+    # Divide the dot products by the norms rather than normalizing a copy of the matrix
+    target_norms = np.sqrt(np.einsum('ij,ij->i', targets, targets))
+    scores = (targets @ query) / (target_norms * np.linalg.norm(query) + 1e-10)
+    if clamp:
+        scores = np.clip(scores, 0.0, 1.0)
+    return scores.astype(np.float64)
+
+
+def combine_scores(semantic, skill):
+    """Final score: SEMANTIC_WEIGHT × semantic + SKILL_WEIGHT × skill (scalars or arrays)."""
+    return SEMANTIC_WEIGHT * semantic + SKILL_WEIGHT * skill
+
+
+class SkillOverlap:
+    """
+    Required-skill coverage for many (required, candidate) pairs, computed at once.
+
+    Either side may hold a single entry that is broadcast against all
+    entries of the other side: one job's required skills against many
+    candidates, or one candidate's skills against many jobs' requirements.
+    Skills are compared case-insensitively; candidate skills are expected
+    in lowercase.
+    """
+
+    def __init__(
+        self,
+        required_skills: Sequence[Sequence[str]],
+        candidate_skills: Sequence[Set[str]],
+        empty_skill_score: float = DEFAULT_EMPTY_SKILL_SCORE,
+        required_keys: Optional[Sequence[Sequence[str]]] = None
+    ):
+        """
+        Args:
+            required_skills: Required skill lists, one per target or a single shared list
+            candidate_skills: Lowercase candidate skill sets, one per target or a single shared set
+            empty_skill_score: Score for targets with no required skills
+            required_keys: Optional lookup keys aligned with required_skills (e.g. canonical
+                skill names); matched/missing still report the original required_skills
+        """
+        self.required_skills = required_skills
+        count = max(len(required_skills), len(candidate_skills))
+        if required_keys is None:
+            required_keys = [[skill.lower() for skill in required] for required in required_skills]
+
+        # Only required skills matter, so the vocabulary is built from them alone
+        vocabulary: Dict[str, int] = {}
+        required_index = [
+            [vocabulary.setdefault(key, len(vocabulary)) for key in keys]
+            for keys in required_keys
+        ]
+
+        # Membership of each vocabulary skill in each candidate set [n_candidates, vocabulary],
+        # filled one column at a time with C-level set lookups
+        membership = np.zeros((len(candidate_skills), max(len(vocabulary), 1)), dtype=bool)
+        for skill, column in vocabulary.items():
+            membership[:, column] = np.fromiter(
+                map(operator.contains, candidate_skills, repeat(skill)),
+                dtype=bool,
+                count=len(candidate_skills)
+            )
+
+        if len(required_index) == 1:
+            # One shared requirement list: a plain column gather, hits is [count, n_required]
+            columns = np.asarray(required_index[0], dtype=np.int64)
+            hits = membership[:, columns] if len(candidate_skills) == count else np.tile(membership[:, columns], (count, 1))
+            required_lengths = np.full(count, len(columns), dtype=np.int64)
+            self.hits = hits.ravel()
+            self.matched_counts = hits.sum(axis=1)
+        else:
+            # Flatten the required skills of every target and look them all up at once
+            required_lengths = np.array([len(indices) for indices in required_index], dtype=np.int64)
+            flat_required = np.fromiter(
+                chain.from_iterable(required_index),
+                dtype=np.int64,
+                count=int(required_lengths.sum())
+            )
+            owners = np.repeat(np.arange(count), required_lengths)
+            candidate_rows = owners if len(candidate_skills) > 1 else np.zeros_like(owners)
+            self.hits = membership[candidate_rows, flat_required]
+            self.matched_counts = np.bincount(owners, weights=self.hits, minlength=count).astype(np.int64)
+
+        self.offsets = np.concatenate([[0], np.cumsum(required_lengths)])
+        self.required_counts = required_lengths
+        self._hit_list = None
+        self._offset_list = None
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self.scores = np.where(
+                required_lengths > 0,
+                self.matched_counts / np.maximum(required_lengths, 1),
+                empty_skill_score
+            )
+
+    def matched_and_missing(self, index: int):
+        """
+        Split one target's required skills into matched and missing, preserving order.
+
+        Args:
+            index: Target position
+
+        Returns:
+            Tuple of (matched_skills, missing_skills)
+        """
+        required = self.required_skills[index if len(self.required_skills) > 1 else 0]
+        if self._hit_list is None:
+            # Plain lists make per-row slicing far cheaper than numpy views
+            self._hit_list = self.hits.tolist()
+            self._offset_list = self.offsets.tolist()
+        hits = self._hit_list[self._offset_list[index]:self._offset_list[index + 1]]
+        return list(compress(required, hits)), list(compress(required, map(operator.not_, hits)))
+
+
+def rank_indices(final_scores: np.ndarray, top_k: Optional[int] = None) -> np.ndarray:
+    """
+    Indices of targets ordered by final score, best first (ties keep input order).
+
+    Args:
+        final_scores: Array of final scores
+        top_k: Only order and return the best top_k
+
+    Returns:
+        Array of target indices
+    """
+    if top_k is not None and top_k < len(final_scores):
+        if top_k <= 0:
+            return np.zeros(0, dtype=np.int64)
+        candidates = np.argpartition(-final_scores, top_k - 1)[:top_k]
+        candidates.sort()  # Restore input order so ties stay stable
+        return candidates[np.argsort(-final_scores[candidates], kind='stable')]
+    return np.argsort(-final_scores, kind='stable')
+
+
+def select_page(
+    final_scores: np.ndarray,
+    offset: int = 0,
+    limit: Optional[int] = None,
+    min_score: Optional[float] = None
+) -> Tuple[np.ndarray, int]:
+    """
+    Indices of one page of targets ranked by final score, best first.
+
+    Only the best offset + limit targets are ordered (argpartition), so the
+    cost of ordering and of building results afterwards follows the page
+    size rather than the pool size.
+
+    Args:
+        final_scores: Array of final scores
+        offset: Number of ranked targets to skip
+        limit: Maximum number of targets returned (all when None)
+        min_score: Only targets scoring at least this are ranked
+
+    Returns:
+        Tuple of (target indices, number of targets that qualified)
+    """
+    final_scores = np.asarray(final_scores, dtype=np.float64)
+    qualifying = None if min_score is None else np.flatnonzero(final_scores >= min_score)
+    scores = final_scores if qualifying is None else final_scores[qualifying]
+    offset = max(offset, 0)
+    top_k = None if limit is None else offset + max(limit, 0)
+    indices = rank_indices(scores, top_k)[offset:]
+    if qualifying is not None:
+        indices = qualifying[indices]
+    return indices, len(scores)
+
+
+class RankedPage(list):
+    """Result dictionaries of one page, best first, with the pool they were ranked from."""
+
+    def __init__(self, results: List[Dict], total: int, final_scores: np.ndarray):
+        """
+        Args:
+            results: Result dictionaries on this page
+            total: Number of targets that qualified for ranking (across all pages)
+            final_scores: Final scores of every target, in input order
+        """
+        super().__init__(results)
+        self.total = total
+        self.final_scores = final_scores
+
+
+class ScoringEngine:
+    """Scores one query (job or candidate) against many targets."""
+
+    def __init__(self, nlp=None, embedding_index=None):
+        """
+        Args:
+            nlp: NLPProcessor (or anything with get_embeddings); defaults to the global processor
+            embedding_index: Optional SharedEmbeddingIndex caching target embeddings by text hash
+        """
+        if nlp is None:
+            from .nlp_processor import get_nlp_processor
+            nlp = get_nlp_processor()
+        self.nlp = nlp
+        self.embedding_index = embedding_index
+
+    def semantic_scores(self, query_text: str, target_texts: List[str]) -> np.ndarray:
+        """
+        Clamped cosine similarity between the query and every target text.
+
+        The query and all targets not found in the embedding index are
+        embedded in a single batched call.
+
+        Args:
+            query_text: Job description or candidate text
+            target_texts: Texts to compare against
+
+        Returns:
+            Array of shape [n_targets] with scores in [0, 1]
+        """
+        if not target_texts:
+            return np.zeros(0)
+        if self.embedding_index is None:
+            embeddings = self.nlp.get_embeddings([query_text] + list(target_texts), batch_size=BATCH_SIZE)
+            return cosine_scores(embeddings[0], embeddings[1:])
+        return cosine_scores(*self._cached_embeddings(query_text, list(target_texts)))
+
+    def _cached_embeddings(self, query_text: str, target_texts: List[str]):
+        """Query embedding and target matrix, embedding (and indexing) only unseen targets."""
+        # Keys are content hashes, so edited texts miss the index instead of returning stale vectors
+        keys = [content_hash(text) for text in target_texts]
+        targets, found = self.embedding_index.lookup(keys)
+        missing = np.flatnonzero(~found).tolist()
+        embeddings = np.asarray(
+            self.nlp.get_embeddings([query_text] + [target_texts[i] for i in missing], batch_size=BATCH_SIZE),
+            dtype=np.float32
+        )
+
+        if targets.shape[1] != embeddings.shape[1]:
+            if found.any():
+                # The model changed since the index was built
+                logger.warning("Embedding index dimensions differ from the model; clearing it")
+                self.embedding_index.clear()
+                return self._cached_embeddings(query_text, target_texts)
+            targets = np.zeros((len(target_texts), embeddings.shape[1]), dtype=np.float32)
+
+        if missing:
+            targets[missing] = embeddings[1:]
+            try:
+                self.embedding_index.add_many(zip((keys[i] for i in missing), embeddings[1:]))
+            except (OSError, ValueError) as e:
+                logger.warning("Could not update the embedding index: %s", e)
+        return embeddings[0], targets
+
+    @staticmethod
+    def rank(
+        semantic: np.ndarray,
+        required_skills: Sequence[Sequence[str]],
+        candidate_skills: Sequence[Set[str]],
+        top_k: Optional[int] = None,
+        empty_skill_score: float = DEFAULT_EMPTY_SKILL_SCORE,
+        required_keys: Optional[Sequence[Sequence[str]]] = None,
+        offset: int = 0,
+        min_score: Optional[float] = None
+    ) -> RankedPage:
+        """
+        Combine semantic and skill scores and return the best targets.
+
+        Args:
+            semantic: Semantic scores, one per target
+            required_skills: Required skill lists (one per target, or one shared)
+            candidate_skills: Lowercase candidate skill sets (one per target, or one shared)
+            top_k: Only build results for the best top_k targets (after offset)
+            empty_skill_score: Skill score when nothing is required
+            required_keys: Lookup keys aligned with required_skills (see SkillOverlap)
+            offset: Number of ranked targets to skip
+            min_score: Only rank targets whose final score is at least this
+
+        Returns:
+            RankedPage of result dictionaries (index, semantic_score, skill_score,
+            final_score, matched_skills, missing_skills), best first
+        """
+        semantic = np.asarray(semantic, dtype=np.float64)
+        overlap = SkillOverlap(required_skills, candidate_skills, empty_skill_score, required_keys)
+        final = combine_scores(semantic, overlap.scores)
+
+        semantic_list = semantic.tolist()
+        skill_list = overlap.scores.tolist()
+        final_list = final.tolist()
+
+        indices, total = select_page(final, offset, top_k, min_score)
+        results = []
+        for index in indices.tolist():
+            matched, missing = overlap.matched_and_missing(index)
+            results.append({
+                'index': index,
+                'semantic_score': semantic_list[index],
+                'skill_score': skill_list[index],
+                'final_score': final_list[index],
+                'matched_skills': matched,
+                'missing_skills': missing
+            })
+        return RankedPage(results, total, final)
+
+    def match(
+        self,
+        query_text: str,
+        target_texts: List[str],
+        required_skills: Sequence[Sequence[str]],
+        candidate_skills: Sequence[Set[str]],
+        top_k: Optional[int] = None,
+        empty_skill_score: float = DEFAULT_EMPTY_SKILL_SCORE,
+        required_keys: Optional[Sequence[Sequence[str]]] = None,
+        offset: int = 0,
+        min_score: Optional[float] = None
+    ) -> RankedPage:
+        """
+        Embed, score and rank targets against a query in one call.
+
+        See semantic_scores and rank for the arguments.
+        """
+        semantic = self.semantic_scores(query_text, target_texts)
+        return self.rank(
+            semantic, required_skills, candidate_skills, top_k, empty_skill_score, required_keys, offset, min_score
+        )
@@ -0,0 +1,255 @@
+"""Inverted skill index with boolean queries (AND / OR / NOT / parentheses)."""
+
+import logging
+import re
+import threading
+from typing import Dict, Iterable, List, Set, Tuple
+
+from .skills_database import SKILLS_LOWERCASE
+
+logger = logging.getLogger(__name__)
+
+# Any alias (e.g. "nodejs", "node.js") -> canonical skill name
+ALIAS_TO_SKILL: Dict[str, str] = {
+    alias: skill for skill, aliases in SKILLS_LOWERCASE.items() for alias in aliases + [skill]
+}
+
+_QUERY_TOKEN = re.compile(r"\(|\)|[^\s()]+")
+_OPERATORS = {'and', 'or', 'not', '(', ')'}
+
+
+def canonical_skill(name: str) -> str:
+    """Map a skill or alias to its canonical name (unknown skills are just lowercased)."""
+    name = ' '.join(name.lower().split())
+    return ALIAS_TO_SKILL.get(name, name)
+
+
+def canonical_skills(skills: Iterable[str]) -> List[str]:
+    """Canonical, de-duplicated, sorted form of a skill list."""
+    return sorted({canonical_skill(skill) for skill in skills if skill and skill.strip()})
+
+
+def parse_query(query: str):
+    """
+    Parse a boolean skill query into a nested tuple expression.
+
+    Grammar (case-insensitive operators). Consecutive words form one skill
+    name ("machine learning"); an omitted operator between a parenthesized
+    group or NOT term and its neighbour means AND:
+        expr := term ("OR" term)*
+        term := factor (["AND"] factor)*
+        factor := "NOT" factor | "(" expr ")" | skill words
+
+    Args:
+        query: e.g. "python AND (django OR flask) AND NOT php"
+
+    Returns:
+        Expression tuples: ('skill', name), ('and', a, b), ('or', a, b), ('not', a)
+
+    Raises:
+        ValueError: If the query is empty or malformed
+    """
+    tokens = _QUERY_TOKEN.findall(query)
+    position = 0
+
+    def peek():
+        return tokens[position].lower() if position < len(tokens) else None
+
+    def advance():
+        nonlocal position
+        position += 1
+        return tokens[position - 1]
+
+    def parse_expr():
+        node = parse_term()
+        while peek() == 'or':
+            advance()
+            node = ('or', node, parse_term())
+        return node
+
+    def parse_term():
+        node = parse_factor()
+        while peek() is not None and peek() not in ('or', ')'):
+            if peek() == 'and':
+                advance()
+            node = ('and', node, parse_factor())
+        return node
+
+    def parse_factor():
+        token = peek()
+        if token is None:
+            raise ValueError("Unexpected end of query")
+        if token == 'not':
+            advance()
+            return ('not', parse_factor())
+        if token == '(':
+            advance()
+            node = parse_expr()
+            if peek() != ')':
+                raise ValueError("Missing closing parenthesis")
+            advance()
+            return node
+        if token == ')':
+            raise ValueError("Unexpected closing parenthesis")
+        # Consecutive words form one skill name, e.g. "machine learning"
+        words = []
+        while peek() is not None and peek() not in _OPERATORS:
+            words.append(advance())
+        return ('skill', canonical_skill(' '.join(words)))
+
+    if not tokens:
+        raise ValueError("Query cannot be empty")
+    expression = parse_expr()
+    if position != len(tokens):
+        raise ValueError(f"Unexpected token: {tokens[position]}")
+    return expression
+
+
+def query_skills(expression) -> Set[str]:
+    """All skill names referenced by a parsed query."""
+    if expression[0] == 'skill':
+        return {expression[1]}
+    return set().union(*(query_skills(child) for child in expression[1:]))
+
+
+class SkillIndex:
+    """
+    Skill -> candidate bitmap index.
+
+    Every candidate gets a slot number and every skill a Python integer
+    whose bit i is set when the candidate in slot i has the skill, so
+    AND / OR / NOT are single big-integer operations.
+    """
+
+    def __init__(self):
+        self.loaded = False
+        self._lock = threading.RLock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._bitmaps: Dict[str, int] = {}
+        self._slots: Dict[str, int] = {}
+        self._keys: List[str] = []
+        self._skills: Dict[str, List[str]] = {}
+        self._free_slots: List[int] = []
+        self._universe = 0
+
+    def __len__(self) -> int:
+        return len(self._slots)
+
+    def reload(self, candidates: Iterable[Tuple[str, Iterable[str]]]) -> None:
+        """
+        Rebuild the index, swapping the new contents in when done.
+
+        Searches during the rebuild see the previous contents.
+
+        Args:
+            candidates: Iterable of (key, skills)
+        """
+        fresh = SkillIndex()
+        for key, skills in candidates:
+            fresh._add_locked(key, skills)
+        with self._lock:
+            self._bitmaps = fresh._bitmaps
+            self._slots = fresh._slots
+            self._keys = fresh._keys
+            self._skills = fresh._skills
+            self._free_slots = fresh._free_slots
+            self._universe = fresh._universe
+            self.loaded = True
+        logger.info("Loaded %d candidates into the skill index", len(fresh))
+
+    def add(self, key: str, skills: Iterable[str]) -> None:
+        """
+        Index a candidate's skills, replacing any earlier entry for the key.
+
+        Args:
+            key: Candidate key (email)
+            skills: Skill names or aliases
+        """
+        with self._lock:
+            self._add_locked(key, skills)
+
+    def remove(self, key: str) -> None:
+        """Remove a candidate if indexed."""
+        with self._lock:
+            self._remove_locked(key)
+
+    def _add_locked(self, key: str, skills: Iterable[str]) -> None:
+        self._remove_locked(key)
+        if self._free_slots:
+            slot = self._free_slots.pop()
+            self._keys[slot] = key
+        else:
+            slot = len(self._keys)
+            self._keys.append(key)
+
+        bit = 1 << slot
+        self._slots[key] = slot
+        self._skills[key] = canonical_skills(skills)
+        self._universe |= bit
+        for skill in self._skills[key]:
+            self._bitmaps[skill] = self._bitmaps.get(skill, 0) | bit
+
+    def _remove_locked(self, key: str) -> None:
+        slot = self._slots.pop(key, None)
+        if slot is None:
+            return
+        mask = ~(1 << slot)
+        for skill in self._skills.pop(key):
+            remaining = self._bitmaps[skill] & mask
+            if remaining:
+                self._bitmaps[skill] = remaining
+            else:
+                del self._bitmaps[skill]
+        self._universe &= mask
+        self._free_slots.append(slot)
+
+    def _evaluate(self, expression) -> int:
+        kind = expression[0]
+        if kind == 'skill':
+            return self._bitmaps.get(expression[1], 0)
+        if kind == 'not':
+            return self._universe & ~self._evaluate(expression[1])
+        left = self._evaluate(expression[1])
+        right = self._evaluate(expression[2])
+        return left & right if kind == 'and' else left | right
+
+    def search(self, query: str) -> List[str]:
+        """
+        Candidates matching a boolean skill query, in index order.
+
+        Args:
+            query: e.g. "python AND (django OR flask) AND NOT php"
+
+        Returns:
+            List of candidate keys
+
+        Raises:
+            ValueError: If the query is malformed
+        """
+        expression = parse_query(query)
+        with self._lock:
+            bitmap = self._evaluate(expression)
+            keys = []
+            while bitmap:
+                low_bit = bitmap & -bitmap
+                keys.append(self._keys[low_bit.bit_length() - 1])
+                bitmap ^= low_bit
+            return keys
+
+    def skills_of(self, key: str) -> List[str]:
+        """Canonical skills indexed for a candidate."""
+        return self._skills.get(key, [])
+
+
+# Global instance
+_skill_index: SkillIndex = None
+
+
+def get_skill_index() -> SkillIndex:
+    """Get or initialize global skill index instance."""
+    global _skill_index
+    if _skill_index is None:
+        _skill_index = SkillIndex()
+    return _skill_index
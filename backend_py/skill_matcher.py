@@ -2,9 +2,8 @@
 
 from typing import Dict, List, Tuple
 import numpy as np
-from sklearn.metrics.pairwise import cosine_similarity
 
-from .config import SEMANTIC_WEIGHT, SKILL_WEIGHT
+from .scoring_engine import SkillOverlap, combine_scores, cosine_scores
 
 
 class SkillMatcher:
@@ -71,11 +70,7 @@ class SkillMatcher:
         Returns:
             Similarity score (0-1)
         """
-        # Cosine similarity returns [[score]]
-        similarity = cosine_similarity(
-            resume_embedding.reshape(1, -1),
-            job_embedding.reshape(1, -1)
-        )[0][0]
+        similarity = cosine_scores(job_embedding, resume_embedding.reshape(1, -1), clamp=False)[0]
         
         return float(similarity)
     
@@ -96,12 +91,7 @@ class SkillMatcher:
         Returns:
             Final score (0-1)
         """
-        final_score = (
-            SEMANTIC_WEIGHT * semantic_similarity +
-            SKILL_WEIGHT * skill_match_score
-        )
-        
-        return float(final_score)
+        return float(combine_scores(semantic_similarity, skill_match_score))
     
     @staticmethod
     def rank_candidates(
@@ -199,15 +189,44 @@ class CandidateScorer:
         """
         if candidate_names is None:
             candidate_names = [f"Candidate_{i+1}" for i in range(len(resumes_data))]
+        if not resumes_data:
+            return []
+        
+        # Score every resume at once: one matrix product and one skill lookup
+        semantic = cosine_scores(
+            job_data['embedding'],
+            np.stack([resume_data['embedding'] for resume_data in resumes_data]),
+            clamp=False
+        )
+        job_skills = sorted(set(job_data['skills']['found_skills']))
+        resume_skill_sets = [set(resume_data['skills']['found_skills']) for resume_data in resumes_data]
+        overlap = SkillOverlap([job_skills], resume_skill_sets, empty_skill_score=1.0)
+        final = combine_scores(semantic, overlap.scores)
         
         scores = []
-        for resume_data, candidate_name in zip(resumes_data, candidate_names):
-            score = CandidateScorer.score_candidate(
-                resume_data,
-                job_data,
-                candidate_name
-            )
-            scores.append(score)
+        for index, (resume_data, candidate_name) in enumerate(zip(resumes_data, candidate_names)):
+            matched_skills, missing_skills = overlap.matched_and_missing(index)
+            skill_score = float(overlap.scores[index])
+            skill_match = {
+                'score': skill_score,
+                'matched_skills': matched_skills,
+                'missing_skills': missing_skills,
+                'additional_skills': sorted(resume_skill_sets[index].difference(job_skills)),
+                'matched_count': len(matched_skills),
+                'required_count': len(job_skills),
+                'match_percentage': round(skill_score * 100, 2)
+            }
+            final_score = float(final[index])
+            scores.append({
+                'candidate_name': candidate_name,
+                'semantic_similarity': round(float(semantic[index]), 4),
+                'skill_match': skill_match,
+                'final_score': round(final_score, 4),
+                'final_score_percentage': round(final_score * 100, 2),
+                'resume_skills': resume_data['skills'],
+                'job_required_skills': job_data['skills'],
+                'rank': None
+            })
         
         # Rank candidates
         ranked_scores = SkillMatcher.rank_candidates(scores)
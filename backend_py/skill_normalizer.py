@@ -0,0 +1,145 @@
+"""Semantic skill normalization: map free-text skill names to canonical skills."""
+
+import logging
+import threading
+from collections import OrderedDict
+from typing import Iterable, List, Optional
+
+import numpy as np
+
+from .config import SKILL_MATCH_THRESHOLD, SKILL_MEMO_SIZE
+from .skill_index import ALIAS_TO_SKILL
+
+logger = logging.getLogger(__name__)
+
+
+def _normalize_phrase(phrase: str) -> str:
+    return ' '.join(phrase.lower().split())
+
+
+class SkillNormalizer:
+    """
+    Maps skill phrases such as "Postgres DB" or "React.js" to canonical skills.
+
+    Known aliases resolve by exact lookup. Anything else is embedded and
+    compared against a precomputed matrix of every canonical skill and
+    alias embedding; the best match is accepted when its cosine similarity
+    reaches the threshold. Results for unseen phrases are memoized, so each
+    string is embedded at most once.
+    """
+
+    def __init__(self, nlp, threshold: float = SKILL_MATCH_THRESHOLD, memo_size: int = SKILL_MEMO_SIZE):
+        """
+        Args:
+            nlp: NLPProcessor (anything with get_embeddings)
+            threshold: Minimum cosine similarity to accept a canonical skill
+            memo_size: Maximum number of memoized phrases
+        """
+        self.nlp = nlp
+        self.threshold = threshold
+        self.memo_size = memo_size
+        self._memo: "OrderedDict[str, Optional[str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._phrases = sorted(ALIAS_TO_SKILL)
+        self._skills = [ALIAS_TO_SKILL[phrase] for phrase in self._phrases]
+        embeddings = np.asarray(nlp.get_embeddings(self._phrases), dtype=np.float32)
+        self._matrix = embeddings / (np.linalg.norm(embeddings, axis=1, keepdims=True) + 1e-10)
+        logger.info("Skill normalizer ready with %d canonical phrases", len(self._phrases))
+
+    def match(self, phrases: Iterable[str]) -> List[Optional[str]]:
+        """
+        Canonical skill for each phrase, or None when nothing is similar enough.
+
+        All phrases that are neither aliases nor memoized are embedded in a
+        single batch and scored with one matrix product.
+
+        Args:
+            phrases: Free-text skill names
+
+        Returns:
+            List aligned with phrases
+        """
+        normalized = [_normalize_phrase(phrase) for phrase in phrases]
+        results: List[Optional[str]] = [None] * len(normalized)
+        unseen = {}
+
+        with self._lock:
+            for position, phrase in enumerate(normalized):
+                if not phrase:
+                    continue
+                if phrase in ALIAS_TO_SKILL:
+                    results[position] = ALIAS_TO_SKILL[phrase]
+                elif phrase in self._memo:
+                    self._memo.move_to_end(phrase)
+                    results[position] = self._memo[phrase]
+                else:
+                    unseen.setdefault(phrase, []).append(position)
+
+        if unseen:
+            new_phrases = list(unseen)
+            embeddings = np.asarray(self.nlp.get_embeddings(new_phrases), dtype=np.float32)
+            # Out of place: get_embeddings may return a read-only array
+            embeddings = embeddings / (np.linalg.norm(embeddings, axis=1, keepdims=True) + 1e-10)
+            similarities = embeddings @ self._matrix.T
+            best = similarities.argmax(axis=1)
+            best_scores = similarities[np.arange(len(new_phrases)), best]
+
+            with self._lock:
+                for phrase, index, score in zip(new_phrases, best.tolist(), best_scores.tolist()):
+                    skill = self._skills[index] if score >= self.threshold else None
+                    self._memo[phrase] = skill
+                    if len(self._memo) > self.memo_size:
+                        self._memo.popitem(last=False)
+                    for position in unseen[phrase]:
+                        results[position] = skill
+        return results
+
+    def canonicalize(self, phrases: Iterable[str]) -> List[str]:
+        """
+        Canonical skill for each phrase, falling back to the lowercased phrase.
+
+        Args:
+            phrases: Free-text skill names
+
+        Returns:
+            List aligned with phrases
+        """
+        phrases = list(phrases)
+        return [
+            skill or _normalize_phrase(phrase)
+            for phrase, skill in zip(phrases, self.match(phrases))
+        ]
+
+
+# Global instance
+_skill_normalizer: SkillNormalizer = None
+_skill_normalizer_lock = threading.Lock()
+
+
+def get_skill_normalizer() -> SkillNormalizer:
+    """Get or initialize global skill normalizer instance."""
+    global _skill_normalizer
+    if _skill_normalizer is None:
+        with _skill_normalizer_lock:
+            if _skill_normalizer is None:
+                from .nlp_processor import get_nlp_processor
+                _skill_normalizer = SkillNormalizer(get_nlp_processor())
+    return _skill_normalizer
+
+
+def canonicalize_skills(phrases: Iterable[str]) -> List[str]:
+    """
+    Canonicalize skill phrases with the global normalizer.
+
+    Falls back to exact alias lookup if the embedding model is unavailable,
+    so callers on fallback paths never fail because of normalization.
+    """
+    phrases = list(phrases)
+    if not phrases:
+        return []
+    try:
+        return get_skill_normalizer().canonicalize(phrases)
+    except Exception as e:
+        logger.warning("Semantic skill normalization unavailable: %s", e)
+        return [ALIAS_TO_SKILL.get(_normalize_phrase(p), _normalize_phrase(p)) for p in phrases]
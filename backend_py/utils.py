@@ -1,6 +1,6 @@
 """Utility functions for the resume screening system."""
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 import json
 from datetime import datetime
 
@@ -39,12 +39,18 @@ def format_score_report(score_data: Dict) -> Dict:
     }
 
 
-def generate_summary_report(ranked_candidates: List[Dict]) -> Dict:
+def generate_summary_report(
+    ranked_candidates: List[Dict],
+    duplicate_clusters: List[Dict] = None,
+    listed: Optional[List[Dict]] = None
+) -> Dict:
     """
     Generate a summary report of all ranked candidates.
     
     Args:
         ranked_candidates: List of scored and ranked candidates
+        duplicate_clusters: Optional near-duplicate clusters (original, duplicates, min_similarity)
+        listed: Candidates to list in candidates_summary (defaults to all; totals always cover all)
         
     Returns:
         Summary report dictionary
@@ -54,7 +60,8 @@ def generate_summary_report(ranked_candidates: List[Dict]) -> Dict:
             'total_candidates': 0,
             'average_score': 0,
             'top_candidate': None,
-            'candidates_summary': []
+            'candidates_summary': [],
+            'duplicate_clusters': duplicate_clusters or []
         }
     
     average_score = sum(c['final_score'] for c in ranked_candidates) / len(ranked_candidates)
@@ -74,8 +81,10 @@ def generate_summary_report(ranked_candidates: List[Dict]) -> Dict:
                 'matched_skills': c['skill_match']['matched_count'],
                 'required_skills': c['skill_match']['required_count'],
             }
-            for c in ranked_candidates
-        ]
+            for c in (ranked_candidates if listed is None else listed)
+        ],
+        'duplicate_clusters': duplicate_clusters or [],
+        'duplicate_count': sum(len(cluster['duplicates']) for cluster in duplicate_clusters or [])
     }
     
     return summary
@@ -0,0 +1,152 @@
+"""
+Measure /health latency while the app is busy screening resumes.
+
+Sends --clients concurrent /api/screen-resumes requests (--resumes PDFs each)
+in a loop and, at the same time, polls /health every --interval ms. Each
+/health latency is measured from when the poll was due, so for each executor
+mode the percentiles show how long the event loop was blocked:
+
+    inline   - blocking work runs on the event loop (the handlers before executors.py)
+    thread   - model, scoring and parsing calls run in the thread pool
+    process  - as thread, but resume parsing runs in a process pool
+
+Usage:
+    python -m benchmarks.bench_concurrency --clients 4 --resumes 10 --duration 10
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from typing import Dict, List, Tuple
+
+import httpx
+
+import backend_py.app as app_module
+from backend_py.executors import EXECUTOR_MODES, configure_executors
+from backend_py.nlp_processor import get_nlp_processor
+
+from .common import percentile, environment_info, write_results, results_path
+from .corpus import generate_job_description, generate_resume_text, make_pdf_bytes
+
+
+def build_upload(resume_count: int, seed: int) -> Tuple[List[Tuple], Dict[str, str]]:
+    """
+    Build one screening request: multipart files and form fields.
+
+    Args:
+        resume_count: Number of PDF resumes in the request
+        seed: Random seed
+
+    Returns:
+        Tuple of (files, data) for httpx
+    """
+    rng = random.Random(seed)
+    files = []
+    for index in range(resume_count):
+        _, text = generate_resume_text(rng)
+        files.append(('resumes', (f"resume_{index}.pdf", make_pdf_bytes(text), 'application/pdf')))
+    return files, {'job_description': generate_job_description(rng)['description']}
+
+
+async def measure(
+    client: httpx.AsyncClient,
+    upload: Tuple[List[Tuple], Dict[str, str]],
+    clients: int,
+    duration: float,
+    interval: float
+) -> Dict:
+    """
+    Run screening load for `duration` seconds while polling /health.
+
+    Returns:
+        /health percentiles and screening throughput
+    """
+    files, data = upload
+    deadline = time.perf_counter() + duration
+    screening: List[float] = []
+    errors = 0
+
+    async def screen():
+        nonlocal errors
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            response = await client.post('/api/screen-resumes', files=files, data=data)
+            screening.append(time.perf_counter() - start)
+            if response.status_code >= 400 or response.json().get('status') == 'error':
+                errors += 1
+            # The in-process transport never suspends on its own; yield as a socket would
+            await asyncio.sleep(0)
+
+    async def poll():
+        # Latency counts from when each poll was due, so time spent waiting for a
+        # blocked loop to run the poller is included rather than hidden
+        latencies = []
+        due = time.perf_counter()
+        while due < deadline:
+            await asyncio.sleep(max(due - time.perf_counter(), 0))
+            await client.get('/health')
+            latencies.append(time.perf_counter() - due)
+            due = max(due + interval, time.perf_counter())
+        return latencies
+
+    results = await asyncio.gather(poll(), *(screen() for _ in range(clients)))
+    health = results[0]
+    return {
+        'health_requests': len(health),
+        'health_p50_ms': round(percentile(health, 50) * 1000, 2),
+        'health_p99_ms': round(percentile(health, 99) * 1000, 2),
+        'health_max_ms': round(max(health, default=0) * 1000, 2),
+        'screenings': len(screening),
+        'screening_errors': errors,
+        'screening_p50_ms': round(percentile(screening, 50) * 1000, 2)
+    }
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--modes', nargs='+', choices=EXECUTOR_MODES, default=['inline', 'thread'])
+    parser.add_argument('--clients', type=int, default=4, help='Concurrent screening requests')
+    parser.add_argument('--resumes', type=int, default=10, help='Resumes per screening request')
+    parser.add_argument('--duration', type=float, default=10.0, help='Seconds of load per mode')
+    parser.add_argument('--interval', type=float, default=10.0, help='Milliseconds between /health polls')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', default=results_path('bench_concurrency.json'))
+    args = parser.parse_args(argv)
+
+    get_nlp_processor()  # Load models outside the measured window
+    upload = build_upload(args.resumes, args.seed)
+
+    async def run(mode):
+        configure_executors(mode)
+        transport = httpx.ASGITransport(app=app_module.app)
+        async with httpx.AsyncClient(transport=transport, base_url='http://bench', timeout=None) as client:
+            await client.post('/api/screen-resumes', files=upload[0], data=upload[1])  # Warm up
+            return await measure(client, upload, args.clients, args.duration, args.interval / 1000)
+
+    print(f"{args.clients} clients x {args.resumes} resumes, /health every {args.interval:g}ms")
+    print(f"{'mode':<9}{'health':>8}{'p50 ms':>9}{'p99 ms':>10}{'max ms':>10}{'screens':>9}{'screen p50':>12}")
+    results = {}
+    try:
+        for mode in args.modes:
+            row = results[mode] = asyncio.run(run(mode))
+            print(
+                f"{mode:<9}{row['health_requests']:>8}{row['health_p50_ms']:>9.2f}{row['health_p99_ms']:>10.2f}"
+                f"{row['health_max_ms']:>10.2f}{row['screenings']:>9}{row['screening_p50_ms']:>12.2f}"
+            )
+    finally:
+        configure_executors()
+
+    write_results(args.output, {
+        'benchmark': 'concurrency',
+        'environment': environment_info(),
+        'config': vars(args),
+        'results': results
+    })
+    print(f"Results written to {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,97 @@
+"""
+Measure size and ranking accuracy of the compact embedding storage formats.
+
+Embeds a synthetic resume corpus and job descriptions with the configured
+model (MODEL_NAME), then, for each format (float32 / float16 / int8,
+optionally after PCA), reports stored bytes per vector and how closely
+job -> candidate rankings match full-precision
+SkillMatcher.compute_semantic_similarity: recall@K of the top K and the
+absolute cosine error.
+
+Accuracy depends on the embeddings. Only a run with sentence-transformers
+installed measures the production model; the results record its version
+(null when a stand-in module produced the embeddings).
+
+Usage:
+    python -m benchmarks.bench_embedding_store --candidates 2000 --pca 256 128
+"""
+
+import argparse
+import sys
+from typing import List
+
+import bson
+import numpy as np
+
+from backend_py.config import MODEL_NAME
+from backend_py.embedding_store import EmbeddingCodec, PCAProjection, STORAGE_FORMATS, evaluate_ranking_impact
+from backend_py.nlp_processor import get_nlp_processor
+
+from .common import environment_info, package_version, write_results, results_path
+from .standins import generate_seed_data
+
+
+def bson_list_bytes(embedding: np.ndarray) -> int:
+    """Size of an embedding stored as a BSON array of doubles (field overhead included)."""
+    return len(bson.encode({'e': [float(x) for x in embedding]}))
+
+
+def bson_binary_bytes(codec: EmbeddingCodec, embedding: np.ndarray) -> int:
+    """Size of an embedding stored as BSON binary by the codec (field overhead included)."""
+    return len(bson.encode({'e': codec.to_bson(embedding)}))
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--candidates', type=int, default=2000)
+    parser.add_argument('--queries', type=int, default=20, help='Job descriptions used as queries')
+    parser.add_argument('--pca', type=int, nargs='*', default=[256, 128], help='PCA dimensions to evaluate')
+    parser.add_argument('--top-k', type=int, default=10)
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--output', default=results_path('bench_embedding_store.json'), help='Where to write results JSON')
+    args = parser.parse_args(argv)
+
+    model_version = package_version('sentence-transformers')
+    if model_version is None:
+        print("sentence-transformers is not installed: accuracy below reflects a stand-in embedder, not the model")
+    nlp = get_nlp_processor()
+    candidates, jobs = generate_seed_data(args.candidates, args.queries, seed=args.seed)
+    embeddings = np.asarray(nlp.get_embeddings([c['resumeText'] for c in candidates]), dtype=np.float32)
+    queries = np.asarray(nlp.get_embeddings([j['description'] for j in jobs]), dtype=np.float32)
+
+    print(f"{'format':<16}{'dims':>6}{'bytes':>8}{'bson':>8}  recall@{args.top_k:<4}{'max err':>10}{'mean err':>11}")
+    print(f"{'bson list':<16}{embeddings.shape[1]:>6}{'':>8}{bson_list_bytes(embeddings[0]):>8}")
+
+    results = {'bson_list_of_doubles': {'bson_bytes': bson_list_bytes(embeddings[0])}}
+    configurations = [(storage_format, None) for storage_format in STORAGE_FORMATS]
+    for dims in args.pca:
+        if dims < embeddings.shape[1]:
+            # Fit on the candidates; in production the projection is fitted once and saved
+            configurations.append(('int8', PCAProjection.fit(embeddings, dims)))
+
+    for storage_format, projection in configurations:
+        codec = EmbeddingCodec(storage_format, projection)
+        row = evaluate_ranking_impact(embeddings, queries, codec, top_k=args.top_k)
+        row['bson_bytes'] = bson_binary_bytes(codec, embeddings[0])
+        name = storage_format if projection is None else f"{storage_format}+pca{projection.n_components}"
+        results[name] = row
+        print(f"{name:<16}{row['dimensions']:>6}{row['bytes_per_vector']:>8}{row['bson_bytes']:>8}  "
+              f"{row['recall_at_k']:<11.3f}{row['max_abs_error']:>10.5f}{row['mean_abs_error']:>11.6f}")
+
+    write_results(args.output, {
+        'benchmark': 'embedding_store',
+        'environment': environment_info(),
+        'model': MODEL_NAME,
+        'sentence_transformers': model_version,
+        'seed': args.seed,
+        'candidates': args.candidates,
+        'queries': args.queries,
+        'top_k': args.top_k,
+        'results': results
+    })
+    print(f"Results written to {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
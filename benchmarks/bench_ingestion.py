@@ -0,0 +1,130 @@
+"""
+Measure peak Python heap while ingesting a 50-file screening batch.
+
+Builds uploads the way the multipart parser does (spooled temporary files,
+on disk past 1MB), then runs the per-file ingestion of /api/screen-resumes
+two ways and reports tracemalloc peaks:
+
+    read_all  - await upload.read() and parse the bytes (the previous behaviour)
+    ingest    - ingestion.ingest_upload() and parse the spooled file handle
+
+Usage:
+    python -m benchmarks.bench_ingestion --files 50 --file-mb 5
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+import tracemalloc
+from tempfile import SpooledTemporaryFile
+from typing import Dict, List
+
+from fastapi import UploadFile
+
+from backend_py.dedup import content_hash
+from backend_py.ingestion import ingest_upload
+from backend_py.resume_parser import extract_text_from_resume, clean_resume_text
+
+from .common import environment_info, write_results, results_path
+from .corpus import generate_resume_text, make_pdf_bytes
+
+SPOOL_MEMORY = 1024 * 1024  # Starlette's in-memory limit per uploaded file
+
+
+def build_uploads(count: int, file_bytes: int, seed: int) -> List[UploadFile]:
+    """
+    Build padded PDF uploads backed by spooled temporary files.
+
+    Args:
+        count: Number of files
+        file_bytes: Approximate size of each file
+        seed: Random seed for the resume text
+
+    Returns:
+        List of UploadFile positioned at the start
+    """
+    rng = random.Random(seed)
+    uploads = []
+    for index in range(count):
+        _, text = generate_resume_text(rng)
+        content = make_pdf_bytes(text, padding=file_bytes)
+        spool = SpooledTemporaryFile(max_size=SPOOL_MEMORY)
+        spool.write(content)
+        spool.seek(0)
+        uploads.append(UploadFile(spool, size=len(content), filename=f"resume_{index}.pdf"))
+    return uploads
+
+
+async def ingest_read_all(uploads: List[UploadFile]) -> List[str]:
+    """Previous path: read each upload fully into memory and parse the bytes."""
+    texts = []
+    for upload in uploads:
+        await upload.seek(0)
+        file_content = await upload.read()
+        content_hash(file_content)
+        text, _ = extract_text_from_resume(file_content, upload.filename)
+        texts.append(clean_resume_text(text))
+    return texts
+
+
+async def ingest_spooled(uploads: List[UploadFile]) -> List[str]:
+    """Current path: bounded, chunked ingestion that parses the spooled file handle."""
+    texts = []
+    for upload in uploads:
+        ingested = await ingest_upload(upload)
+        text, _ = extract_text_from_resume(ingested.file, upload.filename)
+        texts.append(clean_resume_text(text))
+    return texts
+
+
+def measure(approach, uploads: List[UploadFile]) -> Dict:
+    """Run one approach under tracemalloc and return its peak heap and time."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    texts = asyncio.run(approach(uploads))
+    seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        'files': len(texts),
+        'seconds': round(seconds, 4),
+        'peak_mb': round(peak / (1024 * 1024), 2),
+        'texts': texts
+    }
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--files', type=int, default=50, help='Files per screening batch (the endpoint allows 50)')
+    parser.add_argument('--file-mb', type=float, default=5.0, help='Size of each file in MB')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', default=results_path('bench_ingestion.json'), help='Where to write results JSON')
+    args = parser.parse_args(argv)
+
+    uploads = build_uploads(args.files, int(args.file_mb * 1024 * 1024), args.seed)
+    total_mb = sum(upload.size for upload in uploads) / (1024 * 1024)
+    print(f"{args.files} files, {total_mb:.1f}MB total")
+
+    results = {}
+    for name, approach in (('read_all', ingest_read_all), ('ingest', ingest_spooled)):
+        results[name] = measure(approach, uploads)
+        print(f"{name:<10} peak {results[name]['peak_mb']:>8.2f}MB  {results[name]['seconds']:.3f}s")
+
+    if results['read_all'].pop('texts') != results['ingest'].pop('texts'):
+        raise RuntimeError("Both ingestion paths must extract the same text")
+
+    write_results(args.output, {
+        'benchmark': 'ingestion',
+        'environment': environment_info(),
+        'files': args.files,
+        'file_mb': args.file_mb,
+        'results': results
+    })
+    print(f"Results written to {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,146 @@
+"""
+Benchmark the screening pipeline stage by stage on a synthetic corpus.
+
+Usage:
+    python -m benchmarks.bench_pipeline --sizes 10 100 1000 10000 --output results.json
+    python -m benchmarks.bench_pipeline --sizes 10 100 --compare baseline.json
+"""
+
+import argparse
+import json
+import random
+import sys
+from typing import Dict, List
+
+from fastapi.testclient import TestClient
+
+from backend_py.app import app
+from backend_py.nlp_processor import get_nlp_processor
+from backend_py.resume_parser import extract_text_from_resume, clean_resume_text
+from backend_py.skill_matcher import CandidateScorer
+
+from .common import timed, environment_info, write_results, compare_results, print_comparison, results_path
+from .corpus import generate_corpus, generate_job_description
+
+DEFAULT_SIZES = [10, 100, 1000, 10000]
+SCREEN_BATCH_LIMIT = 50  # /api/screen-resumes accepts at most 50 files per call
+
+
+def benchmark_stages(corpus: List[Dict], job: Dict) -> Dict:
+    """
+    Time each pipeline stage over the whole corpus.
+
+    Args:
+        corpus: Output of generate_corpus
+        job: Output of generate_job_description
+
+    Returns:
+        Mapping of stage name to timing
+    """
+    nlp = get_nlp_processor()
+    results = {}
+
+    pdfs = [doc for doc in corpus if doc['filename'].endswith('.pdf')]
+    docxs = [doc for doc in corpus if doc['filename'].endswith('.docx')]
+
+    texts = {}
+    with timed(results, 'parse_pdf', len(pdfs)):
+        for doc in pdfs:
+            texts[doc['filename']], _ = extract_text_from_resume(doc['content'], doc['filename'])
+    with timed(results, 'parse_docx', len(docxs)):
+        for doc in docxs:
+            texts[doc['filename']], _ = extract_text_from_resume(doc['content'], doc['filename'])
+
+    with timed(results, 'clean', len(corpus)):
+        cleaned = [clean_resume_text(texts[doc['filename']]) for doc in corpus]
+
+    with timed(results, 'extract_skills', len(corpus)):
+        skills = [nlp.extract_skills(text) for text in cleaned]
+
+    with timed(results, 'embed', len(corpus)):
+        embeddings = nlp.get_embeddings(cleaned)
+
+    job_data = nlp.process_job_description(job['description'])
+    resumes_data = [
+        {'embedding': embedding, 'skills': skill_data, 'key_entities': [], 'text': text}
+        for embedding, skill_data, text in zip(embeddings, skills, cleaned)
+    ]
+    with timed(results, 'score', len(corpus)):
+        CandidateScorer.score_batch(resumes_data, job_data, [doc['name'] for doc in corpus])
+
+    return results
+
+
+def benchmark_end_to_end(corpus: List[Dict], job: Dict) -> Dict:
+    """
+    Time the /api/screen-resumes endpoint over the corpus in 50-file requests.
+
+    Args:
+        corpus: Output of generate_corpus
+        job: Output of generate_job_description
+
+    Returns:
+        Mapping with the end_to_end timing
+    """
+    client = TestClient(app)
+    results = {}
+    with timed(results, 'screen_resumes_end_to_end', len(corpus)):
+        for start in range(0, len(corpus), SCREEN_BATCH_LIMIT):
+            batch = corpus[start:start + SCREEN_BATCH_LIMIT]
+            files = [('resumes', (doc['filename'], doc['content'])) for doc in batch]
+            response = client.post(
+                '/api/screen-resumes',
+                files=files,
+                data={'job_description': job['description']}
+            )
+            if response.json().get('status') != 'success':
+                raise RuntimeError(f"Screening failed: {response.json()}")
+    return results
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', default=results_path('bench_pipeline.json'), help='Where to write results JSON')
+    parser.add_argument('--compare', help='Baseline results JSON to compare against')
+    parser.add_argument('--threshold', type=float, default=0.2, help='Allowed slowdown before flagging (0.2 = 20%%)')
+    parser.add_argument('--skip-end-to-end', action='store_true')
+    args = parser.parse_args(argv)
+
+    # Load models before timing anything
+    get_nlp_processor()
+
+    job = generate_job_description(random.Random(args.seed))
+    results = {}
+    for size in args.sizes:
+        corpus = generate_corpus(size, seed=args.seed)
+        stages = benchmark_stages(corpus, job)
+        if not args.skip_end_to_end:
+            stages.update(benchmark_end_to_end(corpus, job))
+        results[str(size)] = stages
+        print(f"{size:>6} docs: " + ", ".join(
+            f"{stage}={timing['seconds']:.3f}s" for stage, timing in stages.items()
+        ))
+
+    write_results(args.output, {
+        'benchmark': 'pipeline',
+        'environment': environment_info(),
+        'seed': args.seed,
+        'job': job,
+        'results': results
+    })
+    print(f"Results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        rows = compare_results(results, baseline.get('results', {}), args.threshold)
+        print_comparison(rows)
+        if any(row['regression'] for row in rows):
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
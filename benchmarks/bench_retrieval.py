@@ -0,0 +1,132 @@
+"""
+Measure recall and latency of the BM25 prefilter in /api/match-candidates.
+
+For each pool size the endpoint is run once with the prefilter disabled
+(brute force: every candidate is embedded and scored) and once per
+retrieval depth. Recall@K is the fraction of the brute-force top K that
+the prefiltered run also returns in its top K.
+
+Recall depends on the embedding model the run loads. Only a run with the
+real sentence-transformers model measures transformer recall; numbers from
+stand-in models show how the prefilter behaves, not production quality.
+
+Usage:
+    python -m benchmarks.bench_retrieval --sizes 1000 10000 --depths 100 500 2000
+"""
+
+import argparse
+import sys
+import time
+from statistics import mean
+from typing import Dict, List
+
+from fastapi.testclient import TestClient
+
+import backend_py.app as app_module
+from backend_py.bm25_index import get_candidate_search_index
+from backend_py.nlp_processor import get_nlp_processor
+
+from .common import environment_info, write_results, results_path
+from .standins import generate_seed_data, install_mongo_standin
+
+DEFAULT_SIZES = [1000, 10000]
+DEFAULT_DEPTHS = [100, 500, 2000]
+
+
+def run_queries(client: TestClient, jobs: List[Dict], depth: int, top_k: int) -> Dict:
+    """
+    Run every job through /api/match-candidates at one retrieval depth.
+
+    Args:
+        client: TestClient for the app
+        jobs: Job documents used as queries
+        depth: MATCH_RETRIEVAL_DEPTH for this run
+        top_k: Number of top matches kept per query
+
+    Returns:
+        Dictionary with per-query top emails and latencies
+    """
+    app_module.MATCH_RETRIEVAL_DEPTH = depth
+    tops = []
+    latencies = []
+    for job in jobs:
+        start = time.perf_counter()
+        response = client.post('/api/match-candidates', json={
+            'jobDescription': job['description'],
+            'requiredSkills': job['requiredSkills']
+        })
+        latencies.append(time.perf_counter() - start)
+        body = response.json()
+        if body.get('status') != 'success':
+            raise RuntimeError(f"Matching failed: {body}")
+        tops.append([match['email'] for match in body['data']['matches'][:top_k]])
+    return {'tops': tops, 'latencies': latencies}
+
+
+def recall_at_k(expected: List[List[str]], actual: List[List[str]]) -> float:
+    """Mean fraction of each expected top-K list found in the matching actual list."""
+    ratios = [
+        len(set(e) & set(a)) / len(e)
+        for e, a in zip(expected, actual) if e
+    ]
+    return mean(ratios) if ratios else 1.0
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help='Candidate pool sizes')
+    parser.add_argument('--depths', type=int, nargs='+', default=DEFAULT_DEPTHS, help='BM25 retrieval depths')
+    parser.add_argument('--queries', type=int, default=5, help='Job descriptions used as queries')
+    parser.add_argument('--top-k', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--output', default=results_path('bench_retrieval.json'), help='Where to write results JSON')
+    args = parser.parse_args(argv)
+
+    # Load models before timing anything
+    get_nlp_processor()
+    client = TestClient(app_module.app)
+
+    results = {}
+    for size in args.sizes:
+        candidates, jobs = generate_seed_data(size, args.queries, seed=args.seed)
+        install_mongo_standin(app_module, candidates, [])
+        get_candidate_search_index().invalidate()
+
+        # Warm up (builds the BM25 index) outside the timed runs
+        run_queries(client, jobs[:1], min(args.depths), args.top_k)
+
+        brute = run_queries(client, jobs, size, args.top_k)
+        rows = {'brute_force': {
+            'depth': size,
+            'recall_at_k': 1.0,
+            'mean_seconds': round(mean(brute['latencies']), 4)
+        }}
+        print(f"{size:>7} candidates  brute force        {rows['brute_force']['mean_seconds']:.3f}s/query")
+
+        for depth in args.depths:
+            if depth >= size:
+                continue
+            run = run_queries(client, jobs, depth, args.top_k)
+            rows[f"depth_{depth}"] = {
+                'depth': depth,
+                'recall_at_k': round(recall_at_k(brute['tops'], run['tops']), 4),
+                'mean_seconds': round(mean(run['latencies']), 4)
+            }
+            row = rows[f"depth_{depth}"]
+            print(f"{size:>7} candidates  depth {depth:<6}  recall@{args.top_k}={row['recall_at_k']:.3f}  "
+                  f"{row['mean_seconds']:.3f}s/query")
+        results[str(size)] = rows
+
+    write_results(args.output, {
+        'benchmark': 'retrieval',
+        'environment': environment_info(),
+        'seed': args.seed,
+        'top_k': args.top_k,
+        'results': results
+    })
+    print(f"Results written to {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
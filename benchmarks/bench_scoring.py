@@ -0,0 +1,148 @@
+"""
+Benchmark the scoring engine in isolation, without models or a database.
+
+Scores one job against N targets with random embeddings and skill sets,
+and times the vectorized engine against the per-item loop the endpoints
+used before. Results from both paths are checked to agree.
+
+Usage:
+    python -m benchmarks.bench_scoring --sizes 100 1000 10000 100000
+    python -m benchmarks.bench_scoring --sizes 1000 --top-k 20 --compare baseline.json
+"""
+
+import argparse
+import json
+import sys
+from typing import Dict, List
+
+import numpy as np
+
+from backend_py.config import SEMANTIC_WEIGHT, SKILL_WEIGHT
+from backend_py.scoring_engine import ScoringEngine, cosine_scores
+from backend_py.skills_database import SKILLS_LOWERCASE
+
+from .common import timed, environment_info, write_results, compare_results, print_comparison, results_path
+
+DEFAULT_SIZES = [100, 1000, 10000, 100000]
+EMBEDDING_DIM = 384  # all-MiniLM-L6-v2
+
+
+def generate_targets(count: int, seed: int) -> Dict:
+    """
+    Generate a job and count candidates with random embeddings and skills.
+
+    Args:
+        count: Number of candidates
+        seed: Random seed
+
+    Returns:
+        Dictionary with job_embedding, job_skills, embeddings and skill_sets
+    """
+    rng = np.random.default_rng(seed)
+    skills = np.array(sorted(SKILLS_LOWERCASE))
+    return {
+        'job_embedding': rng.standard_normal(EMBEDDING_DIM).astype(np.float32),
+        'job_skills': rng.choice(skills, size=8, replace=False).tolist(),
+        'embeddings': rng.standard_normal((count, EMBEDDING_DIM)).astype(np.float32),
+        'skill_sets': [
+            set(rng.choice(skills, size=int(rng.integers(3, 20)), replace=False).tolist())
+            for _ in range(count)
+        ]
+    }
+
+
+def score_per_item(data: Dict) -> List[Dict]:
+    """The per-candidate loop the matching endpoints ran before the engine."""
+    job_embedding = data['job_embedding']
+    results = []
+    for index, (embedding, skill_set) in enumerate(zip(data['embeddings'], data['skill_sets'])):
+        semantic = float(np.dot(job_embedding, embedding) / (
+            np.linalg.norm(job_embedding) * np.linalg.norm(embedding) + 1e-10
+        ))
+        semantic = max(0.0, min(1.0, semantic))
+        matched = [skill for skill in data['job_skills'] if skill.lower() in skill_set]
+        missing = [skill for skill in data['job_skills'] if skill.lower() not in skill_set]
+        skill_score = len(matched) / len(data['job_skills'])
+        results.append({
+            'index': index,
+            'semantic_score': semantic,
+            'skill_score': skill_score,
+            'final_score': SEMANTIC_WEIGHT * semantic + SKILL_WEIGHT * skill_score,
+            'matched_skills': matched,
+            'missing_skills': missing
+        })
+    results.sort(key=lambda x: x['final_score'], reverse=True)
+    return results
+
+
+def benchmark_size(data: Dict, top_k: int = None) -> Dict:
+    """
+    Time the per-item loop and the engine on one generated dataset.
+
+    Args:
+        data: Output of generate_targets
+        top_k: Passed to ScoringEngine.rank
+
+    Returns:
+        Mapping of stage name to timing
+    """
+    count = len(data['skill_sets'])
+    results = {}
+
+    with timed(results, 'per_item_loop', count):
+        expected = score_per_item(data)
+
+    with timed(results, 'engine', count):
+        semantic = cosine_scores(data['job_embedding'], data['embeddings'])
+        ranked = ScoringEngine.rank(semantic, [data['job_skills']], data['skill_sets'], top_k=top_k)
+
+    compared = len(ranked)
+    if not np.allclose(
+        [r['final_score'] for r in ranked],
+        [r['final_score'] for r in expected[:compared]],
+        atol=1e-5
+    ):
+        raise RuntimeError("Engine scores differ from the per-item loop")
+    return results
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--top-k', type=int, default=None, help='Only build the best K results')
+    parser.add_argument('--output', default=results_path('bench_scoring.json'), help='Where to write results JSON')
+    parser.add_argument('--compare', help='Baseline results JSON to compare against')
+    parser.add_argument('--threshold', type=float, default=0.2, help='Allowed slowdown before flagging (0.2 = 20%%)')
+    args = parser.parse_args(argv)
+
+    results = {}
+    for size in args.sizes:
+        stages = benchmark_size(generate_targets(size, args.seed), args.top_k)
+        results[str(size)] = stages
+        speedup = stages['per_item_loop']['seconds'] / max(stages['engine']['seconds'], 1e-9)
+        print(f"{size:>7} targets: " + ", ".join(
+            f"{stage}={timing['seconds']:.4f}s" for stage, timing in stages.items()
+        ) + f" ({speedup:.1f}x)")
+
+    write_results(args.output, {
+        'benchmark': 'scoring',
+        'environment': environment_info(),
+        'seed': args.seed,
+        'top_k': args.top_k,
+        'results': results
+    })
+    print(f"Results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        rows = compare_results(results, baseline.get('results', {}), args.threshold)
+        print_comparison(rows)
+        if any(row['regression'] for row in rows):
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,138 @@
+"""
+Measure serialization time and bytes on the wire for a large ranked response.
+
+Builds a /api/screen-resumes style response for N candidates (format_score_report
+entries with full skill lists and explanations) and reports:
+
+    default  - FastAPI's path for a returned dict: jsonable_encoder + JSONResponse
+    fast     - responses.FastJSONResponse returned directly
+    gzip     - size after compression at GZIP_COMPRESS_LEVEL, as sent by GZipMiddleware
+
+Usage:
+    python -m benchmarks.bench_serialization --candidates 1000
+"""
+
+import argparse
+import gzip
+import random
+import sys
+import time
+from typing import Callable, Dict, List
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from backend_py.config import GZIP_COMPRESS_LEVEL
+from backend_py.responses import FastJSONResponse, orjson
+from backend_py.skills_database import ALL_SKILLS
+from backend_py.utils import create_success_response, format_score_report, generate_summary_report
+
+from .common import environment_info, write_results, results_path
+
+
+def build_response(count: int, seed: int) -> Dict:
+    """
+    Build a screening response envelope for `count` ranked candidates.
+
+    Args:
+        count: Number of candidates
+        seed: Random seed
+
+    Returns:
+        Envelope as returned by create_success_response
+    """
+    rng = random.Random(seed)
+    skills = sorted(ALL_SKILLS)
+    required = rng.sample(skills, 12)
+    ranked = []
+    for index in range(count):
+        candidate_skills = set(rng.sample(skills, rng.randint(5, 30)))
+        matched = [skill for skill in required if skill in candidate_skills]
+        missing = [skill for skill in required if skill not in candidate_skills]
+        skill_score = len(matched) / len(required)
+        semantic = rng.random()
+        final = 0.7 * semantic + 0.3 * skill_score
+        ranked.append({
+            'candidate_name': f"resume_{index}.pdf",
+            'final_score': round(final, 4),
+            'final_score_percentage': round(final * 100, 2),
+            'semantic_similarity': round(semantic, 4),
+            'skill_match': {
+                'score': skill_score,
+                'match_percentage': round(skill_score * 100, 2),
+                'matched_skills': matched,
+                'missing_skills': missing,
+                'additional_skills': sorted(candidate_skills - set(required)),
+                'matched_count': len(matched),
+                'required_count': len(required)
+            }
+        })
+    ranked.sort(key=lambda item: -item['final_score'])
+    for rank, item in enumerate(ranked, start=1):
+        item['rank'] = rank
+
+    return create_success_response(
+        data={
+            'job_analysis': {'required_skills': required, 'skill_count': len(required)},
+            'summary': generate_summary_report(ranked),
+            'ranked_candidates': [format_score_report(item) for item in ranked],
+            'screening_complete': True
+        },
+        message="Resume screening completed successfully"
+    )
+
+
+def time_render(render: Callable[[], bytes], repeat: int) -> Dict:
+    """Best-of-`repeat` time for one render, and the rendered body."""
+    best = float('inf')
+    body = b''
+    for _ in range(repeat):
+        start = time.perf_counter()
+        body = render()
+        best = min(best, time.perf_counter() - start)
+    return {'ms': round(best * 1000, 3), 'body': body}
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--candidates', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=20, help='Renders per approach (best time is kept)')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--output', default=results_path('bench_serialization.json'), help='Where to write results JSON')
+    args = parser.parse_args(argv)
+
+    envelope = build_response(args.candidates, args.seed)
+    approaches = {
+        'default': lambda: JSONResponse(jsonable_encoder(envelope)).body,
+        'fast': lambda: FastJSONResponse(envelope).body
+    }
+
+    print(f"{args.candidates} candidates, orjson {'installed' if orjson is not None else 'not installed'}")
+    print(f"{'approach':<10}{'render ms':>11}{'bytes':>11}{'gzip bytes':>12}{'gzip ms':>10}")
+    results = {}
+    for name, render in approaches.items():
+        timing = time_render(render, args.repeat)
+        body = timing.pop('body')
+        compressed = time_render(lambda: gzip.compress(body, compresslevel=GZIP_COMPRESS_LEVEL), args.repeat)
+        results[name] = {
+            'render_ms': timing['ms'],
+            'bytes': len(body),
+            'gzip_bytes': len(compressed['body']),
+            'gzip_ms': compressed['ms']
+        }
+        print(f"{name:<10}{timing['ms']:>11.2f}{len(body):>11}{len(compressed['body']):>12}{compressed['ms']:>10.2f}")
+
+    write_results(args.output, {
+        'benchmark': 'serialization',
+        'environment': environment_info(),
+        'candidates': args.candidates,
+        'orjson': orjson is not None,
+        'gzip_level': GZIP_COMPRESS_LEVEL,
+        'results': results
+    })
+    print(f"Results written to {args.output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,121 @@
+"""Shared timing, reporting and baseline comparison helpers for benchmarks."""
+
+import json
+import os
+import platform
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from importlib import metadata
+from typing import Dict, List, Optional
+
+# Default location for results JSON (ignored by git)
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+
+
+@contextmanager
+def timed(results: Dict, stage: str, count: int = 1):
+    """
+    Time a block and record it under results[stage].
+
+    Args:
+        results: Dictionary to record into
+        stage: Stage name
+        count: Number of documents processed in the block
+    """
+    start = time.perf_counter()
+    yield
+    seconds = time.perf_counter() - start
+    results[stage] = {
+        'seconds': round(seconds, 6),
+        'per_doc_ms': round(seconds * 1000 / max(count, 1), 4),
+        'docs_per_second': round(count / seconds, 2) if seconds > 0 else None
+    }
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a list of values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+
+def environment_info() -> Dict:
+    """Describe the machine the benchmark ran on."""
+    return {
+        'python': sys.version.split()[0],
+        'platform': platform.platform(),
+        'processor': platform.processor(),
+        'timestamp': datetime.utcnow().isoformat()
+    }
+
+
+def package_version(name: str) -> Optional[str]:
+    """Installed version of a distribution, or None if it is not installed (e.g. a stand-in module)."""
+    try:
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def results_path(filename: str) -> str:
+    """Default --output path for a benchmark: RESULTS_DIR/filename."""
+    return os.path.join(RESULTS_DIR, filename)
+
+
+def write_results(path: str, payload: Dict) -> None:
+    """Write benchmark results as JSON, creating the parent directory if needed."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, 'w') as f:
+        json.dump(payload, f, indent=2, sort_keys=True)
+
+
+def compare_results(current: Dict, baseline: Dict, threshold: float) -> List[Dict]:
+    """
+    Compare two result sets stage by stage.
+
+    Both dictionaries map size -> stage -> {'seconds': ...}. A stage is a
+    regression when it is slower than the baseline by more than threshold
+    (0.2 means 20%).
+
+    Args:
+        current: Results from this run
+        baseline: Stored baseline results
+        threshold: Allowed relative slowdown
+
+    Returns:
+        One row per stage present in both runs
+    """
+    rows = []
+    for size, stages in current.items():
+        for stage, measurement in stages.items():
+            base = baseline.get(size, {}).get(stage)
+            if not base or not base.get('seconds'):
+                continue
+            ratio = measurement['seconds'] / base['seconds']
+            rows.append({
+                'size': size,
+                'stage': stage,
+                'baseline_seconds': base['seconds'],
+                'current_seconds': measurement['seconds'],
+                'ratio': round(ratio, 3),
+                'regression': ratio > 1 + threshold
+            })
+    return rows
+
+
+def print_comparison(rows: List[Dict]) -> None:
+    """Print a comparison table produced by compare_results."""
+    print(f"{'size':>7}  {'stage':<24} {'baseline':>10} {'current':>10} {'ratio':>7}")
+    for row in rows:
+        flag = "  REGRESSION" if row['regression'] else ""
+        print(
+            f"{row['size']:>7}  {row['stage']:<24} "
+            f"{row['baseline_seconds']:>10.4f} {row['current_seconds']:>10.4f} "
+            f"{row['ratio']:>7.2f}{flag}"
+        )
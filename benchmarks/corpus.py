@@ -0,0 +1,186 @@
+"""Deterministic synthetic resume and job description corpus."""
+
+import io
+import random
+from typing import Dict, List, Tuple
+
+from docx import Document
+
+from backend_py.skills_database import ALL_SKILLS
+
+FIRST_NAMES = [
+    "Alex", "Priya", "Jordan", "Wei", "Fatima", "Diego", "Hannah", "Kenji",
+    "Amara", "Lucas", "Sofia", "Ravi", "Elena", "Omar", "Grace", "Mateo"
+]
+LAST_NAMES = [
+    "Smith", "Kumar", "Lee", "Chen", "Okafor", "Garcia", "Muller", "Tanaka",
+    "Nguyen", "Rossi", "Ivanova", "Haddad", "Brown", "Silva", "Khan", "Moreau"
+]
+ROLES = [
+    "Software Engineer", "Backend Developer", "Frontend Developer",
+    "Data Engineer", "DevOps Engineer", "Full Stack Developer",
+    "Machine Learning Engineer", "QA Engineer"
+]
+FILLER = [
+    "Delivered features across the full product lifecycle.",
+    "Collaborated with product and design to ship customer-facing work.",
+    "Reduced latency and infrastructure cost for core services.",
+    "Mentored junior engineers and led code reviews.",
+    "Owned on-call rotation and improved incident response.",
+    "Wrote technical documentation and design proposals.",
+]
+
+
+def _skill_names() -> List[str]:
+    return sorted(ALL_SKILLS.keys())
+
+
+def generate_resume_text(rng: random.Random) -> Tuple[str, str]:
+    """
+    Generate one synthetic resume.
+
+    Args:
+        rng: Seeded random generator
+
+    Returns:
+        Tuple of (candidate_name, resume_text)
+    """
+    skills = _skill_names()
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    picked = rng.sample(skills, rng.randint(4, 14))
+    # Use aliases as well as canonical names, as real resumes do
+    mentions = [rng.choice(ALL_SKILLS[skill]) for skill in picked]
+
+    lines = [
+        name,
+        f"{rng.choice(ROLES)} with {rng.randint(1, 15)} years of experience",
+        "",
+        "Skills: " + ", ".join(mentions),
+        "",
+        "Experience",
+    ]
+    for _ in range(rng.randint(2, 5)):
+        used = rng.sample(mentions, min(3, len(mentions)))
+        lines.append(f"{rng.choice(ROLES)} - worked with {', '.join(used)}.")
+        lines.extend(rng.sample(FILLER, 2))
+    lines.extend(["", "Education", "B.Sc. Computer Science"])
+    return name, "\n".join(lines)
+
+
+def generate_job_description(rng: random.Random) -> Dict:
+    """
+    Generate one synthetic job description.
+
+    Args:
+        rng: Seeded random generator
+
+    Returns:
+        Dictionary with title, description and requiredSkills
+    """
+    skills = rng.sample(_skill_names(), rng.randint(4, 8))
+    title = rng.choice(ROLES)
+    description = (
+        f"We are hiring a {title}. You will build and operate services using "
+        f"{', '.join(skills)}. {' '.join(rng.sample(FILLER, 3))}"
+    )
+    return {'title': title, 'description': description, 'requiredSkills': skills}
+
+
+def _escape_pdf_text(text: str) -> str:
+    text = text.encode('latin-1', 'replace').decode('latin-1')
+    return text.replace('\\', '\\\\').replace('(', '\\(').replace(')', '\\)')
+
+
+def make_pdf_bytes(text: str, padding: int = 0) -> bytes:
+    """
+    Render text into a minimal single-page PDF with a real text layer.
+
+    Args:
+        text: Plain text, one output line per input line
+        padding: Bytes of unreferenced binary stream to add, standing in for embedded images
+
+    Returns:
+        PDF file content
+    """
+    stream_lines = ["BT", "/F1 10 Tf", "12 TL", "50 780 Td"]
+    for line in text.split('\n'):
+        stream_lines.append(f"({_escape_pdf_text(line)}) Tj T*")
+    stream_lines.append("ET")
+    stream = "\n".join(stream_lines).encode('latin-1')
+
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] "
+        b"/Resources << /Font << /F1 4 0 R >> >> /Contents 5 0 R >>",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+        b"<< /Length " + str(len(stream)).encode() + b" >>\nstream\n" + stream + b"\nendstream",
+    ]
+    if padding:
+        objects.append(b"<< /Length " + str(padding).encode() + b" >>\nstream\n" + (bytes(range(256)) * (padding // 256 + 1))[:padding] + b"\nendstream")
+
+    output = io.BytesIO()
+    output.write(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(output.tell())
+        output.write(f"{number} 0 obj\n".encode() + body + b"\nendobj\n")
+
+    xref_offset = output.tell()
+    output.write(f"xref\n0 {len(objects) + 1}\n".encode())
+    output.write(b"0000000000 65535 f \n")
+    for offset in offsets:
+        output.write(f"{offset:010d} 00000 n \n".encode())
+    output.write(
+        f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n"
+        f"startxref\n{xref_offset}\n%%EOF\n".encode()
+    )
+    return output.getvalue()
+
+
+def make_docx_bytes(text: str) -> bytes:
+    """
+    Render text into a DOCX document, one paragraph per line.
+
+    Args:
+        text: Plain text
+
+    Returns:
+        DOCX file content
+    """
+    document = Document()
+    for line in text.split('\n'):
+        document.add_paragraph(line)
+    output = io.BytesIO()
+    document.save(output)
+    return output.getvalue()
+
+
+def generate_corpus(count: int, seed: int = 42) -> List[Dict]:
+    """
+    Generate a deterministic corpus of resume files, alternating PDF and DOCX.
+
+    Args:
+        count: Number of resumes
+        seed: Random seed
+
+    Returns:
+        List of dictionaries with name, filename, text and content (file bytes)
+    """
+    rng = random.Random(seed)
+    corpus = []
+    for index in range(count):
+        name, text = generate_resume_text(rng)
+        if index % 2 == 0:
+            filename = f"{name.replace(' ', '_')}_{index}.pdf"
+            content = make_pdf_bytes(text)
+        else:
+            filename = f"{name.replace(' ', '_')}_{index}.docx"
+            content = make_docx_bytes(text)
+        corpus.append({
+            'name': name,
+            'filename': filename,
+            'text': text,
+            'content': content
+        })
+    return corpus
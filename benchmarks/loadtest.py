@@ -0,0 +1,202 @@
+"""
+Replay a traffic mix against the FastAPI app running on local stand-ins.
+
+MongoDB is replaced by an in-process mongomock database and the Node.js jobs
+API by a stub HTTP server, so the Python service can be load-tested alone.
+
+Usage:
+    python -m benchmarks.loadtest --requests 1000 --concurrency 16 \\
+        --mix match-candidates=1,apply-job=3,match-jobs=2,job-applications=4
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from typing import Callable, Dict, List, Tuple
+
+import httpx
+
+import backend_py.app as app_module
+from backend_py.nlp_processor import get_nlp_processor
+
+from .common import percentile, environment_info, write_results, results_path
+from .standins import generate_seed_data, install_mongo_standin, install_jobs_standin
+
+DEFAULT_MIX = "match-candidates=1,apply-job=3,match-jobs=2,job-applications=4"
+
+
+def parse_mix(mix: str) -> Dict[str, float]:
+    """Parse 'name=weight,name=weight' into a weight mapping."""
+    weights = {}
+    for part in mix.split(','):
+        name, _, weight = part.partition('=')
+        weights[name.strip()] = float(weight or 1)
+    return weights
+
+
+def build_request_factories(candidates: List[Dict], jobs: List[Dict]) -> Dict[str, Callable]:
+    """
+    Build one request factory per endpoint in the mix.
+
+    Each factory takes a Random and returns (endpoint_label, method, url, kwargs).
+    """
+    def match_candidates(rng):
+        job = rng.choice(jobs)
+        return 'POST', '/api/match-candidates', {'json': {
+            'jobDescription': job['description'],
+            'requiredSkills': job['requiredSkills'],
+            'jobTitle': job['title'],
+            'company': job['company']
+        }}
+
+    def apply_job(rng):
+        job = rng.choice(jobs)
+        candidate = rng.choice(candidates)
+        return 'POST', '/api/apply-job', {'json': {
+            'jobId': job['id'],
+            'jobTitle': job['title'],
+            'jobDescription': job['description'],
+            'requiredSkills': job['requiredSkills'],
+            'candidateId': candidate['email'],
+            'candidateName': candidate['name'],
+            'candidateEmail': candidate['email'],
+            'resumeText': candidate['resumeText']
+        }}
+
+    def match_jobs(rng):
+        candidate = rng.choice(candidates)
+        skills = get_nlp_processor().extract_skills(candidate['resumeText'])['found_skills'] or ['python']
+        return 'POST', '/api/match-jobs', {'json': {
+            'candidateSkills': skills,
+            'resume': candidate['resumeText']
+        }}
+
+    def job_applications(rng):
+        return 'GET', f"/api/job-applications/{rng.choice(jobs)['id']}", {}
+
+    return {
+        'match-candidates': match_candidates,
+        'apply-job': apply_job,
+        'match-jobs': match_jobs,
+        'job-applications': job_applications,
+    }
+
+
+async def run_load(
+    client: httpx.AsyncClient,
+    factories: Dict[str, Callable],
+    weights: Dict[str, float],
+    total_requests: int,
+    concurrency: int,
+    seed: int
+) -> Tuple[Dict[str, List[float]], Dict[str, int], float]:
+    """
+    Issue total_requests requests drawn from the weighted mix.
+
+    Returns:
+        Tuple of (latencies_by_endpoint, errors_by_endpoint, wall_seconds)
+    """
+    rng = random.Random(seed)
+    names = list(weights)
+    plan = rng.choices(names, weights=[weights[n] for n in names], k=total_requests)
+    requests = [(name, factories[name](rng)) for name in plan]
+
+    latencies = {name: [] for name in names}
+    errors = {name: 0 for name in names}
+    queue = asyncio.Queue()
+    for item in requests:
+        queue.put_nowait(item)
+
+    async def worker():
+        while True:
+            try:
+                name, (method, url, kwargs) = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            start = time.perf_counter()
+            try:
+                response = await client.request(method, url, **kwargs)
+                ok = response.status_code < 400 and response.json().get('status') != 'error'
+            except Exception:
+                ok = False
+            latencies[name].append(time.perf_counter() - start)
+            if not ok:
+                errors[name] += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, errors, time.perf_counter() - start
+
+
+def summarize(latencies: Dict[str, List[float]], errors: Dict[str, int], wall_seconds: float) -> Dict:
+    """Compute per-endpoint latency percentiles and throughput."""
+    summary = {}
+    for name, values in latencies.items():
+        if not values:
+            continue
+        summary[name] = {
+            'requests': len(values),
+            'errors': errors[name],
+            'p50_ms': round(percentile(values, 50) * 1000, 2),
+            'p95_ms': round(percentile(values, 95) * 1000, 2),
+            'p99_ms': round(percentile(values, 99) * 1000, 2),
+            'throughput_rps': round(len(values) / wall_seconds, 2)
+        }
+    return summary
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--requests', type=int, default=500)
+    parser.add_argument('--concurrency', type=int, default=8)
+    parser.add_argument('--mix', default=DEFAULT_MIX)
+    parser.add_argument('--candidates', type=int, default=200)
+    parser.add_argument('--jobs', type=int, default=50)
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--output', default=results_path('loadtest.json'))
+    args = parser.parse_args(argv)
+
+    candidates, jobs = generate_seed_data(args.candidates, args.jobs, seed=args.seed)
+    install_mongo_standin(app_module, candidates, jobs)
+    jobs_server = install_jobs_standin(app_module, jobs)
+    get_nlp_processor()  # Load models outside the measured window
+
+    weights = parse_mix(args.mix)
+    factories = build_request_factories(candidates, jobs)
+    unknown = set(weights) - set(factories)
+    if unknown:
+        parser.error(f"Unknown endpoints in mix: {', '.join(sorted(unknown))}")
+
+    async def run():
+        transport = httpx.ASGITransport(app=app_module.app)
+        async with httpx.AsyncClient(transport=transport, base_url='http://loadtest', timeout=None) as client:
+            return await run_load(client, factories, weights, args.requests, args.concurrency, args.seed)
+
+    try:
+        latencies, errors, wall_seconds = asyncio.run(run())
+    finally:
+        jobs_server.shutdown()
+
+    summary = summarize(latencies, errors, wall_seconds)
+    print(f"{'endpoint':<18} {'reqs':>6} {'errs':>5} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'req/s':>8}")
+    for name, row in summary.items():
+        print(
+            f"{name:<18} {row['requests']:>6} {row['errors']:>5} {row['p50_ms']:>9.2f} "
+            f"{row['p95_ms']:>9.2f} {row['p99_ms']:>9.2f} {row['throughput_rps']:>8.2f}"
+        )
+    print(f"Total: {args.requests} requests in {wall_seconds:.2f}s ({args.requests / wall_seconds:.2f} req/s)")
+
+    write_results(args.output, {
+        'benchmark': 'loadtest',
+        'environment': environment_info(),
+        'config': vars(args),
+        'wall_seconds': round(wall_seconds, 3),
+        'results': summary
+    })
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,147 @@
+"""Local stand-ins for MongoDB and the Node.js jobs API used by load benchmarks."""
+
+import json
+import random
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Tuple
+
+from backend_py.config import MONGODB_DB
+from backend_py.jobs_catalog import get_jobs_catalog
+
+from .corpus import generate_resume_text, generate_job_description
+
+
+class _SharedClient:
+    """Wrap a mongomock client so the app's per-request close() keeps data alive."""
+
+    def __init__(self, client):
+        self._client = client
+
+    def __getitem__(self, name):
+        return self._client[name]
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+    def close(self):
+        pass
+
+
+def generate_seed_data(candidate_count: int, job_count: int, seed: int = 7) -> Tuple[List[Dict], List[Dict]]:
+    """
+    Generate candidate and job documents shaped like the production collections.
+
+    Args:
+        candidate_count: Number of candidates
+        job_count: Number of jobs
+        seed: Random seed
+
+    Returns:
+        Tuple of (candidates, jobs)
+    """
+    rng = random.Random(seed)
+    candidates = []
+    for index in range(candidate_count):
+        name, text = generate_resume_text(rng)
+        candidates.append({
+            'name': name,
+            'email': f"{name.lower().replace(' ', '.')}.{index}@example.com",
+            'phone': f"+1-555-{index:04d}",
+            'experienceYears': rng.randint(0, 15),
+            'skills': [],
+            'resumeText': text
+        })
+
+    jobs = []
+    for index in range(job_count):
+        job = generate_job_description(rng)
+        jobs.append({
+            'id': str(index + 1),
+            'title': job['title'],
+            'company': f"Company {index + 1}",
+            'location': 'Remote',
+            'description': job['description'],
+            'requiredSkills': job['requiredSkills'],
+            'optionalSkills': [],
+            'salary': 'N/A'
+        })
+    return candidates, jobs
+
+
+def install_mongo_standin(app_module, candidates: List[Dict], jobs: List[Dict]):
+    """
+    Point the app at an in-process mongomock database seeded with data.
+
+    Args:
+        app_module: The backend_py.app module
+        candidates: Candidate documents
+        jobs: Job documents
+
+    Returns:
+        The seeded database handle
+    """
+    try:
+        import mongomock
+    except ImportError:
+        raise SystemExit("The load-test harness requires mongomock: pip install mongomock")
+
+    client = _SharedClient(mongomock.MongoClient())
+    db = client[MONGODB_DB]
+    if candidates:
+        db['candidates'].insert_many([dict(c) for c in candidates])
+    if jobs:
+        db['jobs'].insert_many([dict(j) for j in jobs])
+
+    app_module.get_mongodb_client = lambda: client
+    return db
+
+
+def start_jobs_server(jobs: List[Dict]) -> Tuple[ThreadingHTTPServer, str]:
+    """
+    Serve GET /api/jobs from a background thread, like the Node.js backend.
+
+    Args:
+        jobs: Job documents to serve
+
+    Returns:
+        Tuple of (server, jobs_url); call server.shutdown() when done
+    """
+    body = json.dumps(jobs).encode()
+
+    class JobsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split('?')[0] != '/api/jobs':
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), JobsHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server, f"http://127.0.0.1:{server.server_port}/api/jobs"
+
+
+def install_jobs_standin(app_module, jobs: List[Dict]) -> ThreadingHTTPServer:
+    """
+    Start the stub jobs server and point the app's job catalog at it.
+
+    Args:
+        app_module: The backend_py.app module
+        jobs: Job documents to serve
+
+    Returns:
+        The running server
+    """
+    server, url = start_jobs_server(jobs)
+    catalog = get_jobs_catalog()
+    catalog.url = url
+    catalog.invalidate()
+    return server
@@ -0,0 +1,56 @@
+"""Explain-plan checks for the API's MongoDB queries (skipped when MongoDB is unreachable)."""
+
+import uuid
+from datetime import datetime, timedelta
+
+import pytest
+from pymongo import ASCENDING, IndexModel, MongoClient
+from pymongo.errors import PyMongoError
+
+from backend_py.config import MONGODB_URI
+from backend_py.db_indexes import QUERIES, ensure_indexes, explain_queries, _create_index
+
+
+@pytest.fixture(scope='module')
+def db():
+    client = MongoClient(MONGODB_URI, serverSelectionTimeoutMS=2000)
+    try:
+        client.admin.command('ping')
+    except PyMongoError as e:
+        client.close()
+        pytest.skip(f"MongoDB is not reachable at {MONGODB_URI}: {e}")
+
+    name = f"index_test_{uuid.uuid4().hex[:12]}"
+    database = client[name]
+    # Some documents in every collection, so the planner has real plans to choose from
+    database['candidates'].insert_many([
+        {'email': f"c{i}@example.com", 'updatedAt': datetime(2024, 1, 1) + timedelta(minutes=i)} for i in range(50)
+    ])
+    database['applications'].insert_many([
+        {'jobId': f"job-{i % 5}", 'candidateEmail': f"c{i}@example.com",
+         'matchPercentage': i, 'duplicateKey': uuid.uuid4().hex}
+        for i in range(50)
+    ])
+    database['jobs'].insert_many([{'id': f"job-{i}"} for i in range(5)])
+    ensure_indexes(database)
+    yield database
+    client.drop_database(name)
+    client.close()
+
+
+@pytest.mark.parametrize('query', [query['name'] for query in QUERIES])
+def test_query_uses_index(db, query):
+    row = next(row for row in explain_queries(db) if row['name'] == query)
+    assert 'IXSCAN' in row['stages'], row
+    assert 'COLLSCAN' not in row['stages'], row
+
+
+def test_rebuild_keeps_old_index_when_keys_are_duplicated(db):
+    collection = db[f"rebuild_{uuid.uuid4().hex[:8]}"]
+    collection.create_index([('email', ASCENDING)], name='email_1')
+    collection.insert_many([{'email': 'same@example.com'}, {'email': 'same@example.com'}])
+
+    unique = IndexModel([('email', ASCENDING)], name='email_1', unique=True, sparse=True)
+    assert _create_index(collection, unique) is False
+    info = collection.index_information()['email_1']
+    assert not info.get('unique')